@@ -0,0 +1,76 @@
+import argparse
+import json
+import sys
+
+def load_results(path: str) -> dict:
+    """
+    Loads a results file written by benchmarks.run.
+
+    Parameters:
+    ----------
+    path : str
+        The path of the results file.
+
+    Returns:
+    -------
+    dict
+        The results.
+    """
+    with open(path) as file:
+        return json.load(file)
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.1) -> list[dict]:
+    """
+    Compares the minimum time of every benchmark in both results.
+
+    Parameters:
+    ----------
+    baseline : dict
+        The results to compare against.
+    current : dict
+        The new results.
+    threshold : float, optional
+        The relative slowdown above which a benchmark counts as a regression (default is 0.1, i.e. 10%).
+
+    Returns:
+    -------
+    list[dict]
+        One entry per benchmark found in either results, with its name, both times (None if missing), the
+        ratio current / baseline and whether it regressed.
+    """
+    baseline_results = baseline['results']
+    current_results = current['results']
+    comparisons = []
+    for name in list(baseline_results) + [name for name in current_results if name not in baseline_results]:
+        baseline_time = baseline_results[name]['min'] if name in baseline_results else None
+        current_time = current_results[name]['min'] if name in current_results else None
+        ratio = current_time / baseline_time if baseline_time and current_time is not None else None
+        comparisons.append({
+            'name': name,
+            'baseline': baseline_time,
+            'current': current_time,
+            'ratio': ratio,
+            'regressed': ratio is not None and ratio > 1 + threshold,
+        })
+    return comparisons
+
+def __format_time(seconds: float | None) -> str:
+    return '-' if seconds is None else f'{seconds * 1000:.3f} ms'
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Compares two benchmark results files.')
+    parser.add_argument('baseline', help='the results to compare against')
+    parser.add_argument('current', help='the new results')
+    parser.add_argument('--threshold', type=float, default=0.1, help='the relative slowdown counted as a regression')
+    args = parser.parse_args(argv)
+
+    comparisons = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(f'{"benchmark":<40} {"baseline":>14} {"current":>14} {"ratio":>8}')
+    for comparison in comparisons:
+        ratio = '-' if comparison['ratio'] is None else f'{comparison["ratio"]:.2f}x'
+        flag = '  REGRESSION' if comparison['regressed'] else ''
+        print(f'{comparison["name"]:<40} {__format_time(comparison["baseline"]):>14} {__format_time(comparison["current"]):>14} {ratio:>8}{flag}')
+    return 1 if any(comparison['regressed'] for comparison in comparisons) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
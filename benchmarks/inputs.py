@@ -0,0 +1,56 @@
+import os
+
+# Fixed reference inputs, so results of different commits are comparable. Never change these in place, add new
+# inputs instead.
+
+DEFAULT_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+MIDDLEGAME_FEN = 'r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N1BN2/PP2BPPP/R2QK2R w KQ - 4 9'
+
+# Kasparov - Topalov, Wijk aan Zee 1999 (87 plies)
+SHORT_PGN = """[Event "Hoogovens"]
+[Site "Wijk aan Zee NED"]
+[Date "1999.01.20"]
+[White "Kasparov, Garry"]
+[Black "Topalov, Veselin"]
+[Result "1-0"]
+
+1. e4 d6 2. d4 Nf6 3. Nc3 g6 4. Be3 Bg7 5. Qd2 c6 6. f3 b5 7. Nge2 Nbd7 8. Bh6
+Bxh6 9. Qxh6 Bb7 10. a3 e5 11. O-O-O Qe7 12. Kb1 a6 13. Nc1 O-O-O 14. Nb3
+exd4 15. Rxd4 c5 16. Rd1 Nb6 17. g3 Kb8 18. Na5 Ba8 19. Bh3 d5 20. Qf4+
+Ka7 21. Rhe1 d4 22. Nd5 Nbxd5 23. exd5 Qd6 24. Rxd4 cxd4 25. Re7+ Kb6 26.
+Qxd4+ Kxa5 27. b4+ Ka4 28. Qc3 Qxd5 29. Ra7 Bb7 30. Rxb7 Qc4 31. Qxf6 Kxa3
+32. Qxa6+ Kxb4 33. c3+ Kxc3 34. Qa1+ Kd2 35. Qb2+ Kd1 36. Bf1 Rd2 37.
+Rd7 Rxd7 38. Bxc4 bxc4 39. Qxh8 Rd3 40. Qa8 c3 41. Qa4+ Ke1 42. f4 f5 43. Kc1
+Rd2 44. Qa7 1-0
+"""
+
+# An Italian opening followed by a manoeuvring cycle that returns to the same position every 8 plies. The cycle
+# needs disambiguation (Nbd2, N1d2) and mixes knight, bishop and king moves.
+__LONG_GAME_OPENING = ['e4', 'e5', 'Nf3', 'Nc6', 'Bc4', 'Bc5', 'O-O', 'Nf6', 'd3', 'd6', 'Re1', 'O-O']
+__LONG_GAME_CYCLE = ['Nbd2', 'Bb6', 'Nf1', 'Bc5', 'N1d2', 'Kh8', 'Nb1', 'Kg8']
+
+def __long_game_movetext(plies: int) -> str:
+    """
+    Returns the movetext of a game of the given number of plies, built from the opening and the cycle.
+    """
+    moves = __LONG_GAME_OPENING.copy()
+    while len(moves) < plies:
+        moves.extend(__LONG_GAME_CYCLE)
+    moves = moves[:plies]
+    tokens = []
+    for ply, move in enumerate(moves):
+        if ply % 2 == 0:
+            tokens.append(f'{ply // 2 + 1}.')
+        tokens.append(move)
+    return ' '.join(tokens) + ' *'
+
+LONG_GAME_PLIES = 300
+LONG_PGN = '[Event "Benchmark"]\n[Result "*"]\n\n' + __long_game_movetext(LONG_GAME_PLIES) + '\n'
+
+EVALUATIONS = [((ply * 37) % 21 - 10) / 2 for ply in range(64)]
+
+def results_path(name: str) -> str:
+    """
+    Returns the default path of a results file, next to this module.
+    """
+    return os.path.join(os.path.dirname(__file__), 'results', f'{name}.json')
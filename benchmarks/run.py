@@ -0,0 +1,259 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess import Board, EvaluationBar, GameCache, PGNIndex, play_game, convert_from_PGN
+from benchmarks.inputs import DEFAULT_FEN, MIDDLEGAME_FEN, SHORT_PGN, LONG_PGN, EVALUATIONS, results_path
+from benchmarks.stub_scene import StubScene
+
+# Version of the results format, bumped when the format changes
+RESULTS_VERSION = 1
+
+# Benchmarks registered with @benchmark, in the order they run
+BENCHMARKS = {}
+
+def benchmark(name: str, number: int = 1) -> Callable:
+    """
+    Registers a benchmark. The decorated function does any setup and returns the function to time, so setup
+    is not part of the measured time.
+
+    Parameters:
+    ----------
+    name : str
+        The name of the benchmark in the results.
+    number : int, optional
+        The number of calls timed together in each repeat (default is 1).
+    """
+    def register(setup: Callable) -> Callable:
+        BENCHMARKS[name] = (setup, number)
+        return setup
+    return register
+
+@benchmark('board_construction')
+def __board_construction():
+    return Board
+
+@benchmark('set_board_from_FEN', number=5)
+def __set_board_from_FEN():
+    board = Board()
+    return lambda: board.set_board_from_FEN(MIDDLEGAME_FEN)
+
+@benchmark('clear_board')
+def __clear_board():
+    board = Board()
+    board.set_board_from_FEN(DEFAULT_FEN)
+    return board.clear_board
+
+@benchmark('move_piece_and_highlight')
+def __move_piece_and_highlight():
+    board = Board()
+    board.set_board_from_FEN(DEFAULT_FEN)
+    def move_knights():
+        # 32 moves that end where they started
+        for _ in range(8):
+            board.move_piece('g1', 'f3')
+            board.move_piece('b8', 'c6')
+            board.move_piece('f3', 'g1')
+            board.move_piece('c6', 'b8')
+    return move_knights
+
+@benchmark('draw_arrows_16', number=5)
+def __draw_arrows_16():
+    board = Board()
+    # Every knight move from the four central squares
+    pairs = [(start, f'{chr(ord(start[0]) + file_step)}{int(start[1]) + rank_step}') for start in ('d4', 'e4', 'd5', 'e5')
+             for file_step, rank_step in ((1, 2), (2, 1), (-1, 2), (-2, -1))]
+    def draw():
+        board.draw_arrows(pairs)
+        board.remove_arrows()
+    return draw
+
+@benchmark('convert_from_PGN_short', number=5)
+def __convert_from_PGN_short():
+    return lambda: convert_from_PGN(SHORT_PGN, cache=None)
+
+@benchmark('convert_from_PGN_300_plies')
+def __convert_from_PGN_300_plies():
+    return lambda: convert_from_PGN(LONG_PGN, cache=None)
+
+@benchmark('convert_from_PGN_300_plies_strict')
+def __convert_from_PGN_300_plies_strict():
+    return lambda: convert_from_PGN(LONG_PGN, cache=None, strict=True)
+
+@benchmark('convert_from_PGN_300_plies_cached')
+def __convert_from_PGN_300_plies_cached():
+    convert_from_PGN(LONG_PGN)
+    return lambda: convert_from_PGN(LONG_PGN)
+
+@benchmark('game_cache_300_plies_warm')
+def __game_cache_300_plies_warm():
+    cache = GameCache(os.path.join(tempfile.gettempdir(), 'manim_chess_benchmark_cache'))
+    cache.convert(LONG_PGN)
+    return lambda: cache.convert(LONG_PGN)
+
+@benchmark('evaluation_bar_set_evaluation')
+def __evaluation_bar_set_evaluation():
+    eval_bar = EvaluationBar()
+    def set_evaluations():
+        for evaluation in EVALUATIONS:
+            eval_bar.set_evaluation(evaluation)
+    return set_evaluations
+
+@benchmark('play_game_short')
+def __play_game_short():
+    moves = convert_from_PGN(SHORT_PGN)
+    def play():
+        board = Board()
+        board.set_board_from_FEN(DEFAULT_FEN)
+        scene = StubScene()
+        play_game(scene, board, moves)
+        return scene
+    return play
+
+@benchmark('play_game_short_with_evaluations')
+def __play_game_short_with_evaluations():
+    moves = convert_from_PGN(SHORT_PGN)
+    evals = [EVALUATIONS[ply % len(EVALUATIONS)] for ply in range(len(moves))]
+    def play():
+        board = Board()
+        board.set_board_from_FEN(DEFAULT_FEN)
+        eval_bar = EvaluationBar()
+        scene = StubScene()
+        play_game(scene, board, moves, eval_bar, evals)
+        return scene
+    return play
+
+@benchmark('pgn_index_build_1000_games')
+def __pgn_index_build_1000_games():
+    path = os.path.join(tempfile.gettempdir(), 'manim_chess_benchmark_1000_games.pgn')
+    with open(path, 'w') as file:
+        file.write('\n'.join([SHORT_PGN] * 1000))
+    return lambda: PGNIndex.build(path)
+
+def __python_command(code: str) -> Callable:
+    """
+    Returns a function running the code in a new Python process from the repository root, to time imports.
+    """
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    return lambda: subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+
+@benchmark('import_python')
+def __import_python():
+    # The start up time of Python itself, to subtract from the import benchmarks
+    return __python_command('pass')
+
+@benchmark('import_core')
+def __import_core():
+    return __python_command("import manim_chess; manim_chess.convert_from_PGN('1. e4 e5 2. Nf3 Nc6', cache=None)")
+
+@benchmark('import_rendering')
+def __import_rendering():
+    return __python_command('import manim_chess; manim_chess.Board')
+
+def time_benchmark(setup: Callable, number: int, repeat: int) -> dict:
+    """
+    Times a benchmark, calling setup before every repeat.
+
+    Parameters:
+    ----------
+    setup : Callable
+        The registered setup function, returning the function to time.
+    number : int
+        The number of calls timed together in each repeat.
+    repeat : int
+        The number of repeats.
+
+    Returns:
+    -------
+    dict
+        The minimum, median and mean seconds per call, and the stub scene calls of the last call if it returned a StubScene.
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        function = setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            result = function()
+        timings.append((time.perf_counter() - start) / number)
+    timing = {
+        'repeat': repeat,
+        'number': number,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+    }
+    if isinstance(result, StubScene):
+        timing['scene_calls'] = {name: result.count(name) for name in ('play', 'wait', 'add', 'remove')}
+    return timing
+
+def __git_commit() -> str | None:
+    """
+    Returns the current git commit, or None outside of a git checkout.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(names: list[str] = None, repeat: int = 5) -> dict:
+    """
+    Runs the benchmarks and returns the results.
+
+    Parameters:
+    ----------
+    names : list[str], optional
+        The benchmarks to run (default is all of them).
+    repeat : int, optional
+        The number of repeats of each benchmark (default is 5).
+
+    Returns:
+    -------
+    dict
+        The results, in the format written by main().
+    """
+    names = names or list(BENCHMARKS)
+    results = {}
+    for name in names:
+        setup, number = BENCHMARKS[name]
+        results[name] = time_benchmark(setup, number, repeat)
+    return {
+        'version': RESULTS_VERSION,
+        'commit': __git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Runs the manim_chess benchmarks and writes the results as JSON.')
+    parser.add_argument('names', nargs='*', help='the benchmarks to run (default is all of them)')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of repeats of each benchmark')
+    parser.add_argument('--output', default=results_path('latest'), help='the path of the results file')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        return
+
+    results = run_benchmarks(args.names, args.repeat)
+    for name, timing in results['results'].items():
+        print(f'{name:<40} {timing["min"] * 1000:10.3f} ms')
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f'Results written to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+class StubScene:
+    """
+    A stand-in for a Manim Scene that records calls instead of rendering, so play_game() can be timed without
+    the cost of rendering frames.
+
+    Attributes:
+    ----------
+    calls : list
+        The (method name, args) of every call, in order.
+    """
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def play(self, *animations, **kwargs) -> None:
+        self.calls.append(('play', animations))
+
+    def wait(self, *args, **kwargs) -> None:
+        self.calls.append(('wait', args))
+
+    def add(self, *mobjects) -> None:
+        self.calls.append(('add', mobjects))
+
+    def remove(self, *mobjects) -> None:
+        self.calls.append(('remove', mobjects))
+
+    def count(self, name: str) -> int:
+        """
+        Returns the number of recorded calls of a method.
+        """
+        return sum(1 for call in self.calls if call[0] == name)
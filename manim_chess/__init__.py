@@ -1,12 +1,52 @@
-from .pieces import (
-    Pawn,
-    Knight,
-    Bishop,
-    Rook,
-    Queen,
-    King
-)
-from .board import Board
-from .evaluation_bar import EvaluationBar
-from .game_player import play_game
-from .game_player import convert_from_PGN
\ No newline at end of file
+import importlib
+
+# Only the position and notation modules are imported with the package, so converting games stays fast to import
+# (e.g. in the worker processes of convert_many). Everything else, including the rendering classes and the modules
+# that import asyncio, concurrent.futures or the compression libraries, is imported the first time it is used.
+from .position import Position, DEFAULT_FEN
+from .notation import convert_from_PGN, NotationError, IllegalMoveError
+
+# Names imported on first use, and the module they come from
+_LAZY_IMPORTS = {
+    'Game': '.game',
+    'GameCache': '.game_cache',
+    'read_games': '.pgn',
+    'convert_many': '.pgn',
+    'PGNIndex': '.pgn_index',
+    'UCIEngine': '.engine',
+    'analyse_game': '.engine',
+    'evaluate_game': '.engine',
+    'ChessPiece': '.pieces',
+    'Pawn': '.pieces',
+    'Knight': '.pieces',
+    'Bishop': '.pieces',
+    'Rook': '.pieces',
+    'Queen': '.pieces',
+    'King': '.pieces',
+    'Board': '.board',
+    'EvaluationBar': '.evaluation_bar',
+    'play_game': '.game_player',
+    'dry_run_game': '.game_player',
+    'ChunkedGameScene': '.chunked_render',
+    'render_game_in_chunks': '.chunked_render',
+}
+
+__all__ = [
+    'Position',
+    'DEFAULT_FEN',
+    'convert_from_PGN',
+    'NotationError',
+    'IllegalMoveError',
+    *_LAZY_IMPORTS,
+]
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,92 @@
+from .tables import (
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    RAYS,
+    BETWEEN,
+    LINE,
+    FILE_MASKS,
+    RANK_MASKS,
+    POSITIVE_DIRECTIONS,
+    ROOK_DIRECTIONS,
+    BISHOP_DIRECTIONS,
+    QUEEN_DIRECTIONS,
+)
+
+def lowest_square(bitboard: int) -> int:
+    """
+    Returns the index of the lowest set bit of a non empty bitboard.
+    """
+    return (bitboard & -bitboard).bit_length() - 1
+
+def squares_of(bitboard: int) -> list[int]:
+    """
+    Returns the indices of every set bit of a bitboard, lowest first.
+    """
+    squares = []
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        squares.append(lowest_bit.bit_length() - 1)
+        bitboard ^= lowest_bit
+    return squares
+
+def sliding_attacks(square: int, occupied: int, directions: list) -> int:
+    """
+    Returns the squares attacked by a sliding piece, stopping each ray at (and including) the first blocker.
+
+    Parameters:
+    ----------
+    square : int
+        The index of the square the piece is on.
+    occupied : int
+        The bitboard of every occupied square.
+    directions : list
+        The directions the piece slides in.
+
+    Returns:
+    -------
+    int
+        The attack bitboard.
+    """
+    attacks = 0
+    for direction in directions:
+        ray = RAYS[direction][square]
+        blockers = ray & occupied
+        if blockers:
+            if direction in POSITIVE_DIRECTIONS:
+                blocker = lowest_square(blockers)
+            else:
+                blocker = blockers.bit_length() - 1
+            ray ^= RAYS[direction][blocker]
+        attacks |= ray
+    return attacks
+
+def piece_attacks(piece_type: str, square: int, occupied: int) -> int:
+    """
+    Returns the squares attacked by a knight, bishop, rook, queen or king.
+
+    Parameters:
+    ----------
+    piece_type : str
+        The uppercase letter of the piece type.
+    square : int
+        The index of the square the piece is on.
+    occupied : int
+        The bitboard of every occupied square.
+
+    Returns:
+    -------
+    int
+        The attack bitboard.
+    """
+    match piece_type:
+        case 'N':
+            return KNIGHT_ATTACKS[square]
+        case 'K':
+            return KING_ATTACKS[square]
+        case 'B':
+            return sliding_attacks(square, occupied, BISHOP_DIRECTIONS)
+        case 'R':
+            return sliding_attacks(square, occupied, ROOK_DIRECTIONS)
+        case 'Q':
+            return sliding_attacks(square, occupied, QUEEN_DIRECTIONS)
+    raise ValueError(f"Unknown piece type: {piece_type}")
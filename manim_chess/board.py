@@ -1,7 +1,201 @@
 from manim import *
-import math
-from typing import Tuple
-from .pieces import Pawn, Knight, Bishop, Rook, Queen, King
+from typing import Sequence, Tuple
+from .pieces import ChessPiece, PIECE_CLASSES
+from .tables import SQUARE_NAMES, SQUARE_INDICES, SQUARE_FILES, SQUARE_RANKS, IS_LIGHT_SQUARE, FILES
+
+MARK_COLOR = ManimColor('#EC7D6A')
+ARROW_COLOR = ManimColor('#E09651')
+# Arrow sizes at the default board scale, the shaft is as wide as a stroke of width 15
+ARROW_SHAFT_WIDTH = 0.15
+ARROW_HEAD_LENGTH = 0.35
+ARROW_HEAD_WIDTH = 0.35
+# The gap between the arrow and the centers of its squares
+ARROW_BUFFER = 0.25
+
+# Rendered coordinate labels shared by every board in the process, keyed by (glyph, color, font_size)
+_LABEL_TEMPLATES = {}
+
+def get_label_template(glyph: str, color: ManimColor, font_size: float) -> Text:
+    """
+    Returns the shared Text of a coordinate label, rendering it only the first time it is requested.
+
+    The template must not be added to a scene or modified, boards add a copy of it instead.
+
+    Parameters:
+    ----------
+    glyph : str
+        The text of the label (e.g., 'a' or '1').
+    color : ManimColor
+        The color of the label.
+    font_size : float
+        The font size of the label.
+
+    Returns:
+    -------
+    Text
+        The rendered label centered at the origin.
+    """
+    key = (glyph, color.to_hex(), font_size)
+    template = _LABEL_TEMPLATES.get(key)
+    if template is None:
+        template = Text(glyph, color=color, font_size=font_size, font="Arial")
+        _LABEL_TEMPLATES[key] = template
+    return template
+
+def _minimum_cost_assignment(costs: list[list[float]]) -> list[Tuple[int, int]]:
+    """
+    Pairs up rows and columns of a cost matrix so that the total cost is as low as possible (the Hungarian
+    algorithm). When the matrix is not square, the rows or columns left over are not paired.
+
+    Parameters:
+    ----------
+    costs : list[list[float]]
+        costs[row][column] is the cost of pairing row with column.
+
+    Returns:
+    -------
+    list[Tuple[int, int]]
+        The (row, column) pairs, sorted by row.
+    """
+    if not costs or not costs[0]:
+        return []
+    transposed = len(costs) > len(costs[0])
+    if transposed:
+        costs = [list(column) for column in zip(*costs)]
+    rows, columns = len(costs), len(costs[0])
+
+    # Potentials of rows and columns, and the row paired with each column (1 based, 0 is unpaired)
+    row_potentials = [0.0] * (rows + 1)
+    column_potentials = [0.0] * (columns + 1)
+    paired_row = [0] * (columns + 1)
+    previous_column = [0] * (columns + 1)
+    for row in range(1, rows + 1):
+        paired_row[0] = row
+        column = 0
+        smallest_slack = [float('inf')] * (columns + 1)
+        visited = [False] * (columns + 1)
+        while paired_row[column]:
+            visited[column] = True
+            current_row = paired_row[column]
+            delta = float('inf')
+            next_column = 0
+            for other_column in range(1, columns + 1):
+                if visited[other_column]:
+                    continue
+                slack = costs[current_row - 1][other_column - 1] - row_potentials[current_row] - column_potentials[other_column]
+                if slack < smallest_slack[other_column]:
+                    smallest_slack[other_column] = slack
+                    previous_column[other_column] = column
+                if smallest_slack[other_column] < delta:
+                    delta = smallest_slack[other_column]
+                    next_column = other_column
+            for other_column in range(columns + 1):
+                if visited[other_column]:
+                    row_potentials[paired_row[other_column]] += delta
+                    column_potentials[other_column] -= delta
+                else:
+                    smallest_slack[other_column] -= delta
+            column = next_column
+        # Flip the augmenting path back to the start
+        while column:
+            paired_row[column] = paired_row[previous_column[column]]
+            column = previous_column[column]
+
+    pairs = [(paired_row[column] - 1, column - 1) for column in range(1, columns + 1) if paired_row[column]]
+    if transposed:
+        pairs = [(row, column) for column, row in pairs]
+    return sorted(pairs)
+
+def _arrow_outline_points(square_centers: np.ndarray, pairs: Sequence[Tuple[str, str]], scale: float) -> np.ndarray:
+    """
+    Returns the cubic Bezier points of the closed outlines of arrows between pairs of squares, one path per arrow.
+
+    Each arrow follows three points, its tail, a corner and the center of its head: the corner is on the shaft of
+    straight arrows and where the two legs meet for L arrows. The outline goes along one side of the shaft, around
+    the head and back along the other side, with a mitered corner.
+    """
+    indices = np.array([(SQUARE_INDICES[end], SQUARE_INDICES[tip]) for end, tip in pairs])
+    if np.any(indices[:, 0] == indices[:, 1]):
+        raise ValueError("An arrow needs two different squares")
+    ends = square_centers[indices[:, 0], :2]
+    tips = square_centers[indices[:, 1], :2]
+    direction = tips - ends
+    dx, dy = np.abs(direction[:, 0]), np.abs(direction[:, 1])
+    buffer = ARROW_BUFFER * scale
+    shaft_half_width = ARROW_SHAFT_WIDTH / 2 * scale
+    head_length = ARROW_HEAD_LENGTH * scale
+    head_half_width = ARROW_HEAD_WIDTH / 2 * scale
+
+    # Straight arrows: horizontal, vertical or diagonal (rounded as the squares are floats)
+    straight = (dx < 1e-6) | (dy < 1e-6) | (np.abs(dx - dy) < 1e-6)
+    vertical_first = ~straight & (dy > dx)
+    corners = np.where(vertical_first[:, None], np.stack([ends[:, 0], tips[:, 1]], axis=1), np.stack([tips[:, 0], ends[:, 1]], axis=1))
+
+    first_leg = np.where(straight[:, None], direction, corners - ends)
+    second_leg = np.where(straight[:, None], direction, tips - corners)
+    first_unit = first_leg / np.linalg.norm(first_leg, axis=1, keepdims=True)
+    second_unit = second_leg / np.linalg.norm(second_leg, axis=1, keepdims=True)
+
+    tails = ends + first_unit * buffer
+    heads = tips - second_unit * buffer
+    head_bases = heads - second_unit * head_length / 2
+    corners = np.where(straight[:, None], (tails + head_bases) / 2, corners)
+
+    first_normal = np.stack([-first_unit[:, 1], first_unit[:, 0]], axis=1)
+    second_normal = np.stack([-second_unit[:, 1], second_unit[:, 0]], axis=1)
+    miter = (first_normal + second_normal) / (1 + np.sum(first_normal * second_normal, axis=1, keepdims=True)) * shaft_half_width
+
+    outline = np.stack([
+        tails + first_normal * shaft_half_width,
+        corners + miter,
+        head_bases + second_normal * shaft_half_width,
+        head_bases + second_normal * head_half_width,
+        heads + second_unit * head_length / 2,
+        head_bases - second_normal * head_half_width,
+        head_bases - second_normal * shaft_half_width,
+        corners - miter,
+        tails - first_normal * shaft_half_width,
+        tails + first_normal * shaft_half_width,
+    ], axis=1)
+    outline = np.concatenate([outline, np.zeros(outline.shape[:2] + (1,))], axis=2)
+
+    # Every side is a straight cubic Bezier curve, its handles a third of the way along
+    starts, stops = outline[:, :-1], outline[:, 1:]
+    points = np.stack([starts, starts + (stops - starts) / 3, starts + 2 * (stops - starts) / 3, stops], axis=2)
+    return points.reshape(-1, 3)
+
+def _square_distance(first_coordinate: str, second_coordinate: str) -> float:
+    """
+    Returns the distance between the centers of two squares, in squares.
+    """
+    first_index = SQUARE_INDICES[first_coordinate]
+    second_index = SQUARE_INDICES[second_coordinate]
+    return ((SQUARE_FILES[first_index] - SQUARE_FILES[second_index]) ** 2 + (SQUARE_RANKS[first_index] - SQUARE_RANKS[second_index]) ** 2) ** 0.5
+
+class RemovePiece(FadeOut):
+    """
+    Fades a piece out and then removes it from its board. FadeOut on its own would remove the piece from the scene,
+    which splits the board up since the piece is part of it.
+    """
+
+    def __init__(self, board: 'Board', piece: Mobject, **kwargs) -> None:
+        """
+        Initializes the RemovePiece animation.
+
+        Parameters:
+        ----------
+        board : Board
+            The board the piece is on.
+        piece : Mobject
+            The piece to remove.
+        """
+        super().__init__(piece, **kwargs)
+        self.board = board
+
+    def clean_up_from_scene(self, scene) -> None:
+        # Restore the piece's opacity and take it off the board instead of the scene
+        self.interpolate(0)
+        self.board.release_piece(self.mobject)
 
 class Board(Mobject):
     """
@@ -13,10 +207,28 @@ class Board(Mobject):
         The number of squares along one side of the board (default is 8 for a standard chess board).
     cell_size : float
         The length of each square on the board.
+    square_centers : np.ndarray
+        The centers of the 64 squares as a (64, 3) array in square index order (index 0 is a8, 63 is h1), where
+        they were when the board was built. Use get_square_centers() for where the squares are now.
+    light_squares : VMobject
+        All 32 light squares drawn as a single mobject.
+    dark_squares : VMobject
+        All 32 dark squares drawn as a single mobject.
     squares : dict
-        A dictionary mapping coordinates (e.g., 'a1') to their corresponding Square objects.
+        A dictionary mapping coordinates to the Square objects drawn over the background, only created for squares
+        that were marked, highlighted or asked for with get_square().
+    square_colors : dict
+        A dictionary mapping coordinates to the current color of squares that are not their default color.
+    overlay_layer : VGroup
+        The group holding the squares drawn over the background.
+    labels : dict
+        A dictionary mapping coordinates to the coordinate labels drawn on that square.
+    label_layer : VGroup
+        The group holding every coordinate label, drawn above the squares.
     pieces : dict
         A dictionary mapping coordinates to their corresponding chess piece objects.
+    piece_pool : dict
+        A dictionary mapping (piece_type, is_white) to pieces taken off the board, reused by add_piece().
     highlighted_squares : list
         A list of coordinates of squares that are currently highlighted.
     arrows : list
@@ -38,12 +250,24 @@ class Board(Mobject):
         Adds a number label to a square.
     add_letter_label(square, letter):
         Adds a letter label to a square.
+    update_label_colors(coordinate):
+        Recolors the labels on a square to contrast with its current fill.
+    get_square_color(coordinate):
+        Returns the current color of a square.
+    set_square_color(coordinate, color):
+        Sets the color of a square.
     get_square(coordinate):
         Returns the Square object at the given coordinate.
+    get_square_center(coordinate), get_square_centers():
+        Return where the center of one square or of all 64 squares is now.
     add_piece(piece_type, is_white, coordinate):
         Adds a chess piece to the board at the specified coordinate.
+    transition_to(FEN, animate=False):
+        Changes the pieces on the board to match a FEN string, moving pieces that are already on the board.
     get_piece_info_from_FEN(FEN):
         Extracts piece placement information from a FEN string.
+    get_FEN_placement():
+        Returns the piece placement of the board as in a FEN string.
     get_coordinate_from_index(index):
         Converts a linear index to a board coordinate.
     set_board_from_FEN(FEN):
@@ -64,10 +288,16 @@ class Board(Mobject):
         Calculates buffer positions for drawing arrows.
     draw_arrow(end_coordinate, tip_coordinate):
         Draws an arrow between two squares.
+    draw_arrows(pairs):
+        Draws arrows between pairs of squares as one mobject.
     remove_piece(coordinate):
         Removes a piece from the board.
+    release_piece(piece):
+        Takes a piece off the board and keeps it for reuse.
     remove_arrows():
         Removes all arrows from the board.
+    highlight_move(starting_coordinate, ending_coordinate):
+        Highlights the starting and ending squares of a move.
     move_piece(starting_coordinate, ending_coordinate):
         Moves a piece from one square to another.
     promote_piece(coordinate, piece_type):
@@ -87,88 +317,201 @@ class Board(Mobject):
         self.color_highlight_dark = ManimColor(color_highlight_dark)
         self.size_of_board = 8
         self.cell_size = 0.8  # Size of each square in the board
-        self.squares = {}  # squares[coordinate] = square
+        self.squares = {}  # squares[coordinate] = square, created lazily
+        self.square_colors = {}  # square_colors[coordinate] = color, if not the default
+        self.requested_squares = set()
+        self.labels = {}  # labels[coordinate] = [label, ...]
+        self.overlay_layer = VGroup()
+        self.label_layer = VGroup()
         self.create_board()
         self.pieces = {}  # pieces[coordinate] = piece
+        self.piece_pool = {}  # piece_pool[(piece_type, is_white)] = [piece, ...]
         self.highlighted_squares = []
         self.arrows = []
 
     def create_board(self) -> None:
         """
-        Creates the chess board with squares and labels.
+        Creates the chess board with squares and labels. The light and dark squares are each drawn as one mobject,
+        marks and highlights are drawn as separate squares over them.
         """
         total_size = self.size_of_board * self.cell_size  # Total size of the board
         offset = total_size / 2  # Offset to center of board
-
-        letters = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
-
+        half_cell = self.cell_size / 2
+        corners = [np.array([x, y, 0]) for x, y in ((-half_cell, half_cell), (-half_cell, -half_cell), (half_cell, -half_cell), (half_cell, half_cell))]
+
+        # Index 0 is a8, so the row counted from the bottom is 7 - index // 8
+        indices = np.arange(64)
+        self.square_centers = np.stack([
+            (indices % 8) * self.cell_size - offset,
+            (7 - indices // 8) * self.cell_size - offset,
+            np.zeros(64),
+        ], axis=1)
+        self.__built_center = np.array([-half_cell, -half_cell, 0])
+
+        self.light_squares = VMobject(fill_color=self.color_light, fill_opacity=1, stroke_width=0)
+        self.dark_squares = VMobject(fill_color=self.color_dark, fill_opacity=1, stroke_width=0)
         for row in range(self.size_of_board):
             for col in range(self.size_of_board):
-                CHESS_GREEN = self.color_dark
-                CHESS_WHITE = self.color_light
-                color = CHESS_WHITE if (row + col) % 2 else CHESS_GREEN
-                # Create a square for each cell in the board
-                square = Square(side_length=self.cell_size)
-                square.set_fill(color, opacity=1)
-                square.set_stroke(color, opacity=0)
-                square.move_to(np.array([col * self.cell_size - offset, row * self.cell_size - offset, 0]))
+                coordinate = SQUARE_NAMES[(7 - row) * 8 + col]
+                center = self.square_centers[(7 - row) * 8 + col]
+
+                # Each square is a closed path of the light or dark background
+                background = self.light_squares if self.is_light_square(coordinate) else self.dark_squares
+                background.start_new_path(center + corners[0])
+                background.add_points_as_corners([center + corner for corner in corners[1:] + corners[:1]])
 
                 # Add number label if first col
                 if col == 0:
-                    self.add_number_label(square, row + 1)
+                    self.add_number_label(coordinate, row + 1)
 
                 # Add letter label if first row
                 if row == 0:
-                    self.add_letter_label(square, letters[col])
+                    self.add_letter_label(coordinate, FILES[col])
 
-                # Add square to dictionary so we can access it with key
-                self.squares[f'{letters[col]}{row + 1}'] = square
-                # Add square to self mobj
-                self.add(square)
+        # Marks and highlights go above the background and labels above them, so recoloring a square never touches the labels
+        self.add(self.light_squares, self.dark_squares, self.overlay_layer, self.label_layer)
 
-    def add_number_label(self, square: Square, number: str) -> None:
+    def __as_coordinate(self, square: str | Square) -> str:
         """
-        Adds a number label to a square.
+        Returns the coordinate of a square given as a coordinate or as a Square, found by where the Square is.
+        """
+        if isinstance(square, str):
+            return square
+        for coordinate, overlay_square in self.squares.items():
+            if overlay_square is square:
+                return coordinate
+        distances = np.linalg.norm(self.get_square_centers() - square.get_center(), axis=1)
+        return SQUARE_NAMES[int(np.argmin(distances))]
+
+    def add_number_label(self, square: str | Square, number: str) -> None:
+        """
+        Adds a number label to the top left corner of a square. The label is drawn in the label layer and recolored
+        with the square.
 
         Parameters:
         ----------
-        square : Square
-            The square to which the number label is added.
+        square : str or Square
+            The coordinate of the square to which the number label is added (e.g., 'a1'), or the Square itself.
         number : str
             The number to be displayed on the square.
         """
+        coordinate = self.__as_coordinate(square)
         offset = np.array([self.cell_size / 8, -self.cell_size / 6, 0])
 
-        number_color = self.color_light if square.fill_color == self.color_dark else self.color_dark
-        number = Text(f'{number}', color=number_color, font_size=14 * self.cell_size, font="Arial")
-        square_top_left = square.get_center() + np.array([-self.cell_size / 2, self.cell_size / 2, 0])
+        number_color = self.color_light if self.get_square_color(coordinate) == self.color_dark else self.color_dark
+        number_text = f'{number}'
+        number = get_label_template(number_text, number_color, 14 * self.cell_size).copy()
+        square_top_left = self.square_centers[SQUARE_INDICES[coordinate]] + np.array([-self.cell_size / 2, self.cell_size / 2, 0])
         number.move_to(square_top_left + offset)
-        square.add(number)
+        self.labels.setdefault(coordinate, []).append(number)
+        self.label_layer.add(number)
 
-    def add_letter_label(self, square: Square, letter: str) -> None:
+    def add_letter_label(self, square: str | Square, letter: str) -> None:
         """
-        Adds a letter label to a square.
+        Adds a letter label to the bottom right corner of a square. The label is drawn in the label layer and
+        recolored with the square.
 
         Parameters:
         ----------
-        square : Square
-            The square to which the letter label is added.
+        square : str or Square
+            The coordinate of the square to which the letter label is added (e.g., 'a1'), or the Square itself.
         letter : str
             The letter to be displayed on the square.
         """
-
+        coordinate = self.__as_coordinate(square)
         offset = np.array([-self.cell_size / 8, self.cell_size / 6, 0])
 
-        letter_color = self.color_light if square.fill_color == self.color_dark else self.color_dark
-        letter = Text(f'{letter}', color=letter_color, font_size=14 * self.cell_size, font="Arial")
-        square_bot_right = square.get_center() + np.array([self.cell_size / 2, -self.cell_size / 2, 0])
+        letter_color = self.color_light if self.get_square_color(coordinate) == self.color_dark else self.color_dark
+        letter_text = f'{letter}'
+        letter = get_label_template(letter_text, letter_color, 14 * self.cell_size).copy()
+        square_bot_right = self.square_centers[SQUARE_INDICES[coordinate]] + np.array([self.cell_size / 2, -self.cell_size / 2, 0])
         letter.move_to(square_bot_right + offset)
-        square.add(letter)
+        self.labels.setdefault(coordinate, []).append(letter)
+        self.label_layer.add(letter)
+
+    def update_label_colors(self, coordinate: str) -> None:
+        """
+        Recolors the labels on a square in place so they contrast with the square's current fill.
+
+        Parameters:
+        ----------
+        coordinate : str
+            The coordinate of the square whose labels are recolored.
+        """
+        if coordinate not in self.labels:
+            return
+        label_color = self.color_light if self.get_square_color(coordinate) == self.color_dark else self.color_dark
+        for label in self.labels[coordinate]:
+            label.set_fill(label_color)
+
+    def get_square_color(self, coordinate: str) -> ManimColor:
+        """
+        Returns the current color of a square.
+
+        Parameters:
+        ----------
+        coordinate : str
+            The coordinate of the square (e.g., 'a1').
+
+        Returns:
+        -------
+        ManimColor
+            The color of the mark or highlight on the square, or its default color.
+        """
+        if coordinate in self.square_colors:
+            return self.square_colors[coordinate]
+        return self.color_light if self.is_light_square(coordinate) else self.color_dark
+
+    def set_square_color(self, coordinate: str, color: ManimColor) -> None:
+        """
+        Sets the color of a square and recolors its labels. A square set back to its default color stops being drawn
+        over the background, unless it was asked for with get_square().
+
+        Parameters:
+        ----------
+        coordinate : str
+            The coordinate of the square (e.g., 'a1').
+        color : ManimColor
+            The new color of the square.
+        """
+        is_default_color = color == (self.color_light if self.is_light_square(coordinate) else self.color_dark)
+        if is_default_color:
+            self.square_colors.pop(coordinate, None)
+        else:
+            self.square_colors[coordinate] = color
+
+        if is_default_color and coordinate not in self.requested_squares:
+            if coordinate in self.squares:
+                # Recolored too, in case a running animation still draws it
+                self.overlay_layer.remove(self.squares[coordinate].set_fill(color))
+        else:
+            self.__get_overlay_square(coordinate).set_fill(color)
+        self.update_label_colors(coordinate)
+
+    def __get_overlay_square(self, coordinate: str) -> Square:
+        """
+        Returns the square drawn over the background at a coordinate, creating it if needed, and makes sure it is drawn.
+        """
+        square = self.squares.get(coordinate)
+        if square is None:
+            color = self.get_square_color(coordinate)
+            # Sized to the board, which may have been scaled since it was built
+            square = Square(side_length=self.cell_size * self.get_scale())
+            square.set_fill(color, opacity=1)
+            square.set_stroke(color, opacity=0)
+            square.move_to(self.get_square_center(coordinate))
+            self.squares[coordinate] = square
+        if square not in self.overlay_layer.submobjects:
+            self.overlay_layer.add(square)
+        return square
 
     def get_square(self, coordinate: str) -> Square:
         """
         Returns the Square object at the given coordinate.
 
+        The squares are drawn as part of the light and dark backgrounds, so the first call puts a Square over the
+        background that stays there and can be changed or animated like any other mobject.
+
         Parameters:
         ----------
         coordinate : str
@@ -179,7 +522,43 @@ class Board(Mobject):
         Square
             The Square object at the specified coordinate.
         """
-        return self.squares[coordinate]
+        self.requested_squares.add(coordinate)
+        return self.__get_overlay_square(coordinate)
+
+    def get_scale(self) -> float:
+        """
+        Returns how much the board has been scaled since it was built, e.g., 0.8 after board.scale(0.8).
+        """
+        return self.light_squares.width / (self.size_of_board * self.cell_size)
+
+    def get_square_centers(self) -> np.ndarray:
+        """
+        Returns where the centers of all 64 squares are now, following any shift or scale of the board.
+
+        Returns:
+        -------
+        np.ndarray
+            A (64, 3) array in square index order, index 0 is a8 and 63 is h1 (see SQUARE_INDICES).
+        """
+        # a8 and h1 are light, so the light squares span the whole board
+        scale = self.get_scale()
+        return self.light_squares.get_center() + (self.square_centers - self.__built_center) * np.array([scale, scale, 1])
+
+    def get_square_center(self, coordinate: str) -> np.ndarray:
+        """
+        Returns where the center of a square is now, following any shift or scale of the board.
+
+        Parameters:
+        ----------
+        coordinate : str
+            The coordinate of the square (e.g., 'a1').
+
+        Returns:
+        -------
+        np.ndarray
+            The center of the square.
+        """
+        return self.light_squares.get_center() + (self.square_centers[SQUARE_INDICES[coordinate]] - self.__built_center) * self.get_scale()
 
     def add_piece(self, piece_type: str, is_white: bool, coordinate: str) -> None:
         """
@@ -194,18 +573,15 @@ class Board(Mobject):
         coordinate : str
             The coordinate where the piece is to be placed.
         """
-        piece_classes = {
-            'P': Pawn,
-            'N': Knight,
-            'B': Bishop,
-            'R': Rook,
-            'Q': Queen,
-            'K': King,
-        }
-
-        piece_class = piece_classes.get(piece_type)
+        piece_class = PIECE_CLASSES.get(piece_type)
         if piece_class:
-            piece = piece_class(is_white=is_white).move_to(self.squares[coordinate].get_center())
+            idle_pieces = self.piece_pool.get((piece_type, is_white))
+            if idle_pieces:
+                piece = idle_pieces.pop()
+                piece.restore_style()
+            else:
+                piece = piece_class(is_white=is_white)
+            piece.move_to(self.get_square_center(coordinate))
             self.pieces[coordinate] = piece
             self.add(piece)
         else:
@@ -227,6 +603,33 @@ class Board(Mobject):
         """
         return FEN.split()[0]
 
+    def get_FEN_placement(self) -> str:
+        """
+        Returns the piece placement of the board, in the form of the first field of a FEN string.
+
+        Returns:
+        -------
+        str
+            The piece placement (e.g., 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR').
+        """
+        rows = []
+        for row_start in range(0, 64, 8):
+            row = ''
+            empty_squares = 0
+            for coordinate in SQUARE_NAMES[row_start:row_start + 8]:
+                piece = self.pieces.get(coordinate)
+                if piece is None:
+                    empty_squares += 1
+                    continue
+                if empty_squares:
+                    row += str(empty_squares)
+                    empty_squares = 0
+                row += piece.piece_type if piece.is_white else piece.piece_type.lower()
+            if empty_squares:
+                row += str(empty_squares)
+            rows.append(row)
+        return '/'.join(rows)
+
     def get_coordinate_from_index(self, index: int) -> str:
         """
         Converts a linear index to a board coordinate.
@@ -241,18 +644,7 @@ class Board(Mobject):
         str
             The board coordinate corresponding to the index.
         """
-        number_to_letter = {
-            0: 'a',
-            1: 'b',
-            2: 'c',
-            3: 'd',
-            4: 'e',
-            5: 'f',
-            6: 'g',
-            7: 'h'
-        }
-        coordinate = f'{number_to_letter[index % 8]}{8 - math.floor(index / 8)}'
-        return coordinate
+        return SQUARE_NAMES[index]
 
     def set_board_from_FEN(self, FEN: str="rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1") -> None:
         """
@@ -263,24 +655,93 @@ class Board(Mobject):
         FEN : str
             The FEN string representing the board state.
         """
-        piece_info = self.get_piece_info_from_FEN(FEN)
+        self.transition_to(FEN)
+
+    def transition_to(self, FEN: str, animate: bool = False) -> Animation | None:
+        """
+        Changes the pieces on the board to match a FEN string. Only the squares that differ are touched: pieces of
+        the same type and color are moved to the new squares, pairing them up so the total distance moved is as
+        small as possible, and only the pieces left over are added or removed.
+
+        Parameters:
+        ----------
+        FEN : str
+            The FEN string representing the new board state.
+        animate : bool, optional
+            If True the pieces are not moved, added or removed right away, an animation doing it is returned
+            instead (default is False). board.pieces is updated right away either way.
+
+        Returns:
+        -------
+        Animation or None
+            An AnimationGroup moving, fading in and fading out the pieces if animate is True, otherwise None.
+        """
+        target_pieces = {}
         current_index = 0
-        for char in piece_info:
+        for char in self.get_piece_info_from_FEN(FEN):
             if char in {'1', '2', '3', '4', '5', '6', '7', '8'}:
                 current_index += int(char)
-            elif char == '/':
-                pass
-            else:
-                coordinate = self.get_coordinate_from_index(current_index)
-                self.add_piece(char.upper(), char.isupper(), coordinate)
+            elif char != '/':
+                target_pieces[self.get_coordinate_from_index(current_index)] = (char.upper(), char.isupper())
                 current_index += 1
 
+        # Pieces already on their square stay, the others are grouped by type and color
+        pieces = {}
+        pieces_to_move = {}
+        squares_to_fill = {}
+        for coordinate, piece in self.pieces.items():
+            if target_pieces.get(coordinate) == (piece.piece_type, piece.is_white):
+                pieces[coordinate] = piece
+            else:
+                pieces_to_move.setdefault((piece.piece_type, piece.is_white), []).append(coordinate)
+        for coordinate, kind in target_pieces.items():
+            if coordinate not in pieces:
+                squares_to_fill.setdefault(kind, []).append(coordinate)
+
+        moves = []
+        removed_pieces = []
+        added_coordinates = []
+        for kind in set(pieces_to_move) | set(squares_to_fill):
+            starting_coordinates = pieces_to_move.get(kind, [])
+            ending_coordinates = squares_to_fill.get(kind, [])
+            costs = [[_square_distance(start, end) for end in ending_coordinates] for start in starting_coordinates]
+            pairs = _minimum_cost_assignment(costs)
+            for start, end in pairs:
+                moves.append((self.pieces[starting_coordinates[start]], ending_coordinates[end]))
+            paired_starts = {start for start, _ in pairs}
+            paired_ends = {end for _, end in pairs}
+            removed_pieces += [self.pieces[coordinate] for index, coordinate in enumerate(starting_coordinates) if index not in paired_starts]
+            added_coordinates += [(coordinate, kind) for index, coordinate in enumerate(ending_coordinates) if index not in paired_ends]
+
+        animations = []
+        square_centers = self.get_square_centers()
+        for piece, coordinate in moves:
+            pieces[coordinate] = piece
+            if animate:
+                animations.append(piece.animate.move_to(square_centers[SQUARE_INDICES[coordinate]]))
+            else:
+                piece.move_to(square_centers[SQUARE_INDICES[coordinate]])
+        for piece in removed_pieces:
+            if animate:
+                animations.append(RemovePiece(self, piece))
+            else:
+                self.release_piece(piece)
+        self.pieces = pieces
+        for coordinate, (piece_type, is_white) in added_coordinates:
+            self.add_piece(piece_type, is_white, coordinate)
+            if animate:
+                animations.append(FadeIn(self.pieces[coordinate]))
+
+        if animate:
+            return AnimationGroup(*animations)
+        return None
+
     def clear_board(self) -> None:
         """
         Removes all pieces from the board.
         """
         for coordinate in self.pieces:
-            self.remove(self.pieces[coordinate])
+            self.release_piece(self.pieces[coordinate])
         self.pieces = {}
         self.clear_higlights()
 
@@ -298,16 +759,7 @@ class Board(Mobject):
         bool
             True if the square is light-colored, False otherwise.
         """
-        if coordinate[0] in {'a', 'c', 'e', 'g'}:
-            if coordinate[1] in {'1', '3', '5', '7'}:
-                return False
-            else:
-                return True
-        else:
-            if coordinate[1] in {'1', '3', '5', '7'}:
-                return True
-            else:
-                return False
+        return IS_LIGHT_SQUARE[coordinate]
 
     def mark_square(self, coordinate: str) -> None:
         """
@@ -318,14 +770,7 @@ class Board(Mobject):
         coordinate : str
             The coordinate of the square to be marked.
         """
-        MARK_COLOR = ManimColor('#EC7D6A')
-        self.squares[coordinate].set_fill(MARK_COLOR)
-
-        # Add back text on square if needed
-        if coordinate[1] == '1':
-            self.add_letter_label(self.squares[coordinate], coordinate[0])
-        if coordinate[0] == 'a':
-            self.add_number_label(self.squares[coordinate], coordinate[1])
+        self.set_square_color(coordinate, MARK_COLOR)
 
     def unmark_square(self, coordinate: str) -> None:
         """
@@ -338,15 +783,9 @@ class Board(Mobject):
         """
 
         if self.is_light_square(coordinate):
-            self.squares[coordinate].set_fill(self.color_light)
+            self.set_square_color(coordinate, self.color_light)
         else:
-            self.squares[coordinate].set_fill(self.color_dark)
-
-        # Add back text on square if needed
-        if coordinate[1] == '1':
-            self.add_letter_label(self.squares[coordinate], coordinate[0])
-        if coordinate[0] == 'a':
-            self.add_number_label(self.squares[coordinate], coordinate[1])
+            self.set_square_color(coordinate, self.color_dark)
 
     def highlight_square(self, coordinate: str) -> None:
         """
@@ -359,15 +798,9 @@ class Board(Mobject):
         """
 
         if self.is_light_square(coordinate):
-            self.squares[coordinate].set_fill(self.color_highlight_light)
+            self.set_square_color(coordinate, self.color_highlight_light)
         else:
-            self.squares[coordinate].set_fill(self.color_highlight_dark)
-
-        # Add back text on square if needed
-        if coordinate[1] == '1':
-            self.add_letter_label(self.squares[coordinate], coordinate[0])
-        if coordinate[0] == 'a':
-            self.add_number_label(self.squares[coordinate], coordinate[1])
+            self.set_square_color(coordinate, self.color_highlight_dark)
 
     def get_arrow_buffer(self, end_position: np.array, tip_position: np.array) -> Tuple[np.array]:
         """
@@ -397,9 +830,9 @@ class Board(Mobject):
 
         return end_position_buffer, tip_position_buffer
 
-    def draw_arrow(self, end_coordinate: str, tip_coordinate: str) -> None:
+    def draw_arrow(self, end_coordinate: str, tip_coordinate: str) -> VMobject:
         """
-        Draws an arrow between two squares.
+        Draws an arrow between two squares, see draw_arrows().
 
         Parameters:
         ----------
@@ -407,58 +840,37 @@ class Board(Mobject):
             The coordinate of the square where the arrow ends.
         tip_coordinate : str
             The coordinate of the square where the arrow starts.
-        """
-        ARROW_COLOR = ManimColor('#E09651')
-        end_square = self.squares[end_coordinate]
-        tip_square = self.squares[tip_coordinate]
-
-        end_position = end_square.get_center()
-        tip_position = tip_square.get_center()
-
-        end_position_buffer, tip_position_buffer = self.get_arrow_buffer(end_position, tip_position)
-
-        # Check if horizontal or vertical line or perfect diagonal like bishop
-        subtracted_position_vectors = end_position - tip_position
-        dir_x = subtracted_position_vectors[0]
-        dir_y = subtracted_position_vectors[1]
-        if dir_x == 0 or dir_y == 0 or round(abs(dir_x), 1) == round(abs(dir_y), 1):
-            arrow = Line(stroke_width=15, stroke_opacity=.8, fill_color=ARROW_COLOR, stroke_color=ARROW_COLOR)
-            arrow.reset_endpoints_based_on_tip = lambda *args: None
-            arrow.set_points_as_corners([end_position - end_position_buffer, tip_position - tip_position_buffer])
-            tip = arrow.create_tip()
-            tip.move_to(tip_position - tip_position_buffer)
-            finished_arrow = VGroup(arrow, tip)
-            self.add(finished_arrow)
-        else:
-            arrow0 = Line(stroke_width=15, stroke_opacity=.8, fill_color=ARROW_COLOR, stroke_color=ARROW_COLOR)
-            arrow1 = Line(stroke_width=15, stroke_opacity=.8, fill_color=ARROW_COLOR, stroke_color=ARROW_COLOR)
 
-            if dir_y > 0:
-                buffer_y = np.array([0, 0.25, 0])
-            else:
-                buffer_y = np.array([0, -0.25, 0])
+        Returns:
+        -------
+        VMobject
+            The arrow.
+        """
+        return self.draw_arrows([(end_coordinate, tip_coordinate)])
 
-            if dir_x > 0:
-                buffer_x = np.array([0.25, 0, 0])
-            else:
-                buffer_x = np.array([-0.25, 0, 0])
+    def draw_arrows(self, pairs: Sequence[Tuple[str, str]]) -> VMobject:
+        """
+        Draws arrows between pairs of squares as one filled mobject, so many arrows cost a single mobject to render.
 
-            tip_buffer = -0.07 if dir_x > 0 else 0.07
+        Straight, horizontal, vertical and diagonal arrows are drawn directly, the others (e.g., knight moves) are
+        drawn as an L, along the longer direction first. The outlines of all arrows are computed together with NumPy.
 
-            if abs(dir_y) > abs(dir_x):
-                arrow0.set_points_as_corners([end_position - buffer_y, np.array([end_position[0], tip_position[1], 0])])
-                arrow1.set_points_as_corners([np.array([end_position[0]-tip_buffer, tip_position[1], 0]), tip_position + buffer_x])
-                tip = arrow1.create_tip()
-                tip.move_to(tip_position + buffer_x)
-            else:
-                arrow0.set_points_as_corners([end_position - buffer_x, np.array([tip_position[0], end_position[1], 0])])
-                arrow1.set_points_as_corners([np.array([tip_position[0], end_position[1]-tip_buffer, 0]), tip_position + buffer_y])
-                tip = arrow1.create_tip()
-                tip.move_to(tip_position + buffer_y)
+        Parameters:
+        ----------
+        pairs : Sequence[Tuple[str, str]]
+            The coordinates of the square where each arrow ends and the square it points to (e.g., [('g1', 'f3')]).
 
-            finished_arrow = VGroup(arrow0, arrow1, tip)
-            self.add(finished_arrow)
-        self.arrows.append(finished_arrow)
+        Returns:
+        -------
+        VMobject
+            The arrows, also kept in board.arrows until remove_arrows().
+        """
+        arrows = VMobject(fill_color=ARROW_COLOR, fill_opacity=.8, stroke_width=0)
+        if pairs:
+            arrows.set_points(_arrow_outline_points(self.get_square_centers(), pairs, self.get_scale()))
+        self.add(arrows)
+        self.arrows.append(arrows)
+        return arrows
 
     def remove_piece(self, coordinate: str) -> None:
         """
@@ -469,10 +881,20 @@ class Board(Mobject):
         coordinate : str
             The coordinate of the piece to be removed.
         """
-        piece_to_remove = self.pieces[coordinate]
-        self.remove(piece_to_remove)
-        del piece_to_remove
-        del self.pieces[coordinate]
+        self.release_piece(self.pieces.pop(coordinate))
+
+    def release_piece(self, piece: ChessPiece) -> None:
+        """
+        Takes a piece off the board and keeps it in the piece pool, so add_piece() can reuse it instead of
+        creating a new one. The piece must no longer be in board.pieces.
+
+        Parameters:
+        ----------
+        piece : ChessPiece
+            The piece to release.
+        """
+        self.remove(piece)
+        self.piece_pool.setdefault((piece.piece_type, piece.is_white), []).append(piece)
 
     def remove_arrows(self) -> None:
         """
@@ -480,6 +902,7 @@ class Board(Mobject):
         """
         for arrow in self.arrows:
             self.remove(arrow)
+        self.arrows = []
 
     def clear_higlights(self):
         """
@@ -488,6 +911,25 @@ class Board(Mobject):
         for coordinate in self.highlighted_squares:
             self.unmark_square(coordinate)
 
+    def highlight_move(self, starting_coordinate: str, ending_coordinate: str) -> None:
+        """
+        Highlights the starting and ending squares of a move, removing the previous highlights.
+
+        Parameters:
+        ----------
+        starting_coordinate : str
+            The coordinate of the square the piece moved from.
+        ending_coordinate : str
+            The coordinate of the square the piece moved to.
+        """
+        self.clear_higlights()
+        self.highlighted_squares = []
+
+        self.highlight_square(starting_coordinate)
+        self.highlight_square(ending_coordinate)
+        self.highlighted_squares.append(starting_coordinate)
+        self.highlighted_squares.append(ending_coordinate)
+
     def move_piece(self, starting_coordinate: str, ending_coordinate: str) -> None:
         """
         Moves a piece from one square to another.
@@ -506,14 +948,8 @@ class Board(Mobject):
             self.pieces[ending_coordinate] = piece_to_move
             del self.pieces[starting_coordinate]
 
-            self.clear_higlights()
-            self.highlighted_squares = []
-
-            piece_to_move.move_to(self.squares[ending_coordinate].get_center())
-            self.highlight_square(starting_coordinate)
-            self.highlight_square(ending_coordinate)
-            self.highlighted_squares.append(starting_coordinate)
-            self.highlighted_squares.append(ending_coordinate)
+            piece_to_move.move_to(self.get_square_center(ending_coordinate))
+            self.highlight_move(starting_coordinate, ending_coordinate)
         except Exception as e:
             print(f'{e} has no piece associated')
 
@@ -0,0 +1,226 @@
+from manim import *
+from .board import Board
+from .evaluation_bar import EvaluationBar
+from .game import Game
+from .game_player import play_game
+from .position import DEFAULT_FEN
+
+import math
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Sequence, Tuple
+
+class RenderChunk(NamedTuple):
+    """
+    A range of plies of a game rendered as its own scene by render_game_in_chunks(), with everything needed to start
+    exactly where the previous chunk ends.
+
+    Attributes:
+    ----------
+    index : int
+        The position of the chunk in the video, from 0.
+    start_ply : int
+        The number of moves played before the chunk.
+    end_ply : int
+        The number of moves played at the end of the chunk.
+    FEN : str
+        The FEN string of the position at start_ply.
+    last_move : Tuple[str, str, str] or None
+        The move played just before the chunk, highlighted at its start, None for the first chunk.
+    evaluation : float or None
+        The evaluation shown by the evaluation bar at the start of the chunk, None if the game has no evaluations.
+    moves : list[Tuple[str, str, str]]
+        The moves of the chunk in coordinate notation.
+    evals : list[float] or None
+        The evaluation after every move of the chunk, None if the game has no evaluations.
+    """
+    index: int
+    start_ply: int
+    end_ply: int
+    FEN: str
+    last_move: Tuple[str, str, str] | None
+    evaluation: float | None
+    moves: list[Tuple[str, str, str]]
+    evals: list[float] | None
+
+def plan_chunks(moves: Sequence[Tuple[str, str, str]] | Game, chunks: int, FEN: str = DEFAULT_FEN, evals: Sequence[float] = None) -> list[RenderChunk]:
+    """
+    Splits a game into ranges of plies of about the same length and computes the starting state of each one.
+
+    Parameters:
+    ----------
+    moves : Sequence[Tuple[str, str, str]] or Game
+        The moves in coordinate notation, or a Game (whose evaluations are used if evals is None).
+    chunks : int
+        The number of chunks, fewer if the game has fewer moves.
+    FEN : str, optional
+        The FEN string of the position the game starts from, ignored for a Game (default is the standard start of game).
+    evals : Sequence[float], optional
+        The evaluation after every move (default is None).
+
+    Returns:
+    -------
+    list[RenderChunk]
+        The chunks in order, covering every ply once.
+    """
+    game = moves if isinstance(moves, Game) else Game(moves, FEN)
+    if evals is None and game.evals:
+        evals = [0 if math.isnan(evaluation) else evaluation for evaluation in game.evals]
+    if evals is not None:
+        # Missing evaluations are 0, as in play_game()
+        evals = list(evals)[:len(game)] + [0] * max(0, len(game) - len(evals))
+
+    chunks = max(1, min(chunks, len(game)))
+    boundaries = [len(game) * index // chunks for index in range(chunks + 1)]
+    planned_chunks = []
+    for index, (start_ply, end_ply) in enumerate(zip(boundaries, boundaries[1:])):
+        planned_chunks.append(RenderChunk(
+            index=index,
+            start_ply=start_ply,
+            end_ply=end_ply,
+            FEN=game.FEN_at(start_ply),
+            last_move=game[start_ply - 1] if start_ply else None,
+            evaluation=None if evals is None else (evals[start_ply - 1] if start_ply else 0.0),
+            moves=game[start_ply:end_ply],
+            evals=None if evals is None else evals[start_ply:end_ply],
+        ))
+    return planned_chunks
+
+class ChunkedGameScene(Scene):
+    """
+    A scene that plays one RenderChunk of a game, used by render_game_in_chunks().
+
+    Subclass it to lay out the video: override create_board() and create_eval_bar() to place and scale the board and
+    the evaluation bar. Nothing may be animated before the moves, or the chunk borders would show in the video. The
+    subclass must be defined at module level, so the rendering processes can import it.
+
+    Attributes:
+    ----------
+    chunk : RenderChunk
+        The chunk to play, set by render_game_in_chunks() before rendering.
+    plies_per_play : int or None
+        Passed on to play_game(), see there (default is None).
+    """
+    chunk: RenderChunk = None
+    plies_per_play: int = None
+
+    def create_board(self) -> Board:
+        """
+        Returns the board the game is played on, set to the starting position of the chunk afterwards.
+        """
+        return Board()
+
+    def create_eval_bar(self) -> EvaluationBar | None:
+        """
+        Returns the evaluation bar shown next to the board, or None for no evaluation bar (the default).
+        """
+        return None
+
+    def construct(self) -> None:
+        board = self.create_board()
+        board.set_board_from_FEN(self.chunk.FEN)
+        if self.chunk.last_move:
+            board.highlight_move(self.chunk.last_move[0], self.chunk.last_move[1])
+        self.add(board)
+
+        eval_bar = self.create_eval_bar()
+        if eval_bar is not None:
+            if self.chunk.evaluation is not None:
+                # Jump to the evaluation the previous chunk ended on without animating it
+                for update in eval_bar.set_evaluation(self.chunk.evaluation):
+                    update.begin()
+                    update.finish()
+            self.add(eval_bar)
+
+        play_game(self, board, self.chunk.moves, eval_bar, self.chunk.evals, plies_per_play=self.plies_per_play)
+
+def _render_chunk(scene_class: type, chunk: RenderChunk, media_dir: str, render_config: dict) -> str:
+    """
+    Renders one chunk in the current process and returns the path of its video.
+    """
+    # Every chunk renders the same scene, so each needs its own directory, or one chunk would prune the cached
+    # partial movie files of another one that is still combining them
+    media_dir = os.path.join(media_dir, f'chunk_{chunk.index:05}')
+    with tempconfig({**render_config, 'media_dir': media_dir, 'output_file': f'chunk_{chunk.index:05}', 'preview': False}):
+        scene = scene_class()
+        scene.chunk = chunk
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+def concatenate_videos(paths: Sequence[str], output_file: str, ffmpeg: str = 'ffmpeg') -> None:
+    """
+    Joins videos with the same encoding one after the other, copying the streams without encoding them again.
+
+    Parameters:
+    ----------
+    paths : Sequence[str]
+        The videos in order.
+    output_file : str
+        The path of the joined video.
+    ffmpeg : str, optional
+        The ffmpeg executable (default is 'ffmpeg').
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file_list:
+        for path in paths:
+            escaped_path = os.path.abspath(path).replace("'", "'\\''")
+            file_list.write(f"file '{escaped_path}'\n")
+    try:
+        subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0', '-i', file_list.name, '-c', 'copy', output_file], check=True)
+    finally:
+        os.remove(file_list.name)
+
+def render_game_in_chunks(scene_class: type, moves: Sequence[Tuple[str, str, str]] | Game, output_file: str, FEN: str = DEFAULT_FEN,
+                          evals: Sequence[float] = None, chunks: int = None, workers: int = None, render_config: dict = None,
+                          media_dir: str = None, ffmpeg: str = 'ffmpeg') -> str:
+    """
+    Renders a game as several scenes at the same time, one ply range per process, and joins them into one video.
+
+    Every chunk starts from the exact position, highlighted move and evaluation the previous chunk ends on, and
+    play_game() ends every move with the board standing still, so the joined video has no visible seams. On Windows
+    and macOS, call this under `if __name__ == '__main__':`, as the processes import the scene's module.
+
+    Parameters:
+    ----------
+    scene_class : type
+        A ChunkedGameScene subclass defined at module level.
+    moves : Sequence[Tuple[str, str, str]] or Game
+        The moves in coordinate notation, or a Game.
+    output_file : str
+        The path of the joined video.
+    FEN : str, optional
+        The FEN string of the position the game starts from (default is the standard start of game).
+    evals : Sequence[float], optional
+        The evaluation after every move (default is None).
+    chunks : int, optional
+        The number of scenes the game is split into (default is the number of workers).
+    workers : int, optional
+        The number of rendering processes (default is the number of CPUs).
+    render_config : dict, optional
+        Manim config values for every chunk, e.g., {'quality': 'low_quality'} (default is None).
+    media_dir : str, optional
+        The directory the chunks are rendered in, one subdirectory per chunk (default is a temporary directory,
+        deleted afterwards).
+    ffmpeg : str, optional
+        The ffmpeg executable used to join the chunks (default is 'ffmpeg').
+
+    Returns:
+    -------
+    str
+        The path of the joined video.
+    """
+    workers = workers or os.cpu_count() or 1
+    planned_chunks = plan_chunks(moves, chunks or workers, FEN, evals)
+    render_config = dict(render_config or {})
+
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        chunk_media_dir = media_dir or temporary_dir
+        if workers == 1:
+            paths = [_render_chunk(scene_class, chunk, chunk_media_dir, render_config) for chunk in planned_chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_render_chunk, scene_class, chunk, chunk_media_dir, render_config) for chunk in planned_chunks]
+                paths = [future.result() for future in futures]
+        concatenate_videos(paths, output_file, ffmpeg)
+    return output_file
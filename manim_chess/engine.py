@@ -0,0 +1,319 @@
+import asyncio
+import shlex
+from typing import AsyncIterator, Sequence, Tuple
+from .position import Position, DEFAULT_FEN
+
+# The evaluation used for a forced mate, in pawns from white's point of view
+MATE_EVALUATION = 100.0
+
+class EngineError(RuntimeError):
+    """
+    Raised when a UCI engine process exits or answers something unexpected.
+    """
+
+class UCIEngine:
+    """
+    A client for a local UCI chess engine (e.g., Stockfish) running as a subprocess, driven with asyncio.
+
+    Start it with `await UCIEngine.start(command)`, it can also be used as an async context manager which quits
+    the engine at the end.
+
+    Methods:
+    -------
+    start(command, options):
+        Starts an engine process and waits until it is ready.
+    evaluate(FEN, depth, movetime):
+        Returns the evaluation of a position, in pawns from white's point of view.
+    quit():
+        Stops the engine process.
+    """
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        """
+        Initializes the UCIEngine object around a running process. Use start() instead.
+
+        Parameters:
+        ----------
+        process : asyncio.subprocess.Process
+            The engine process, with pipes for stdin and stdout.
+        """
+        self.process = process
+
+    @classmethod
+    async def start(cls, command: str | Sequence[str], options: dict = None) -> 'UCIEngine':
+        """
+        Starts an engine process and waits until it is ready.
+
+        Parameters:
+        ----------
+        command : str or Sequence[str]
+            The command that runs the engine (e.g., 'stockfish' or ['python', 'engine.py']).
+        options : dict, optional
+            UCI options sent to the engine, e.g. {'Threads': 1, 'Hash': 64} (default is None).
+
+        Returns:
+        -------
+        UCIEngine
+            The ready engine.
+        """
+        if isinstance(command, str):
+            command = shlex.split(command)
+        process = await asyncio.create_subprocess_exec(*command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE)
+        engine = cls(process)
+        try:
+            await engine.__send('uci')
+            await engine.__wait_for('uciok')
+            for name, value in (options or {}).items():
+                await engine.__send(f'setoption name {name} value {value}')
+            await engine.__send('isready')
+            await engine.__wait_for('readyok')
+        except BaseException:
+            await engine.quit()
+            raise
+        return engine
+
+    async def __aenter__(self) -> 'UCIEngine':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.quit()
+
+    async def __send(self, line: str) -> None:
+        """
+        Sends a command to the engine.
+        """
+        if self.process.stdin.is_closing():
+            raise EngineError('The engine process is not running')
+        self.process.stdin.write(f'{line}\n'.encode())
+        try:
+            await self.process.stdin.drain()
+        except ConnectionError as error:
+            raise EngineError('The engine process is not running') from error
+
+    async def __read_line(self) -> str:
+        """
+        Returns the next line written by the engine.
+        """
+        line = await self.process.stdout.readline()
+        if not line:
+            raise EngineError(f'The engine process exited with code {await self.process.wait()}')
+        return line.decode(errors='replace').strip()
+
+    async def __wait_for(self, token: str) -> list[str]:
+        """
+        Reads lines until one starts with the token, returning every line read.
+        """
+        lines = []
+        while True:
+            line = await self.__read_line()
+            lines.append(line)
+            if line.split(' ', 1)[0] == token:
+                return lines
+
+    async def evaluate(self, FEN: str, depth: int = None, movetime: int = None) -> float:
+        """
+        Searches a position and returns its evaluation.
+
+        Parameters:
+        ----------
+        FEN : str
+            The FEN string of the position.
+        depth : int, optional
+            The depth to search to.
+        movetime : int, optional
+            The time to search for, in milliseconds. Without depth or movetime the search goes to depth 12.
+
+        Returns:
+        -------
+        float
+            The evaluation in pawns from white's point of view, MATE_EVALUATION (or its negative) for a forced mate.
+        """
+        limits = ''
+        if depth is not None:
+            limits += f' depth {depth}'
+        if movetime is not None:
+            limits += f' movetime {movetime}'
+        await self.__send(f'position fen {FEN}')
+        await self.__send(f'go{limits or " depth 12"}')
+
+        evaluation = None
+        for line in await self.__wait_for('bestmove'):
+            score = parse_score(line)
+            if score is not None:
+                evaluation = score
+        if evaluation is None:
+            raise EngineError(f'The engine gave no score for {FEN}')
+
+        # UCI scores are from the point of view of the side to move
+        fields = FEN.split()
+        return -evaluation if len(fields) > 1 and fields[1] == 'b' else evaluation
+
+    async def quit(self) -> None:
+        """
+        Stops the engine process, killing it if it does not exit by itself.
+        """
+        if self.process.returncode is not None:
+            return
+        try:
+            await self.__send('quit')
+            await asyncio.wait_for(self.process.wait(), timeout=1)
+        except (EngineError, asyncio.TimeoutError):
+            self.process.kill()
+            await self.process.wait()
+
+def parse_score(line: str) -> float | None:
+    """
+    Returns the score of a UCI info line.
+
+    Parameters:
+    ----------
+    line : str
+        A line written by the engine (e.g., 'info depth 20 score cp 35 nodes 1000 pv e2e4').
+
+    Returns:
+    -------
+    float or None
+        The score in pawns from the point of view of the side to move, MATE_EVALUATION (or its negative) for a
+        forced mate, or None if the line has no score.
+    """
+    tokens = line.split()
+    if not tokens or tokens[0] != 'info' or 'score' not in tokens:
+        return None
+    index = tokens.index('score')
+    if index + 2 >= len(tokens):
+        return None
+    kind, value = tokens[index + 1], tokens[index + 2]
+    if kind == 'cp':
+        return int(value) / 100
+    if kind == 'mate':
+        # mate 0 means the side to move is checkmated
+        return MATE_EVALUATION if int(value) > 0 else -MATE_EVALUATION
+    return None
+
+async def analyse_positions(FENs: Sequence[str], command: str | Sequence[str], workers: int = 1, depth: int = None,
+                            movetime: int = None, options: dict = None) -> AsyncIterator[Tuple[int, float]]:
+    """
+    Evaluates positions with a pool of engine processes searching at the same time, yielding the evaluations
+    in the order of the positions as soon as they are known.
+
+    Parameters:
+    ----------
+    FENs : Sequence[str]
+        The FEN strings of the positions.
+    command : str or Sequence[str]
+        The command that runs the engine.
+    workers : int, optional
+        The number of engine processes searching at the same time (default is 1).
+    depth : int, optional
+        The depth to search each position to.
+    movetime : int, optional
+        The time to search each position for, in milliseconds.
+    options : dict, optional
+        UCI options sent to every engine (default is None). Use {'Threads': 1} when running many workers.
+
+    Returns:
+    -------
+    AsyncIterator[Tuple[int, float]]
+        The index of each position and its evaluation in pawns from white's point of view.
+    """
+    if not FENs:
+        return
+    engines = await asyncio.gather(*[UCIEngine.start(command, options) for _ in range(max(1, min(workers, len(FENs))))])
+    queue = asyncio.Queue()
+    for index, FEN in enumerate(FENs):
+        queue.put_nowait((index, FEN))
+    loop = asyncio.get_running_loop()
+    evaluations = [loop.create_future() for _ in FENs]
+
+    async def work(engine: UCIEngine) -> None:
+        while not queue.empty():
+            index, FEN = queue.get_nowait()
+            try:
+                evaluations[index].set_result(await engine.evaluate(FEN, depth, movetime))
+            except Exception as error:
+                # The error is raised when this position's turn comes, the other engines carry on
+                evaluations[index].set_exception(error)
+                return
+
+    tasks = [asyncio.create_task(work(engine)) for engine in engines]
+    try:
+        for index, evaluation in enumerate(evaluations):
+            yield index, await evaluation
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*[engine.quit() for engine in engines], return_exceptions=True)
+
+def game_FENs(moves: Sequence[Tuple[str, str, str]], FEN: str = DEFAULT_FEN) -> list[str]:
+    """
+    Returns the FEN string of the position after every move of a game.
+
+    Parameters:
+    ----------
+    moves : Sequence[Tuple[str, str, str]]
+        The moves in coordinate notation, as returned by convert_from_PGN().
+    FEN : str, optional
+        The FEN string of the position the game starts from (default is the standard start of game).
+
+    Returns:
+    -------
+    list[str]
+        One FEN string per move.
+    """
+    position = Position(FEN)
+    FENs = []
+    for move in moves:
+        position.apply_move(move)
+        FENs.append(position.to_FEN())
+    return FENs
+
+async def analyse_game(moves: Sequence[Tuple[str, str, str]], command: str | Sequence[str], FEN: str = DEFAULT_FEN,
+                       workers: int = 1, depth: int = None, movetime: int = None, options: dict = None) -> AsyncIterator[Tuple[int, float]]:
+    """
+    Evaluates the position after every move of a game, see analyse_positions(). The evaluations come in ply order,
+    so they can be passed on to an EvaluationBar as they arrive.
+
+    Parameters:
+    ----------
+    moves : Sequence[Tuple[str, str, str]]
+        The moves in coordinate notation, as returned by convert_from_PGN().
+    command : str or Sequence[str]
+        The command that runs the engine.
+    FEN : str, optional
+        The FEN string of the position the game starts from (default is the standard start of game).
+    workers, depth, movetime, options :
+        See analyse_positions().
+
+    Returns:
+    -------
+    AsyncIterator[Tuple[int, float]]
+        The ply (0 for white's first move) and the evaluation after it.
+    """
+    async for ply, evaluation in analyse_positions(game_FENs(moves, FEN), command, workers, depth, movetime, options):
+        yield ply, evaluation
+
+def evaluate_game(moves: Sequence[Tuple[str, str, str]], command: str | Sequence[str], FEN: str = DEFAULT_FEN,
+                  workers: int = 1, depth: int = None, movetime: int = None, options: dict = None) -> list[float]:
+    """
+    Evaluates the position after every move of a game, returning evaluations that can be passed to play_game().
+
+    Parameters:
+    ----------
+    moves : Sequence[Tuple[str, str, str]]
+        The moves in coordinate notation, as returned by convert_from_PGN().
+    command : str or Sequence[str]
+        The command that runs the engine (e.g., 'stockfish').
+    FEN : str, optional
+        The FEN string of the position the game starts from (default is the standard start of game).
+    workers, depth, movetime, options :
+        See analyse_positions().
+
+    Returns:
+    -------
+    list[float]
+        The evaluation after every move, in pawns from white's point of view.
+    """
+    async def collect() -> list[float]:
+        return [evaluation async for _, evaluation in analyse_game(moves, command, FEN, workers, depth, movetime, options)]
+    return asyncio.run(collect())
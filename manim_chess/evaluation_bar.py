@@ -1,6 +1,78 @@
 from manim import *
 from typing import Tuple
 
+# Rendered evaluation labels and bar rectangles shared by every evaluation bar in the process. Evaluations are shown
+# to one decimal, so only a small number of them are ever built.
+_LABEL_TEMPLATES = {}  # keyed by (text, color)
+_BAR_TEMPLATES = {}  # keyed by (height, color)
+
+def get_evaluation_label_template(text: str, color: ManimColor) -> Text:
+    """
+    Returns the shared Text of an evaluation label, rendering it only the first time it is requested.
+
+    The template must not be added to a scene or modified, evaluation bars use a copy of it instead.
+
+    Parameters:
+    ----------
+    text : str
+        The text of the label (e.g., '1.5').
+    color : ManimColor
+        The color of the label.
+
+    Returns:
+    -------
+    Text
+        The scaled label centered at the origin.
+    """
+    key = (text, color.to_hex())
+    template = _LABEL_TEMPLATES.get(key)
+    if template is None:
+        template = Text(text, font="Arial").set_fill(color).scale(0.2)
+        _LABEL_TEMPLATES[key] = template
+    return template
+
+def get_bar_template(height: float, color: ManimColor) -> Rectangle:
+    """
+    Returns the shared Rectangle of the white part of an evaluation bar, building it only the first time it is requested.
+
+    The template must not be added to a scene or modified, evaluation bars use a copy of it instead.
+
+    Parameters:
+    ----------
+    height : float
+        The height of the rectangle.
+    color : ManimColor
+        The color of the rectangle.
+
+    Returns:
+    -------
+    Rectangle
+        The rectangle centered at the origin.
+    """
+    key = (round(height, 6), color.to_hex())
+    template = _BAR_TEMPLATES.get(key)
+    if template is None:
+        template = Rectangle(width=0.25, height=height, stroke_color=color, fill_opacity=1).set_fill(color)
+        _BAR_TEMPLATES[key] = template
+    return template
+
+def evaluation_bar_heights(evaluations) -> np.ndarray:
+    """
+    Returns the height of the white part of the evaluation bar for every evaluation, in one vectorized pass.
+    Evaluations are rounded to one decimal first, as they are shown.
+
+    Parameters:
+    ----------
+    evaluations : array_like
+        The evaluations, positive when white is better.
+
+    Returns:
+    -------
+    np.ndarray
+        The heights, between 0.32 and 6.18.
+    """
+    return np.clip(0.737063 * np.round(np.asarray(evaluations, dtype=float), 1) + 3.2, 0.32, 6.18)
+
 class EvaluationBar(Mobject):
     """
     A class to represent an evaluation bar using Manim for visualization.
@@ -56,24 +128,40 @@ class EvaluationBar(Mobject):
         list
             A list of Transform animations to update the evaluation bar.
         """
-        self.evaluation = evaluation
-        text_transformation = None
-        if self.evaluation > 0:
-            text_transformation = Transform(
-                self.bot_text, 
-                Text(f'{self.evaluation:.1f}', font="Arial").move_to(self.black_rectangle.get_bottom() + np.array([0, 0.2, 0])).set_fill(self.BLACK).scale(0.2)
-            )
-        else:
-            text_transformation = Transform(
-                self.bot_text,
-                Text(f'{self.evaluation:.1f}', font="Arial").move_to(self.black_rectangle.get_top() + np.array([0, -0.2, 0])).set_fill(self.WHITE).scale(0.2)
-            )
-
-        height_from_evaluation = 0.737063 * self.evaluation + 3.2
-        rect_height = min(max(0.32, height_from_evaluation), 6.18)
-        pos = self.black_rectangle.get_bottom() + np.array([0, rect_height / 2, 0])
-        new_rect = Rectangle(width=0.25, height=rect_height, stroke_color=self.WHITE, fill_opacity=1).set_fill(self.WHITE).move_to(pos)
-        return [Transform(self.white_rectangle, new_rect), text_transformation]
+        return self.set_evaluations([evaluation])[0]
+
+    def set_evaluations(self, evaluations) -> list[list]:
+        """
+        Builds the updates of the evaluation bar for a whole series of evaluations at once. The bar heights are
+        computed in one vectorized pass and the labels and rectangles come from caches, so this costs far less than
+        calling set_evaluation() for every evaluation. The evaluation attribute is set to the last evaluation.
+
+        Parameters:
+        ----------
+        evaluations : array_like
+            The evaluations in the order they are shown, e.g. a NumPy array with one evaluation per move.
+
+        Returns:
+        -------
+        list[list]
+            For every evaluation, the list of Transform animations that updates the evaluation bar to it.
+        """
+        evaluations = np.asarray(evaluations, dtype=float)
+        if len(evaluations):
+            self.evaluation = float(evaluations[-1])
+        bottom = self.black_rectangle.get_bottom()
+        top = self.black_rectangle.get_top()
+        heights = evaluation_bar_heights(evaluations)
+
+        transformations = []
+        for evaluation, rect_height in zip(evaluations, heights):
+            if evaluation > 0:
+                label = get_evaluation_label_template(f'{evaluation:.1f}', self.BLACK).copy().move_to(bottom + np.array([0, 0.2, 0]))
+            else:
+                label = get_evaluation_label_template(f'{evaluation:.1f}', self.WHITE).copy().move_to(top + np.array([0, -0.2, 0]))
+            new_rect = get_bar_template(rect_height, self.WHITE).copy().move_to(bottom + np.array([0, rect_height / 2, 0]))
+            transformations.append([Transform(self.white_rectangle, new_rect), Transform(self.bot_text, label)])
+        return transformations
 
     def __add_rectangles(self) -> None:
         """
@@ -0,0 +1,262 @@
+import math
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
+from .position import Position, DEFAULT_FEN, encode_move, decode_move
+
+if TYPE_CHECKING:
+    # Only for type hints, importing the board imports Manim
+    from .board import Board
+
+def _float_column(values: Iterable[float] | None) -> array:
+    """
+    Returns the values as an array of 32 bit floats, with NaN for None.
+    """
+    return array('f', [math.nan if value is None else value for value in (() if values is None else values)])
+
+# Bits of the flags column, the remaining bits are free for the caller's own per ply marks
+FLAG_CAPTURE = 1
+FLAG_CHECK = 2
+FLAG_PROMOTION = 4
+FLAG_CASTLING = 8
+
+class Game:
+    """
+    A game stored as typed columns, that can jump to any ply without replaying the whole game.
+
+    Moves are stored as 16 bit ints (see encode_move()), about 2 bytes per ply instead of hundreds for a list of
+    string tuples, so millions of games fit in memory. Coordinate tuples are only created when moves are read,
+    e.g., game[ply] or game[start:end]. The optional per ply columns are empty when the game has none.
+
+    The FEN string of the position is stored every snapshot_interval plies, so getting to a ply only parses one
+    FEN string and plays at most snapshot_interval - 1 moves. The snapshots are taken the first time a position
+    is asked for.
+
+    Attributes:
+    ----------
+    encoded_moves : array.array
+        The moves as unsigned 16 bit ints.
+    evals : array.array
+        The evaluation after every move as 32 bit floats, NaN where unknown, or empty.
+    clocks : array.array
+        The clock time left after every move in seconds as 32 bit floats, NaN where unknown, or empty.
+    flags : array.array
+        Bit flags of every move as unsigned 8 bit ints (FLAG_CAPTURE, FLAG_CHECK, ...), or empty.
+    FEN : str
+        The FEN string of the position the game starts from.
+    snapshot_interval : int
+        The number of plies between two snapshots.
+    snapshots : list[str]
+        The FEN strings of the positions at ply 0, snapshot_interval, 2 * snapshot_interval, ...
+
+    Methods:
+    -------
+    from_encoded(encoded_moves, FEN, ...):
+        Creates a game from moves already encoded, e.g., ConversionResult.encoded_moves.
+    compute_flags():
+        Fills the flags column with the capture, check, promotion and castling flags of every move.
+    position_at(ply):
+        Returns the position after a number of plies.
+    FEN_at(ply):
+        Returns the FEN string of the position after a number of plies.
+    set_board(board, ply):
+        Sets a board to the position after a number of plies.
+    """
+    __slots__ = ('encoded_moves', 'evals', 'clocks', 'flags', 'FEN', 'snapshot_interval', '_snapshots')
+
+    def __init__(self, moves: Iterable[Tuple[str, str, str]], FEN: str = DEFAULT_FEN, snapshot_interval: int = 16,
+                 evals: Iterable[float] = None, clocks: Iterable[float] = None, flags: Iterable[int] = None) -> None:
+        """
+        Initializes the Game object.
+
+        Parameters:
+        ----------
+        moves : Iterable[Tuple[str, str, str]]
+            The moves of the game in coordinate notation.
+        FEN : str, optional
+            The FEN string of the position the game starts from (default is the standard start of game).
+        snapshot_interval : int, optional
+            The number of plies between two snapshots (default is 16).
+        evals : Iterable[float], optional
+            The evaluation after every move, None or NaN where unknown (default is None).
+        clocks : Iterable[float], optional
+            The clock time left after every move in seconds, None or NaN where unknown (default is None).
+        flags : Iterable[int], optional
+            Bit flags of every move (default is None).
+        """
+        self.__init_columns(array('H', [encode_move(move) for move in moves]), FEN, snapshot_interval, evals, clocks, flags)
+
+    @classmethod
+    def from_encoded(cls, encoded_moves: bytes | array | Iterable[int], FEN: str = DEFAULT_FEN, snapshot_interval: int = 16,
+                     evals: Iterable[float] = None, clocks: Iterable[float] = None, flags: Iterable[int] = None,
+                     snapshots: list[str] = None) -> 'Game':
+        """
+        Creates a game from moves encoded with encode_move(), without decoding them.
+
+        Parameters:
+        ----------
+        encoded_moves : bytes, array.array or Iterable[int]
+            The encoded moves, bytes are read as native unsigned 16 bit ints (e.g., ConversionResult.encoded_moves).
+        FEN, snapshot_interval, evals, clocks, flags :
+            See Game().
+        snapshots : list[str], optional
+            The FEN strings of the positions every snapshot_interval plies if they are already known, e.g., loaded
+            from a GameCache (default is None, they are taken when first needed).
+
+        Returns:
+        -------
+        Game
+            The game.
+        """
+        game = cls.__new__(cls)
+        if isinstance(encoded_moves, (bytes, bytearray, memoryview)):
+            column = array('H')
+            column.frombytes(encoded_moves)
+        else:
+            column = array('H', encoded_moves)
+        game.__init_columns(column, FEN, snapshot_interval, evals, clocks, flags)
+        if snapshots is not None:
+            if len(snapshots) != len(column) // snapshot_interval + 1:
+                raise ValueError(f"{len(snapshots)} snapshots do not match {len(column)} moves every {snapshot_interval} plies")
+            game._snapshots = list(snapshots)
+        return game
+
+    def __init_columns(self, encoded_moves: array, FEN: str, snapshot_interval: int, evals: Iterable[float] | None,
+                       clocks: Iterable[float] | None, flags: Iterable[int] | None) -> None:
+        """
+        Sets the columns, checking that every given column has one value per move.
+        """
+        if snapshot_interval < 1:
+            raise ValueError(f"snapshot_interval must be at least 1, not {snapshot_interval}")
+        self.encoded_moves = encoded_moves
+        self.evals = _float_column(evals)
+        self.clocks = _float_column(clocks)
+        self.flags = array('B', () if flags is None else flags)
+        for name in ('evals', 'clocks', 'flags'):
+            column = getattr(self, name)
+            if column and len(column) != len(encoded_moves):
+                raise ValueError(f"{name} has {len(column)} values for {len(encoded_moves)} moves")
+        self.FEN = FEN
+        self.snapshot_interval = snapshot_interval
+        self._snapshots = None
+
+    @property
+    def snapshots(self) -> list[str]:
+        if self._snapshots is None:
+            self._snapshots = []
+            position = Position(self.FEN)
+            for ply, encoded_move in enumerate(self.encoded_moves):
+                if ply % self.snapshot_interval == 0:
+                    self._snapshots.append(position.to_FEN())
+                position.apply_move(decode_move(encoded_move))
+            if len(self.encoded_moves) % self.snapshot_interval == 0:
+                self._snapshots.append(position.to_FEN())
+        return self._snapshots
+
+    @property
+    def moves(self) -> list[Tuple[str, str, str]]:
+        """
+        The moves in coordinate notation, decoded every time. Use game[start:end] to only decode a part.
+        """
+        return self[:]
+
+    def __len__(self) -> int:
+        return len(self.encoded_moves)
+
+    def __getitem__(self, index: int | slice) -> Tuple[str, str, str] | list[Tuple[str, str, str]]:
+        if isinstance(index, slice):
+            return [decode_move(encoded_move) for encoded_move in self.encoded_moves[index]]
+        return decode_move(self.encoded_moves[index])
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str]]:
+        return map(decode_move, self.encoded_moves)
+
+    def compute_flags(self) -> array:
+        """
+        Fills the flags column with FLAG_CAPTURE, FLAG_CHECK, FLAG_PROMOTION and FLAG_CASTLING by playing through
+        the game, keeping any other bits already set.
+
+        Returns:
+        -------
+        array.array
+            The flags column.
+        """
+        flags = self.flags or array('B', bytes(len(self.encoded_moves)))
+        position = Position(self.FEN)
+        for ply, encoded_move in enumerate(self.encoded_moves):
+            move = decode_move(encoded_move)
+            is_king = position.piece_at(move[0]) in {'K', 'k'}
+            pieces = position.occupied().bit_count()
+            position.apply_move(move)
+            flag = flags[ply] & ~(FLAG_CAPTURE | FLAG_CHECK | FLAG_PROMOTION | FLAG_CASTLING)
+            if position.occupied().bit_count() < pieces:
+                flag |= FLAG_CAPTURE
+            if position.in_check():
+                flag |= FLAG_CHECK
+            if move[2]:
+                flag |= FLAG_PROMOTION
+            if is_king and abs(ord(move[0][0]) - ord(move[1][0])) == 2:
+                flag |= FLAG_CASTLING
+            flags[ply] = flag
+        self.flags = flags
+        return flags
+
+    def position_at(self, ply: int) -> Position:
+        """
+        Returns the position after a number of plies.
+
+        Parameters:
+        ----------
+        ply : int
+            The number of moves played, from 0 (the starting position) to len(game). Negative values count from the end.
+
+        Returns:
+        -------
+        Position
+            A new Position, changing it does not change the game.
+        """
+        if ply < 0:
+            ply += len(self.encoded_moves) + 1
+        if not 0 <= ply <= len(self.encoded_moves):
+            raise IndexError(f"Ply {ply} is out of range for a game of {len(self.encoded_moves)} plies")
+        snapshot_ply = ply - ply % self.snapshot_interval
+        position = Position(self.snapshots[snapshot_ply // self.snapshot_interval])
+        for encoded_move in self.encoded_moves[snapshot_ply:ply]:
+            position.apply_move(decode_move(encoded_move))
+        return position
+
+    def FEN_at(self, ply: int) -> str:
+        """
+        Returns the FEN string of the position after a number of plies.
+
+        Parameters:
+        ----------
+        ply : int
+            The number of moves played, from 0 (the starting position) to len(game).
+
+        Returns:
+        -------
+        str
+            The FEN string of the position.
+        """
+        return self.position_at(ply).to_FEN()
+
+    def set_board(self, board: 'Board', ply: int) -> None:
+        """
+        Sets a board to the position after a number of plies, with the last move highlighted as play_game() leaves it.
+        Only the pieces that differ are changed, see Board.transition_to().
+
+        Parameters:
+        ----------
+        board : Board
+            The chess board object to set.
+        ply : int
+            The number of moves played, from 0 (the starting position) to len(game).
+        """
+        board.transition_to(self.FEN_at(ply))
+        if ply < 0:
+            ply += len(self.encoded_moves) + 1
+        if ply > 0:
+            board.highlight_move(*self[ply - 1][:2])
+        else:
+            board.clear_higlights()
+            board.highlighted_squares = []
@@ -0,0 +1,237 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .game import Game
+from .notation import convert_moves, split_movetext
+from .position import DEFAULT_FEN
+
+# Cache files start with this, followed by the format version, the number of plies and the size of the FEN block
+CACHE_MAGIC = b'MCGAME'
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct('<6sHII')
+
+def default_cache_directory() -> str:
+    """
+    Returns the directory games are cached in by default, manim_chess in the user's cache directory.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'manim_chess', 'games')
+
+def cache_key(PGN: str, FEN: str = DEFAULT_FEN) -> str:
+    """
+    Returns the key of a game in a GameCache, the SHA-256 of its PGN text and starting position.
+
+    Parameters:
+    ----------
+    PGN : str
+        The game in PGN format.
+    FEN : str
+        The FEN string of the position the game starts from.
+
+    Returns:
+    -------
+    str
+        The key as 64 hexadecimal digits.
+    """
+    return hashlib.sha256(f'{FEN}\0{PGN}'.encode()).hexdigest()
+
+class GameCache:
+    """
+    A cache of converted games on disk, so rendering the same game again skips converting its notation.
+
+    Each game is stored in its own binary file named after cache_key(): the moves as 16 bit ints followed by the FEN
+    string of the position after every ply. Files are memory-mapped when loaded and the cache is kept under max_bytes
+    by deleting the least recently used games, tracked with the files' modification times.
+
+    Attributes:
+    ----------
+    directory : str
+        The directory the games are stored in.
+    max_bytes : int
+        The maximum total size of the cached games in bytes.
+    hits : int
+        The number of games found in the cache.
+    misses : int
+        The number of games that had to be converted.
+
+    Methods:
+    -------
+    convert(PGN, FEN):
+        Returns a game from the cache, converting and storing it if it is not cached yet.
+    get(PGN, FEN):
+        Returns a cached game or None.
+    put(PGN, FEN, moves):
+        Stores a converted game.
+    clear():
+        Deletes every cached game.
+    """
+
+    def __init__(self, directory: str | os.PathLike = None, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Initializes the GameCache object, creating the directory if needed.
+
+        Parameters:
+        ----------
+        directory : str or os.PathLike, optional
+            The directory the games are stored in (default is default_cache_directory()).
+        max_bytes : int, optional
+            The maximum total size of the cached games in bytes (default is 256 MiB).
+        """
+        self.directory = os.fspath(directory) if directory is not None else default_cache_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.game')
+
+    def convert(self, PGN: str, FEN: str = DEFAULT_FEN) -> Game:
+        """
+        Returns a game from the cache, converting it and storing it if it is not cached yet. Only games that convert
+        without an error are stored.
+
+        Parameters:
+        ----------
+        PGN : str
+            A single game in PGN format.
+        FEN : str, optional
+            The FEN string of the position the game starts from (default is the standard start of game).
+
+        Returns:
+        -------
+        Game
+            The game, every ply is a snapshot so any position is found without replaying moves.
+
+        Raises:
+        ------
+        NotationError
+            If a move can not be converted, nothing is stored then.
+        """
+        game = self.get(PGN, FEN)
+        if game is None:
+            # Not convert_from_PGN(), which only prints errors and returns the moves before the bad one
+            movetext = '\n'.join(line for line in PGN.splitlines() if not line.lstrip().startswith('['))
+            moves = []
+            convert_moves(split_movetext(movetext), FEN, moves)
+            game = self.put(PGN, FEN, moves)
+        return game
+
+    def get(self, PGN: str, FEN: str = DEFAULT_FEN) -> Game | None:
+        """
+        Returns a cached game and marks it as recently used.
+
+        Parameters:
+        ----------
+        PGN : str
+            A single game in PGN format.
+        FEN : str, optional
+            The FEN string of the position the game starts from (default is the standard start of game).
+
+        Returns:
+        -------
+        Game or None
+            The game, or None if it is not cached or its file is broken.
+        """
+        path = self.__path(cache_key(PGN, FEN))
+        try:
+            with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                game = _read_game(data, FEN)
+            os.utime(path)
+        except (OSError, ValueError, struct.error):
+            game = None
+        if game is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return game
+
+    def put(self, PGN: str, FEN: str, moves: list) -> Game:
+        """
+        Stores a converted game, then evicts the least recently used games if the cache is too big.
+
+        Parameters:
+        ----------
+        PGN : str
+            A single game in PGN format.
+        FEN : str
+            The FEN string of the position the game starts from.
+        moves : list[Tuple[str, str, str]]
+            The moves of the game in coordinate notation, as returned by convert_from_PGN().
+
+        Returns:
+        -------
+        Game
+            The game as it would be returned by get().
+        """
+        game = Game(moves, FEN, snapshot_interval=1)
+        encoded_moves = array('H', game.encoded_moves)
+        if sys.byteorder == 'big':
+            encoded_moves.byteswap()
+        positions = '\n'.join(game.snapshots).encode()
+
+        path = self.__path(cache_key(PGN, FEN))
+        # Written to a temporary file first, so other processes never read half a game
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(encoded_moves), len(positions)))
+            file.write(encoded_moves.tobytes())
+            file.write(positions)
+        os.replace(temporary_path, path)
+        self.__evict()
+        return game
+
+    def __evict(self) -> None:
+        """
+        Deletes the least recently used games until the cache fits in max_bytes.
+        """
+        entries = []
+        total_size = 0
+        with os.scandir(self.directory) as directory:
+            for entry in directory:
+                if entry.name.endswith('.game'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total_size += stat.st_size
+        if total_size <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            if total_size <= self.max_bytes:
+                break
+
+    def __len__(self) -> int:
+        return sum(1 for name in os.listdir(self.directory) if name.endswith('.game'))
+
+    def clear(self) -> None:
+        """
+        Deletes every cached game and resets the counters.
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith('.game'):
+                os.remove(os.path.join(self.directory, name))
+        self.hits = 0
+        self.misses = 0
+
+def _read_game(data: mmap.mmap, FEN: str) -> Game | None:
+    """
+    Reads a game from the mapped bytes of a cache file, None if the file is not a cache file of this version.
+    """
+    magic, version, plies, positions_size = CACHE_HEADER.unpack_from(data)
+    moves_end = CACHE_HEADER.size + 2 * plies
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or len(data) != moves_end + positions_size:
+        return None
+    encoded_moves = array('H')
+    encoded_moves.frombytes(data[CACHE_HEADER.size:moves_end])
+    if sys.byteorder == 'big':
+        encoded_moves.byteswap()
+    positions = data[moves_end:].decode().split('\n')
+    return Game.from_encoded(encoded_moves, FEN, snapshot_interval=1, snapshots=positions)
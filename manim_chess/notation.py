@@ -0,0 +1,623 @@
+from .position import Position, DEFAULT_FEN
+from .san_cache import SANCache, SAN_CACHE
+from .bitboard import lowest_square, squares_of, piece_attacks, sliding_attacks
+from .tables import (
+    SQUARE_NAMES,
+    SQUARE_INDICES,
+    SQUARE_FILES,
+    SQUARE_RANKS,
+    FILE_INDICES,
+    FILE_MASKS,
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    RANK_MASKS,
+    BETWEEN,
+    LINE,
+    PAWN_ATTACKS,
+    ROOK_DIRECTIONS,
+    BISHOP_DIRECTIONS,
+)
+
+import re
+from typing import Tuple
+
+# Moves start with a piece letter, a file or O for castling, this removes move numbers, NAGs and results
+ALLOWED_START_OF_MOVES = {'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'o', 'k', 'n', 'q', 'r'}
+# {brace comments} and ;rest of line comments
+COMMENT_PATTERN = re.compile(r'\{[^}]*\}|;[^\n]*')
+
+class NotationError(ValueError):
+    """
+    Raised when a move of a game can not be converted from algebraic notation.
+
+    Attributes:
+    ----------
+    ply : int
+        The index of the move in the game, 0 for white's first move.
+    move : str
+        The move in algebraic notation.
+    """
+
+    def __init__(self, message: str, ply: int, move: str) -> None:
+        super().__init__(message)
+        self.ply = ply
+        self.move = move
+
+class IllegalMoveError(NotationError):
+    """
+    Raised in strict mode when a move can be read but is not legal in the position, or is ambiguous.
+
+    Attributes:
+    ----------
+    ply : int
+        The index of the move in the game, 0 for white's first move.
+    move : str
+        The move in algebraic notation.
+    reason : str
+        Why the move is illegal, e.g., 'the knight on d2 is pinned'.
+    """
+
+    def __init__(self, message: str, ply: int, move: str, reason: str) -> None:
+        super().__init__(message, ply, move)
+        self.reason = reason
+
+# Every square, the check mask when the side to move is not in check
+ALL_SQUARES = (1 << 64) - 1
+# The squares a rook or bishop attacks from each square on an empty board
+ROOK_LINES = [sliding_attacks(square, 0, ROOK_DIRECTIONS) for square in range(64)]
+BISHOP_LINES = [sliding_attacks(square, 0, BISHOP_DIRECTIONS) for square in range(64)]
+PIECE_NAMES = {'P': 'pawn', 'N': 'knight', 'B': 'bishop', 'R': 'rook', 'Q': 'queen', 'K': 'king'}
+
+def __as_position(FEN) -> Position:
+    """
+    Returns the given Position, or a new Position parsed from the given FEN string.
+
+    Parameters:
+    ----------
+    FEN : str or Position
+        The current board position.
+    """
+    return FEN if isinstance(FEN, Position) else Position(FEN)
+
+def __castling_notation(algebraic_notation, FEN) -> Tuple[str, str, str]:
+    turn = __as_position(FEN).turn # w or b
+    castling_king_side = True if algebraic_notation.rstrip('+#!?') == 'O-O' else False
+
+    if turn == 'w': # If player is white
+        move = ('e1', 'g1', "") if castling_king_side else ('e1', 'c1', "") # King side castling or queen side castling
+    else: # If player is black
+       move = ('e8', 'g8', "") if castling_king_side else ('e8', 'c8', "") # King side castling or queen side castling
+    return move
+
+def pawn_algebraic_notation(algebraic_notation, FEN) -> Tuple[str, str, str]:
+    # If the piece is a pawn than the starting square can be determined by seeing which pawn can go to the ending square
+    # 
+    # NOTE ascending means +1 rank and descending means -1 rank
+    #
+    # This can be done by:
+    # 1. If not capturing, check the square descending from the ending square (or ascending if black) if a pawn 
+    #    is there than that is the starting square, else it is the square descending from that square (or ascending if black)
+    # 2. If capturing than the file is specified as first char on algebraic notation. Then the only needed information is the rank
+    #    which can be determined by the turn (w or b) since white can only move ascending with pawns and black can only move descending 
+    #    with pawns.
+    # 3. If promoting than promotion piece is specified, make sure to check if the checking or checkmating since that moves the promotion
+    #    piece to the second to last char
+    position = __as_position(FEN)
+    notation = algebraic_notation.rstrip('+#!?')
+
+    promotion_piece = ''
+    if '=' in notation:
+        notation, promotion_piece = notation.split('=')
+
+    ending_square = notation[-2:]
+    ending_square_index = SQUARE_INDICES[ending_square]
+    # One rank back towards the side's own pieces, in square index steps
+    backwards = 8 if position.turn == 'w' else -8
+
+    if 'x' not in notation:
+        starting_square_index = ending_square_index + backwards
+        if not position.board[starting_square_index]:
+            starting_square_index += backwards
+    else:
+        starting_square_index = ending_square_index + backwards + FILE_INDICES[notation[0]] - SQUARE_FILES[ending_square_index]
+
+    # No pawn of the side to move can make the move
+    if not 0 <= starting_square_index < 64 or position.board[starting_square_index] != ('P' if position.turn == 'w' else 'p'):
+        return None
+    return (SQUARE_NAMES[starting_square_index], ending_square, promotion_piece)
+
+def __pinned_pieces(position: Position) -> int:
+    """
+    Returns the bitboard of the pieces of the side to move that are pinned to their own king.
+
+    Parameters:
+    ----------
+    position : Position
+        The current board position.
+    """
+    turn = position.turn
+    enemy = 'b' if turn == 'w' else 'w'
+    king_bitboard = position.bitboards['K' if turn == 'w' else 'k']
+    if not king_bitboard:
+        return 0
+    king_square = lowest_square(king_bitboard)
+
+    queens = position.bitboards['q' if turn == 'w' else 'Q']
+    rook_snipers = (position.bitboards['r' if turn == 'w' else 'R'] | queens) & ROOK_LINES[king_square]
+    bishop_snipers = (position.bitboards['b' if turn == 'w' else 'B'] | queens) & BISHOP_LINES[king_square]
+
+    occupied = position.occupied()
+    pinned = 0
+    for sniper in squares_of((rook_snipers | bishop_snipers) & position.occupancy[enemy]):
+        blockers = BETWEEN[king_square][sniper] & occupied
+        # Pinned if the only piece between the king and the sniper is ours
+        if blockers and not blockers & (blockers - 1) and blockers & position.occupancy[turn]:
+            pinned |= blockers
+    return pinned
+
+def attackers(position: Position, square: int, side: str, occupied: int) -> int:
+    """
+    Returns the bitboard of the pieces of one side that attack a square.
+
+    Parameters:
+    ----------
+    position : Position
+        The current board position.
+    square : int
+        The index of the attacked square.
+    side : str
+        The attacking side, 'w' or 'b'.
+    occupied : int
+        The bitboard of the occupied squares the sliding pieces are blocked by.
+    """
+    bitboards = position.bitboards
+    pawn, knight, bishop, rook, queen, king = 'PNBRQK' if side == 'w' else 'pnbrqk'
+    # Attacks are symmetric, so the attackers stand on the squares the same piece would attack from the square
+    attacking_pieces = (PAWN_ATTACKS['b' if side == 'w' else 'w'][square] & bitboards[pawn]
+                        | KNIGHT_ATTACKS[square] & bitboards[knight]
+                        | KING_ATTACKS[square] & bitboards[king])
+    # Rays are only followed if a sliding piece could be on them
+    diagonal_sliders = (bitboards[bishop] | bitboards[queen]) & BISHOP_LINES[square]
+    if diagonal_sliders:
+        attacking_pieces |= sliding_attacks(square, occupied, BISHOP_DIRECTIONS) & diagonal_sliders
+    straight_sliders = (bitboards[rook] | bitboards[queen]) & ROOK_LINES[square]
+    if straight_sliders:
+        attacking_pieces |= sliding_attacks(square, occupied, ROOK_DIRECTIONS) & straight_sliders
+    return attacking_pieces
+
+def check_and_pin_masks(position: Position) -> Tuple[int, int, int]:
+    """
+    Returns the masks a move of the side to move is checked against, computed once per position.
+
+    Parameters:
+    ----------
+    position : Position
+        The current board position.
+
+    Returns:
+    -------
+    Tuple[int, int, int]
+        The bitboard of the pieces giving check, the squares a piece other than the king can move to so the check
+        is blocked or the checking piece captured (every square if not in check, none in double check), and the
+        pieces pinned to their king.
+    """
+    king_bitboard = position.bitboards['K' if position.turn == 'w' else 'k']
+    if not king_bitboard:
+        return 0, ALL_SQUARES, 0
+    king_square = lowest_square(king_bitboard)
+    checkers = attackers(position, king_square, 'b' if position.turn == 'w' else 'w', position.occupied())
+    if not checkers:
+        check_mask = ALL_SQUARES
+    elif checkers & (checkers - 1):
+        check_mask = 0
+    else:
+        check_mask = checkers | BETWEEN[king_square][lowest_square(checkers)]
+    return checkers, check_mask, __pinned_pieces(position)
+
+def illegal_move_reason(position: Position, algebraic_notation: str, coordinates: Tuple[str, str, str]) -> str | None:
+    """
+    Checks that a move read from algebraic notation is legal in the position and is the only move the notation can
+    mean, using the check and pin masks of the position.
+
+    Parameters:
+    ----------
+    position : Position
+        The position the move is played in.
+    algebraic_notation : str
+        The move in algebraic notation, e.g., 'Nbd7'.
+    coordinates : Tuple[str, str, str]
+        The move in coordinate notation, as resolved by convert_from_algebraic_notation().
+
+    Returns:
+    -------
+    str or None
+        Why the move is illegal or ambiguous, None if it is legal.
+    """
+    notation = algebraic_notation.rstrip('+#!?')
+    starting_square, ending_square, promotion_piece = coordinates
+    start = SQUARE_INDICES[starting_square]
+    end = SQUARE_INDICES[ending_square]
+    turn = position.turn
+    enemy = 'b' if turn == 'w' else 'w'
+    occupied = position.occupied()
+
+    piece = position.board[start]
+    if not piece or position.occupancy[turn] & (1 << start) == 0:
+        return f'there is no piece of the side to move on {starting_square}'
+    if position.occupancy[turn] & (1 << end):
+        return f'{ending_square} is taken by a piece of the side to move'
+    piece_type = piece.upper()
+    piece_name = PIECE_NAMES[piece_type]
+
+    is_en_passant = piece_type == 'P' and ending_square == position.en_passant and SQUARE_FILES[start] != SQUARE_FILES[end]
+    is_capture = bool(position.occupancy[enemy] & (1 << end)) or is_en_passant
+    is_castling = notation in {'O-O', 'O-O-O'}
+    if not is_castling and ('x' in notation) != is_capture:
+        return f'the move is {"" if is_capture else "not "}a capture'
+
+    checkers, check_mask, pinned = check_and_pin_masks(position)
+    king_bitboard = position.bitboards['K' if turn == 'w' else 'k']
+    king_square = lowest_square(king_bitboard) if king_bitboard else None
+
+    if piece_type == 'K':
+        if is_castling:
+            return __illegal_castling_reason(position, start, end, checkers)
+        if not piece_attacks('K', start, occupied) & (1 << end):
+            return f'the king can not reach {ending_square}'
+        # Sliding pieces attack through the square the king leaves
+        if attackers(position, end, enemy, occupied ^ (1 << start)):
+            return f'the king would be in check on {ending_square}'
+        return None
+
+    if king_square is not None:
+        if checkers & (checkers - 1):
+            return 'only the king can move out of double check'
+        if pinned & (1 << start) and not LINE[king_square][start] & (1 << end):
+            return f'the {piece_name} on {starting_square} is pinned'
+        captured_square = end + 8 if turn == 'w' else end - 8
+        if not check_mask & (1 << end) and not (is_en_passant and checkers & (1 << captured_square)):
+            return 'the move does not get out of check'
+
+    if piece_type == 'P':
+        return __illegal_pawn_move_reason(position, start, end, promotion_piece, is_capture, is_en_passant, king_square)
+
+    candidates = position.bitboards[piece] & piece_attacks(piece_type, end, occupied)
+    if not candidates & (1 << start):
+        return f'the {piece_name} on {starting_square} can not reach {ending_square}'
+    for specifier in notation[1:-2]:
+        if specifier in FILE_MASKS:
+            candidates &= FILE_MASKS[specifier]
+        elif specifier in RANK_MASKS:
+            candidates &= RANK_MASKS[specifier]
+    if not candidates & (1 << start):
+        return f'the {piece_name} on {starting_square} does not match {algebraic_notation}'
+    if king_square is not None:
+        for square in squares_of(candidates & pinned):
+            if not LINE[king_square][square] & (1 << end):
+                candidates ^= 1 << square
+    if candidates & (candidates - 1):
+        return f'{algebraic_notation} is ambiguous, more than one {piece_name} can move to {ending_square}'
+    return None
+
+def __illegal_castling_reason(position: Position, start: int, end: int, checkers: int) -> str | None:
+    """
+    Returns why castling is illegal, None if it is legal.
+    """
+    if checkers:
+        return 'the king can not castle out of check'
+    king_side = end > start
+    right = 'K' if king_side else 'Q'
+    if (right if position.turn == 'w' else right.lower()) not in position.castling:
+        return f'no right to castle {"king" if king_side else "queen"} side'
+    rook_square = start + 3 if king_side else start - 4
+    if position.board[rook_square] != ('R' if position.turn == 'w' else 'r'):
+        return 'there is no rook to castle with'
+    occupied = position.occupied()
+    if BETWEEN[start][rook_square] & occupied:
+        return 'there are pieces between the king and the rook'
+    enemy = 'b' if position.turn == 'w' else 'w'
+    step = 1 if king_side else -1
+    for square in (start + step, start + 2 * step):
+        if attackers(position, square, enemy, occupied):
+            return f'the king would pass through or land on the attacked square {SQUARE_NAMES[square]}'
+    return None
+
+def __illegal_pawn_move_reason(position: Position, start: int, end: int, promotion_piece: str, is_capture: bool,
+                               is_en_passant: bool, king_square: int | None) -> str | None:
+    """
+    Returns why a pawn move is illegal, None if it is legal. Pins and checks are already checked.
+    """
+    turn = position.turn
+    forward = -8 if turn == 'w' else 8
+    occupied = position.occupied()
+    if is_capture:
+        if not PAWN_ATTACKS[turn][start] & (1 << end):
+            return f'the pawn on {SQUARE_NAMES[start]} can not capture on {SQUARE_NAMES[end]}'
+    elif end == start + forward:
+        if occupied & (1 << end):
+            return f'{SQUARE_NAMES[end]} is not empty'
+    elif end == start + 2 * forward and SQUARE_RANKS[start] == (2 if turn == 'w' else 7):
+        if occupied & (1 << (start + forward) | 1 << end):
+            return f'the pawn on {SQUARE_NAMES[start]} is blocked'
+    else:
+        return f'the pawn on {SQUARE_NAMES[start]} can not move to {SQUARE_NAMES[end]}'
+
+    last_rank = SQUARE_RANKS[end] == (8 if turn == 'w' else 1)
+    if last_rank and not promotion_piece:
+        return 'a pawn reaching the last rank must promote'
+    if promotion_piece and not last_rank:
+        return 'a pawn can only promote on the last rank'
+
+    if is_en_passant and king_square is not None:
+        # Both pawns leave the rank at once, which can uncover an attack the pin masks do not see
+        captured_square = end - forward
+        occupied_after = occupied ^ (1 << start) ^ (1 << captured_square) | (1 << end)
+        enemy = 'b' if turn == 'w' else 'w'
+        if attackers(position, king_square, enemy, occupied_after) & ~(1 << captured_square):
+            return 'capturing en passant would leave the king in check'
+    return None
+
+def __piece_algebraic_notation(piece_type: str, algebraic_notation: str, FEN) -> Tuple[str, str, str]:
+    # The starting square of a knight, bishop, rook, queen or king is found with bitboards. Attacks are symmetric, so
+    # the pieces that can reach the ending square are the ones standing on a square attacked from the ending square
+    # by the same piece type.
+    #
+    # This can be done by:
+    # 1. Take the bitboard of the moving piece type and color and intersect it with the attacks from the ending square.
+    # 2. If ambiguous, the characters between the piece letter and the ending square (ignoring x) give the file and/or
+    #    rank of the starting square, intersect with their masks.
+    # 3. If still ambiguous, drop the pieces that are pinned to their king and would leave the pin line, SAN does not
+    #    disambiguate against those.
+    position = __as_position(FEN)
+    notation = algebraic_notation.rstrip('+#!?')
+
+    ending_square = notation[-2:]
+    ending_square_index = SQUARE_INDICES.get(ending_square)
+    if ending_square_index is None:
+        return None
+
+    piece = piece_type if position.turn == 'w' else piece_type.lower()
+    candidates = position.bitboards[piece] & piece_attacks(piece_type, ending_square_index, position.occupied())
+
+    if candidates & (candidates - 1):
+        for specifier in notation[1:-2]:
+            if specifier in FILE_MASKS:
+                candidates &= FILE_MASKS[specifier]
+            elif specifier in RANK_MASKS:
+                candidates &= RANK_MASKS[specifier]
+
+    if candidates & (candidates - 1):
+        pinned = candidates & __pinned_pieces(position)
+        if pinned:
+            king_square = lowest_square(position.bitboards['K' if position.turn == 'w' else 'k'])
+            for pinned_square in squares_of(pinned):
+                if not LINE[king_square][pinned_square] & (1 << ending_square_index):
+                    candidates ^= 1 << pinned_square
+
+    if not candidates:
+        return None
+    return (SQUARE_NAMES[lowest_square(candidates)], ending_square, '')
+
+def knight_algebraic_notation(algebraic_notation, FEN) -> Tuple[str, str, str]:
+    return __piece_algebraic_notation('N', algebraic_notation, FEN)
+
+def bishop_algebraic_notation(algebraic_notation, FEN) -> Tuple[str, str, str]:
+    return __piece_algebraic_notation('B', algebraic_notation, FEN)
+
+def rook_algebraic_notation(algebraic_notation, FEN) -> Tuple[str, str, str]:
+    return __piece_algebraic_notation('R', algebraic_notation, FEN)
+
+def queen_algebraic_notation(algebraic_notation, FEN) -> Tuple[str, str, str]:
+    return __piece_algebraic_notation('Q', algebraic_notation, FEN)
+
+def king_algebraic_notation(algebraic_notation, FEN) -> Tuple[str, str, str]:
+    return __piece_algebraic_notation('K', algebraic_notation, FEN)
+
+def convert_from_algebraic_notation(algebraic_notation: str, FEN: str | Position, cache: SANCache | None = SAN_CACHE) -> Tuple[str, str, str]:
+    """
+    Converts a move from algebraic notation to a tuple representing the starting and ending squares. Use this for
+    single moves.
+
+    Parameters:
+    ----------
+    algebraic_notation : str
+    The move in algebraic notation, e.g., 'e2e4', 'Nf3', 'O-O', etc.
+    FEN : str or Position
+    The FEN string or Position of the current board state, a Position is not modified.
+    cache : SANCache or None
+    The cache of moves already resolved in the same position (default is the shared SAN_CACHE), None to always resolve.
+
+    Returns:
+    -------
+    Tuple[str, str]
+    A tuple representing the starting and ending positions of the move in the format (starting_square, ending_square).
+    """
+    position = __as_position(FEN)
+    if cache is None:
+        return __resolve_algebraic_notation(algebraic_notation, position)
+
+    coordinates = cache.get(position.zobrist_hash, algebraic_notation)
+    if coordinates is None:
+        coordinates = __resolve_algebraic_notation(algebraic_notation, position)
+        if coordinates is not None:
+            cache.put(position.zobrist_hash, algebraic_notation, coordinates)
+    return coordinates
+
+def __resolve_algebraic_notation(algebraic_notation: str, FEN: Position) -> Tuple[str, str, str]:
+    """
+    Resolves a move from algebraic notation without going through a cache.
+    """
+    castling = True if 'O' in algebraic_notation else False
+    if castling: # Castling
+        return __castling_notation(algebraic_notation, FEN)    
+
+    else: # Not castling
+        piece_being_moved = algebraic_notation[0] if algebraic_notation[0] in {'K', 'Q', 'R', 'N', 'B'} else 'P'
+
+        match piece_being_moved:
+            case 'K':
+                return king_algebraic_notation(algebraic_notation, FEN)
+            case 'Q':
+                return queen_algebraic_notation(algebraic_notation, FEN)
+            case 'R':
+                return rook_algebraic_notation(algebraic_notation, FEN)
+            case 'N':
+                return knight_algebraic_notation(algebraic_notation, FEN)
+            case 'B':
+                return bishop_algebraic_notation(algebraic_notation, FEN)
+            case 'P':
+                return pawn_algebraic_notation(algebraic_notation, FEN)
+
+def process_move(move: str, FEN: str) -> Tuple[Tuple[str, str, str], str]:
+    """
+    Processes a single move in algebraic notation, converting it to coordinate notation and updating the FEN string.
+
+    Parameters:
+    ----------
+    move : str
+        The move in algebraic notation.
+    FEN : str
+        The current FEN string representing the board state.
+
+    Returns:
+    -------
+    Tuple[Tuple[str, str, str], str]
+        A tuple containing the move in coordinate notation and the updated FEN string.
+        If the move is invalid, returns (None, FEN).
+    """
+    position = Position(FEN)
+    coordinates = convert_from_algebraic_notation(move, position)
+    if coordinates is None:
+        print("Invalid notation/ impossible move")
+        return None, FEN
+    position.apply_move(coordinates)
+    return coordinates, position.to_FEN()
+
+def split_movetext(movetext: str) -> list[str]:
+    """
+    Returns the moves of the main line of a PGN movetext, without move numbers, comments, annotations,
+    side lines or the game result.
+
+    Parameters:
+    ----------
+    movetext : str
+        The movetext of a game, e.g., '1. e4 e5 2. Nf3 {A comment} (2. Bc4) Nc6 *'.
+
+    Returns:
+    -------
+    list[str]
+        The moves in algebraic notation, e.g., ['e4', 'e5', 'Nf3', 'Nc6'].
+    """
+    # Comments can contain anything, including brackets and things that look like moves, so drop them first
+    movetext = COMMENT_PATTERN.sub(' ', movetext)
+
+    moves = []
+    side_line_depth = 0
+    for string in movetext.replace('(', ' ( ').replace(')', ' ) ').split():
+        if string == '(':
+            side_line_depth += 1
+        elif string == ')':
+            side_line_depth -= 1
+        elif not side_line_depth:
+            string = string.rsplit('.', 1)[-1] # removes move numbers written without a space, e.g., 1.e4
+            if string and string[0].lower() in ALLOWED_START_OF_MOVES:
+                moves.append(string)
+    return moves
+
+def convert_from_movetext(movetext: str, FEN: str = DEFAULT_FEN, cache: SANCache | None = SAN_CACHE, strict: bool = False) -> list[Tuple[str, str, str]]:
+    """
+    Converts the movetext of a game to a list of tuples representing the starting and ending squares.
+
+    Parameters:
+    ----------
+    movetext : str
+        The movetext of a game, without the tag pairs.
+    FEN : str
+        The FEN string of the position the game starts from.
+    cache : SANCache or None
+        The cache of moves already resolved in the same position (default is the shared SAN_CACHE), None to always resolve.
+    strict : bool
+        If True every move is checked for legality and the first bad move raises, see convert_moves(). Otherwise the
+        error is printed and the moves before it are returned (default is False).
+
+    Returns:
+    -------
+    list[Tuple[str, str, str]]
+        A list of tuples, each representing the starting square, ending square and promotion piece of a move.
+    """
+    game_in_coordinate_notation = []
+    try:
+        convert_moves(split_movetext(movetext), FEN, game_in_coordinate_notation, cache, strict)
+    except NotationError as error:
+        if strict:
+            raise
+        print(error)
+    return game_in_coordinate_notation
+
+def convert_moves(moves: list[str], FEN: str, game_in_coordinate_notation: list, cache: SANCache | None = SAN_CACHE, strict: bool = False) -> None:
+    """
+    Converts moves in algebraic notation one after the other, appending each converted move to a list.
+
+    Parameters:
+    ----------
+    moves : list[str]
+        The moves in algebraic notation, e.g., ['e4', 'e5', 'Nf3'].
+    FEN : str
+        The FEN string of the position the moves start from.
+    game_in_coordinate_notation : list
+        The list the converted moves are appended to, it holds every move before the failing one if an error is raised.
+    cache : SANCache or None
+        The cache of moves already resolved in the same position (default is the shared SAN_CACHE), None to always resolve.
+    strict : bool
+        If True every move is also checked with illegal_move_reason() (default is False).
+
+    Raises:
+    ------
+    NotationError
+        If a move can not be converted.
+    IllegalMoveError
+        In strict mode, if a move is illegal or ambiguous.
+    """
+    position = Position(FEN)
+    for ply, move in enumerate(moves):
+        try:
+            coordinates = convert_from_algebraic_notation(move, position, cache)
+        except (IndexError, KeyError, ValueError):
+            coordinates = None
+        if coordinates is None:
+            raise NotationError(f"Invalid notation/ impossible move {move} at ply {ply}", ply, move)
+        if strict:
+            reason = illegal_move_reason(position, move, coordinates)
+            if reason is not None:
+                raise IllegalMoveError(f"Illegal move {move} at ply {ply}: {reason}", ply, move, reason)
+        try:
+            position.apply_move(coordinates)
+        except ValueError:
+            raise NotationError(f"Invalid notation/ impossible move {move} at ply {ply}", ply, move) from None
+        game_in_coordinate_notation.append(coordinates)
+
+def convert_from_PGN(PGN: str, FEN: str = DEFAULT_FEN, cache: SANCache | None = SAN_CACHE, strict: bool = False) -> list[Tuple[str, str, str]]:
+    """
+    Converts a game in PGN (Portable Game Notation) format to a list of tuples representing the starting and ending squares.
+    Use this for entire game.
+
+    Parameters:
+    ----------
+    PGN : str
+        A single game in PGN format, the tag pairs are optional.
+    FEN : str
+        The FEN string of the position the game starts from.
+    cache : SANCache or None
+        The cache of moves already resolved in the same position (default is the shared SAN_CACHE), None to always resolve.
+    strict : bool
+        If True every move is checked for legality and an illegal or ambiguous move raises IllegalMoveError, with
+        the ply of the move (default is False).
+
+    Returns:
+    -------
+    list[Tuple[str, str, str]]
+        A list of tuples, each representing the starting square, ending square and promotion piece of a move.
+    """
+    # Tag pairs are on their own lines, everything else is movetext
+    movetext = '\n'.join(line for line in PGN.splitlines() if not line.lstrip().startswith('['))
+    return convert_from_movetext(movetext, FEN, cache, strict)
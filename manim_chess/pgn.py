@@ -0,0 +1,228 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterable, Iterator, NamedTuple, Tuple
+
+from .notation import convert_moves, split_movetext, NotationError
+from .position import DEFAULT_FEN, encode_move, decode_move
+from .game import Game
+
+TAG_PATTERN = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+
+# Magic bytes at the start of compressed files and the module that opens them
+COMPRESSION_FORMATS = [
+    (b'\x1f\x8b', gzip),
+    (b'BZh', bz2),
+    (b'\xfd7zXZ\x00', lzma),
+]
+
+class PGNGame(NamedTuple):
+    """
+    A single game read from a PGN file.
+
+    Attributes:
+    ----------
+    headers : dict
+        A dictionary mapping tag names (e.g., 'White') to their values.
+    movetext : str
+        The movetext of the game, without the tag pairs.
+    moves : list[Tuple[str, str, str]]
+        The moves converted to coordinate notation, empty if the reader was told not to convert.
+    """
+    headers: dict
+    movetext: str
+    moves: list[Tuple[str, str, str]]
+
+def __open_source(source) -> IO[str]:
+    """
+    Opens a path or file object as a text stream, decompressing gzip, bz2 and xz data.
+
+    Parameters:
+    ----------
+    source : str, os.PathLike or file object
+        The PGN file to read.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = open(source, 'rb')
+    elif isinstance(source, io.TextIOBase):
+        return source
+
+    # Binary streams are checked for compression by peeking at the first bytes
+    if hasattr(source, 'peek'):
+        start = source.peek(6)[:6]
+    elif source.seekable():
+        start = source.read(6)
+        source.seek(-len(start), io.SEEK_CUR)
+    else:
+        source = io.BufferedReader(source)
+        start = source.peek(6)[:6]
+    for magic, module in COMPRESSION_FORMATS:
+        if start.startswith(magic):
+            source = module.open(source, 'rb')
+            break
+    return io.TextIOWrapper(source, encoding='utf-8', errors='replace')
+
+def __build_game(header_lines: list[str], movetext_lines: list[str], FEN: str, convert: bool) -> PGNGame:
+    """
+    Builds a PGNGame from the lines of a game, converting its moves if asked to. A game that fails to convert, e.g.,
+    with a broken FEN tag, has the moves before the error, so one bad game does not stop the reader.
+    """
+    headers = dict(TAG_PATTERN.findall(''.join(header_lines)))
+    movetext = ''.join(movetext_lines)
+    moves = []
+    if convert:
+        try:
+            convert_moves(split_movetext(movetext), headers.get('FEN', FEN), moves)
+        except NotationError as notation_error:
+            print(notation_error)
+        except Exception as unexpected_error:
+            print(f'{type(unexpected_error).__name__}: {unexpected_error}')
+    return PGNGame(headers, movetext, moves)
+
+def read_games(source, FEN: str = DEFAULT_FEN, convert: bool = True) -> Iterator[PGNGame]:
+    """
+    Reads the games of a PGN file one at a time. Only the game being read is kept in memory, so this works for
+    databases of any size.
+
+    Parameters:
+    ----------
+    source : str, os.PathLike or file object
+        The path or open file (text or binary) of the PGN file. gzip, bz2 and xz compressed files are detected automatically.
+    FEN : str
+        The FEN string of the position the games start from, unless a game has its own FEN tag.
+    convert : bool
+        If False the moves are not converted and PGNGame.moves is empty, useful to only scan the headers.
+
+    Returns:
+    -------
+    Iterator[PGNGame]
+        The games in file order.
+    """
+    stream = __open_source(source)
+    try:
+        header_lines = []
+        movetext_lines = []
+        for line in stream:
+            stripped_line = line.strip()
+            if stripped_line.startswith('['):
+                # A tag pair after movetext is the start of the next game
+                if movetext_lines:
+                    yield __build_game(header_lines, movetext_lines, FEN, convert)
+                    header_lines = []
+                    movetext_lines = []
+                header_lines.append(stripped_line)
+            elif stripped_line:
+                movetext_lines.append(line)
+        if header_lines or movetext_lines:
+            yield __build_game(header_lines, movetext_lines, FEN, convert)
+    finally:
+        if isinstance(source, (str, os.PathLike)):
+            stream.close()
+        elif stream is not source:
+            # Leave the caller's file open
+            stream.detach()
+
+class ConversionResult(NamedTuple):
+    """
+    The result of converting one game with convert_many().
+
+    Moves are stored as 16 bit ints (see encode_move()) in a bytes object, which is much cheaper to send
+    between processes than a list of string tuples.
+
+    Attributes:
+    ----------
+    encoded_moves : bytes
+        The converted moves as an array of unsigned 16 bit ints, up to the failing move if there was an error.
+    error : str or None
+        The error message if a move could not be converted, None otherwise.
+    error_ply : int or None
+        The index of the move that could not be converted, None if there was no error.
+    """
+    encoded_moves: bytes
+    error: str | None
+    error_ply: int | None
+
+    def moves(self) -> list[Tuple[str, str, str]]:
+        """
+        Returns the converted moves in coordinate notation, as used by play_game().
+        """
+        encoded_moves = array('H')
+        encoded_moves.frombytes(self.encoded_moves)
+        return [decode_move(encoded_move) for encoded_move in encoded_moves]
+
+    def game(self, FEN: str = DEFAULT_FEN) -> Game:
+        """
+        Returns the converted moves as a Game, without decoding them.
+
+        Parameters:
+        ----------
+        FEN : str
+            The FEN string of the position the game starts from.
+        """
+        return Game.from_encoded(self.encoded_moves, FEN)
+
+def __convert_for_batch(job: Tuple[str, str, bool]) -> ConversionResult:
+    """
+    Converts the movetext of one game, catching any error so one bad game does not stop the batch.
+    """
+    movetext, FEN, strict = job
+    game_in_coordinate_notation = []
+    error = None
+    error_ply = None
+    try:
+        convert_moves(split_movetext(movetext), FEN, game_in_coordinate_notation, strict=strict)
+    except NotationError as notation_error:
+        error, error_ply = str(notation_error), notation_error.ply
+    except Exception as unexpected_error:
+        error, error_ply = f'{type(unexpected_error).__name__}: {unexpected_error}', len(game_in_coordinate_notation)
+    encoded_moves = array('H', [encode_move(move) for move in game_in_coordinate_notation])
+    return ConversionResult(encoded_moves.tobytes(), error, error_ply)
+
+def __batch_jobs(pgns_or_paths: Iterable, FEN: str, strict: bool) -> Iterator[Tuple[str, str, bool]]:
+    """
+    Yields the (movetext, FEN, strict) of every game of every PGN string or file, in order.
+    """
+    for pgn_or_path in pgns_or_paths:
+        if isinstance(pgn_or_path, str) and '\n' not in pgn_or_path and os.path.isfile(pgn_or_path):
+            source = pgn_or_path
+        elif isinstance(pgn_or_path, str):
+            source = io.StringIO(pgn_or_path)
+        else:
+            source = pgn_or_path
+        for game in read_games(source, FEN, convert=False):
+            yield game.movetext, game.headers.get('FEN', FEN), strict
+
+def convert_many(pgns_or_paths: Iterable, workers: int = None, chunksize: int = 16, FEN: str = DEFAULT_FEN, strict: bool = False) -> list[ConversionResult]:
+    """
+    Converts many games at once, spread over a pool of processes.
+
+    Parameters:
+    ----------
+    pgns_or_paths : Iterable
+        PGN strings, paths of PGN files or open PGN files. Each one can hold any number of games.
+    workers : int, optional
+        The number of processes to use (default is the number of CPUs). With 1 the games are converted in this process.
+    chunksize : int, optional
+        The number of games sent to a process at a time (default is 16).
+    FEN : str
+        The FEN string of the position the games start from, unless a game has its own FEN tag.
+    strict : bool
+        If True every move is checked for legality, so illegal and ambiguous moves are errors too (default is False).
+        Use this to reject corrupt games before rendering them.
+
+    Returns:
+    -------
+    list[ConversionResult]
+        One result per game, in the order the games were given. A game that fails to convert has its error and
+        the moves before the error, the other games are not affected.
+    """
+    jobs = __batch_jobs(pgns_or_paths, FEN, strict)
+    if workers == 1:
+        return [__convert_for_batch(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(__convert_for_batch, jobs, chunksize=chunksize))
@@ -0,0 +1,386 @@
+import io
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+from .pgn import PGNGame, read_games
+from .position import DEFAULT_FEN
+
+# A tag pair at the start of a line, e.g., [White "Kasparov, Garry"]
+TAG_LINE_PATTERN = re.compile(rb'^[ \t]*\[\s*(\w+)\s+"((?:[^"\\\r\n]|\\.)*)"\s*\]', re.MULTILINE)
+NON_WHITESPACE_PATTERN = re.compile(rb'\S')
+
+# Index files start with this, followed by the format version
+INDEX_MAGIC = b'MCPGNIDX'
+INDEX_VERSION = 1
+
+RESULTS = ['*', '1-0', '0-1', '1/2-1/2']
+# Stored in the eco column when a game has no (valid) ECO tag
+UNKNOWN_ECO = 0xFFFF
+
+# The columns saved in an index file and their array type codes, in file order
+COLUMNS = [
+    ('offsets', 'Q'),
+    ('lengths', 'L'),
+    ('white', 'L'),
+    ('black', 'L'),
+    ('white_elo', 'H'),
+    ('black_elo', 'H'),
+    ('eco', 'H'),
+    ('date', 'L'),
+    ('result', 'B'),
+]
+
+def encode_eco(eco: str) -> int:
+    """
+    Encodes an ECO code (e.g., 'B07') as an int, the letter times 100 plus the number.
+
+    Parameters:
+    ----------
+    eco : str
+        The ECO code, A00 to E99.
+
+    Returns:
+    -------
+    int
+        The encoded code, UNKNOWN_ECO if it is not a valid ECO code.
+    """
+    if len(eco) != 3 or eco[0] not in 'ABCDE' or not eco[1:].isdigit():
+        return UNKNOWN_ECO
+    return 'ABCDE'.index(eco[0]) * 100 + int(eco[1:])
+
+def decode_eco(code: int) -> str:
+    """
+    Returns the ECO code encoded with encode_eco(), '?' if unknown.
+    """
+    return '?' if code == UNKNOWN_ECO else f'{"ABCDE"[code // 100]}{code % 100:02}'
+
+def encode_date(date: str) -> int:
+    """
+    Encodes a PGN date (e.g., '1999.01.20') as the int YYYYMMDD, unknown parts ('??') are 0.
+
+    Parameters:
+    ----------
+    date : str
+        The date in PGN form. Only the year (e.g., '1999') is also accepted.
+
+    Returns:
+    -------
+    int
+        The encoded date, 0 if the year is unknown.
+    """
+    encoded_date = 0
+    for part, size in zip((date.split('.') + ['', ''])[:3], (4, 2, 2)):
+        encoded_date = encoded_date * 10 ** size + (int(part) if part.isdigit() and len(part) == size else 0)
+    return encoded_date
+
+def _parse_rating(rating: str) -> int:
+    """
+    Returns a rating tag as an int, 0 if it is unknown or out of range.
+    """
+    return int(rating) if rating.isdigit() and int(rating) < 0x10000 else 0
+
+def index_path(path: str | os.PathLike) -> str:
+    """
+    Returns the path of the index file saved next to a PGN file.
+    """
+    return os.fspath(path) + '.index'
+
+class PGNIndex:
+    """
+    An index of the games of an uncompressed PGN file: where each game is in the file and its main tag pairs.
+
+    The file is scanned once through mmap, reading only the tag pair lines, and the index is saved next to it
+    (see index_path()). The tags are kept in compact columns, so games can be selected without parsing any movetext,
+    and only the selected games are read and converted.
+
+    Attributes:
+    ----------
+    path : str
+        The path of the PGN file.
+    offsets : array.array
+        The byte offset of each game in the file.
+    lengths : array.array
+        The length in bytes of each game.
+    names : list[str]
+        The player names, the white and black columns hold indices into this list ('?' when unknown).
+    white, black : array.array
+        The index of each player's name in names.
+    white_elo, black_elo : array.array
+        The rating of each player, 0 when unknown.
+    eco : array.array
+        The ECO code of each game encoded with encode_eco(), UNKNOWN_ECO when unknown.
+    date : array.array
+        The date of each game encoded with encode_date(), 0 when unknown.
+    result : array.array
+        The index of the result of each game in RESULTS.
+
+    Methods:
+    -------
+    open(path, rebuild):
+        Loads the index saved next to a PGN file, building and saving it if it is missing or out of date.
+    build(path):
+        Scans a PGN file and returns its index.
+    save(path):
+        Saves the index.
+    select(...):
+        Returns the games matching a query.
+    read_PGN(game):
+        Returns the text of a game.
+    read_game(game, FEN, convert):
+        Reads and converts a game.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+        Initializes an empty PGNIndex object. Use open() or build() instead.
+
+        Parameters:
+        ----------
+        path : str or os.PathLike
+            The path of the PGN file.
+        """
+        self.path = os.fspath(path)
+        self.names = ['?']
+        self.__name_indices = {'?': 0}
+        for name, typecode in COLUMNS:
+            setattr(self, name, array(typecode))
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, rebuild: bool = False) -> 'PGNIndex':
+        """
+        Loads the index saved next to a PGN file, building and saving it if it is missing, was made for a different
+        version of the file or in another format.
+
+        Parameters:
+        ----------
+        path : str or os.PathLike
+            The path of the PGN file.
+        rebuild : bool, optional
+            If True the index is always built again (default is False).
+
+        Returns:
+        -------
+        PGNIndex
+            The index.
+        """
+        if not rebuild:
+            index = cls.__load(path)
+            if index is not None:
+                return index
+        index = cls.build(path)
+        index.save()
+        return index
+
+    @classmethod
+    def build(cls, path: str | os.PathLike) -> 'PGNIndex':
+        """
+        Scans a PGN file and returns its index. Only the tag pair lines are parsed, the movetext is skipped.
+
+        Parameters:
+        ----------
+        path : str or os.PathLike
+            The path of the PGN file, which must not be compressed.
+
+        Returns:
+        -------
+        PGNIndex
+            The index, not saved yet.
+        """
+        index = cls(path)
+        with open(index.path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return index
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                index.__scan(data)
+        return index
+
+    def __scan(self, data: mmap.mmap) -> None:
+        """
+        Adds every game of the mapped file. A game starts at the first tag pair after the movetext of the previous one.
+        """
+        start = 0
+        tags = {}
+        last_tag_end = 0
+        for match in TAG_LINE_PATTERN.finditer(data):
+            # Anything but whitespace since the last tag pair is movetext, so this tag pair starts a new game
+            if NON_WHITESPACE_PATTERN.search(data, last_tag_end, match.start()):
+                self.__add_game(start, match.start() - start, tags)
+                start = match.start()
+                tags = {}
+            tags[match.group(1)] = match.group(2)
+            last_tag_end = match.end()
+        if tags or NON_WHITESPACE_PATTERN.search(data, start):
+            self.__add_game(start, len(data) - start, tags)
+
+    def __name_index(self, name: bytes | None) -> int:
+        """
+        Returns the index of a player name in names, adding it if it is new.
+        """
+        name = name.decode('utf-8', errors='replace') if name else '?'
+        name_index = self.__name_indices.get(name)
+        if name_index is None:
+            name_index = self.__name_indices[name] = len(self.names)
+            self.names.append(name)
+        return name_index
+
+    def __add_game(self, offset: int, length: int, tags: dict) -> None:
+        """
+        Appends a game to the columns.
+        """
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.white.append(self.__name_index(tags.get(b'White')))
+        self.black.append(self.__name_index(tags.get(b'Black')))
+        self.white_elo.append(_parse_rating(tags.get(b'WhiteElo', b'').decode('ascii', errors='replace')))
+        self.black_elo.append(_parse_rating(tags.get(b'BlackElo', b'').decode('ascii', errors='replace')))
+        self.eco.append(encode_eco(tags.get(b'ECO', b'').decode('ascii', errors='replace')))
+        self.date.append(encode_date(tags.get(b'Date', b'').decode('ascii', errors='replace')))
+        result = tags.get(b'Result', b'*').decode('ascii', errors='replace')
+        self.result.append(RESULTS.index(result) if result in RESULTS else 0)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def save(self, path: str | os.PathLike = None) -> None:
+        """
+        Saves the index, with the size and modification time of the PGN file so a changed file is indexed again.
+
+        Parameters:
+        ----------
+        path : str or os.PathLike, optional
+            The path of the index file (default is index_path() of the PGN file).
+        """
+        stat = os.stat(self.path)
+        header = json.dumps({
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns,
+            'byteorder': sys.byteorder,
+            'count': len(self),
+            'names': self.names,
+        }).encode()
+        path = index_path(self.path) if path is None else os.fspath(path)
+        # Written to a temporary file first, so a crash never leaves a broken index behind
+        with open(path + '.tmp', 'wb') as file:
+            file.write(INDEX_MAGIC + struct.pack('<II', INDEX_VERSION, len(header)) + header)
+            for name, _ in COLUMNS:
+                getattr(self, name).tofile(file)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def __load(cls, path: str | os.PathLike) -> 'PGNIndex | None':
+        """
+        Loads the index saved next to a PGN file, None if it is missing or out of date.
+        """
+        index = cls(path)
+        try:
+            stat = os.stat(index.path)
+            with open(index_path(index.path), 'rb') as file:
+                start = file.read(len(INDEX_MAGIC) + 8)
+                if start[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+                    return None
+                version, header_length = struct.unpack('<II', start[len(INDEX_MAGIC):])
+                if version != INDEX_VERSION:
+                    return None
+                header = json.loads(file.read(header_length))
+                if (header['source_size'], header['source_mtime_ns'], header['byteorder']) != (stat.st_size, stat.st_mtime_ns, sys.byteorder):
+                    return None
+                for name, _ in COLUMNS:
+                    getattr(index, name).fromfile(file, header['count'])
+        except (OSError, EOFError, ValueError, KeyError, struct.error):
+            return None
+        index.names = header['names']
+        index.__name_indices = {name: name_index for name_index, name in enumerate(index.names)}
+        return index
+
+    def select(self, eco: str = None, min_elo: int = None, player: str = None, white: str = None, black: str = None,
+               result: str = None, date_from: str = None, date_to: str = None) -> list[int]:
+        """
+        Returns the games matching every given condition, using only the index.
+
+        Parameters:
+        ----------
+        eco : str, optional
+            An ECO code (e.g., 'B07') or the start of one (e.g., 'B0' for B00 to B09, 'B' for every B code),
+            anything else raises ValueError.
+        min_elo : int, optional
+            The minimum rating of both players.
+        player : str, optional
+            The name of a player with either color, as written in the tags.
+        white, black : str, optional
+            The name of the player with that color.
+        result : str, optional
+            The result, one of RESULTS.
+        date_from, date_to : str, optional
+            The first and last dates included, in PGN form (e.g., '1999.01.20' or only the year '1999'). Games
+            without a date never match.
+
+        Returns:
+        -------
+        list[int]
+            The numbers of the matching games, in file order. Use offsets[game] and lengths[game] to find them in the file.
+        """
+        games = range(len(self))
+        if eco is not None:
+            first_code = encode_eco(eco.ljust(3, '0'))
+            last_code = encode_eco(eco.ljust(3, '9'))
+            if UNKNOWN_ECO in (first_code, last_code):
+                raise ValueError(f"{eco!r} is not an ECO code or the start of one")
+            games = [game for game in games if first_code <= self.eco[game] <= last_code]
+        if min_elo is not None:
+            games = [game for game in games if self.white_elo[game] >= min_elo and self.black_elo[game] >= min_elo]
+        for name, columns in ((player, (self.white, self.black)), (white, (self.white,)), (black, (self.black,))):
+            if name is not None:
+                name_index = self.__name_indices.get(name, -1)
+                games = [game for game in games if any(column[game] == name_index for column in columns)]
+        if result is not None:
+            result_index = RESULTS.index(result)
+            games = [game for game in games if self.result[game] == result_index]
+        if date_from is not None:
+            first_date = encode_date(date_from)
+            games = [game for game in games if self.date[game] >= first_date]
+        if date_to is not None:
+            # Missing parts of the last date include the whole year or month
+            last_date = encode_date(date_to)
+            last_date += 9999 if last_date % 10000 == 0 else 99 if last_date % 100 == 0 else 0
+            games = [game for game in games if 0 < self.date[game] <= last_date]
+        return list(games)
+
+    def read_PGN(self, game: int) -> str:
+        """
+        Returns the text of a game, tag pairs and movetext, read straight from its offset in the file.
+        """
+        with open(self.path, 'rb') as file:
+            file.seek(self.offsets[game])
+            return file.read(self.lengths[game]).decode('utf-8', errors='replace')
+
+    def read_game(self, game: int, FEN: str = DEFAULT_FEN, convert: bool = True) -> PGNGame:
+        """
+        Reads a game and converts its moves, see read_games().
+
+        Parameters:
+        ----------
+        game : int
+            The number of the game in the index.
+        FEN : str
+            The FEN string of the position the game starts from, unless it has its own FEN tag.
+        convert : bool
+            If False the moves are not converted.
+
+        Returns:
+        -------
+        PGNGame
+            The game.
+        """
+        return next(read_games(io.StringIO(self.read_PGN(game)), FEN, convert))
+
+    def read_games(self, games: Iterable[int], FEN: str = DEFAULT_FEN, convert: bool = True) -> list[PGNGame]:
+        """
+        Reads and converts some games, e.g., the result of select().
+        """
+        return [self.read_game(game, FEN, convert) for game in games]
@@ -1,12 +1,46 @@
 import os
 from manim import *
 
-class Pawn(Mobject):
+# Parsed piece SVGs shared by every piece in the process, keyed by (piece_type, is_white, piece_size)
+_PIECE_TEMPLATES = {}
+
+def get_piece_template(piece_type: str, is_white: bool, piece_size: float = 1.1) -> SVGMobject:
     """
-    A class to represent a Pawn chess piece using Manim for visualization.
+    Returns the shared SVG template of a piece, parsing the SVG file only the first time it is requested.
+
+    The template must not be added to a scene or modified, pieces add a copy of it instead.
+
+    Parameters:
+    ----------
+    piece_type : str
+        The type of the piece (e.g., 'P' for Pawn).
+    is_white : bool
+        Indicates if the piece is white.
+    piece_size : float, optional
+        The size of the piece (default is 1.1).
+
+    Returns:
+    -------
+    SVGMobject
+        The scaled SVG of the piece.
+    """
+    key = (piece_type, is_white, piece_size)
+    template = _PIECE_TEMPLATES.get(key)
+    if template is None:
+        svg_name = f'{"w" if is_white else "b"}{piece_type}.svg'
+        svg_path = os.path.join(os.path.dirname(__file__), 'piece_svgs', svg_name)
+        template = SVGMobject(svg_path).scale(piece_size / 4)
+        _PIECE_TEMPLATES[key] = template
+    return template
+
+class ChessPiece(Mobject):
+    """
+    A base class to represent a chess piece using Manim for visualization.
 
     Attributes:
     ----------
+    piece_type : str
+        The letter of the piece type (e.g., 'P' for Pawn), set by each subclass.
     piece_size : float
         The size of the chess piece.
     is_white : bool
@@ -15,232 +49,83 @@ class Pawn(Mobject):
     Methods:
     -------
     create_svg():
-        Creates and adds the SVG representation of the pawn to the Mobject.
+        Adds a copy of the shared SVG template of the piece to the Mobject.
+    restore_style():
+        Restores the colors and opacity of the piece, e.g. after it was faded out.
     """
+    piece_type = None
+
     def __init__(self, is_white: bool, piece_size=1.1) -> None:
         """
-        Initializes the Pawn object with specified color and size.
+        Initializes the piece with specified color and size.
 
         Parameters:
         ----------
         is_white : bool
-            Indicates if the pawn is white.
+            Indicates if the piece is white.
         piece_size : float, optional
-            The size of the pawn (default is 1.1).
+            The size of the piece (default is 1.1).
         """
         super().__init__()
         self.piece_size = piece_size
         self.is_white = is_white
         self.create_svg()
 
-    def create_svg(self) -> SVGMobject:
+    def create_svg(self) -> None:
         """
-        Creates the SVG representation of the pawn and adds it to the Mobject.
+        Adds a copy of the shared SVG template of the piece to the Mobject.
         """
-        svg_path = os.path.join(os.path.dirname(__file__), 'piece_svgs', 'wP.svg' if self.is_white else 'bP.svg')
-        self.add(SVGMobject(svg_path).scale(self.piece_size / 4))
-
-class Knight(Mobject):
-    """
-    A class to represent a Knight chess piece using Manim for visualization.
-
-    Attributes:
-    ----------
-    piece_size : float
-        The size of the chess piece.
+        self.add(get_piece_template(self.piece_type, self.is_white, self.piece_size).copy())
 
-    Methods:
-    -------
-    create_svg(is_white):
-        Creates and adds the SVG representation of the knight to the Mobject.
-    """
-    def __init__(self, is_white: bool, piece_size=1.1) -> None:
+    def restore_style(self) -> None:
         """
-        Initializes the Knight object with specified color and size.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the knight is white.
-        piece_size : float, optional
-            The size of the knight (default is 1.1).
+        Restores the colors and opacity of the piece from its template, e.g. after it was faded out, without
+        copying the template again.
         """
-        super().__init__()
-        self.piece_size = piece_size
-        self.create_svg(is_white)
+        self.submobjects[0].match_style(get_piece_template(self.piece_type, self.is_white, self.piece_size))
 
-    def create_svg(self, is_white: bool) -> SVGMobject:
-        """
-        Creates the SVG representation of the knight and adds it to the Mobject.
+class Pawn(ChessPiece):
+    """
+    A class to represent a Pawn chess piece using Manim for visualization.
+    """
+    piece_type = 'P'
 
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the knight is white.
-        """
-        svg_path = os.path.join(os.path.dirname(__file__), 'piece_svgs', 'wN.svg' if is_white else 'bN.svg')
-        self.add(SVGMobject(svg_path).scale(self.piece_size / 4))
+class Knight(ChessPiece):
+    """
+    A class to represent a Knight chess piece using Manim for visualization.
+    """
+    piece_type = 'N'
 
-class Bishop(Mobject):
+class Bishop(ChessPiece):
     """
     A class to represent a Bishop chess piece using Manim for visualization.
-
-    Attributes:
-    ----------
-    piece_size : float
-        The size of the chess piece.
-
-    Methods:
-    -------
-    create_svg(is_white):
-        Creates and adds the SVG representation of the bishop to the Mobject.
     """
-    def __init__(self, is_white: bool, piece_size=1.1) -> None:
-        """
-        Initializes the Bishop object with specified color and size.
+    piece_type = 'B'
 
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the bishop is white.
-        piece_size : float, optional
-            The size of the bishop (default is 1.1).
-        """
-        super().__init__()
-        self.piece_size = piece_size
-        self.create_svg(is_white)
-
-    def create_svg(self, is_white: bool) -> SVGMobject:
-        """
-        Creates the SVG representation of the bishop and adds it to the Mobject.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the bishop is white.
-        """
-        svg_path = os.path.join(os.path.dirname(__file__), 'piece_svgs', 'wB.svg' if is_white else 'bB.svg')
-        self.add(SVGMobject(svg_path).scale(self.piece_size / 4))
-
-class Rook(Mobject):
+class Rook(ChessPiece):
     """
     A class to represent a Rook chess piece using Manim for visualization.
-
-    Attributes:
-    ----------
-    piece_size : float
-        The size of the chess piece.
-
-    Methods:
-    -------
-    create_svg(is_white):
-        Creates and adds the SVG representation of the rook to the Mobject.
     """
-    def __init__(self, is_white: bool, piece_size=1.1) -> None:
-        """
-        Initializes the Rook object with specified color and size.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the rook is white.
-        piece_size : float, optional
-            The size of the rook (default is 1.1).
-        """
-        super().__init__()
-        self.piece_size = piece_size
-        self.create_svg(is_white)
+    piece_type = 'R'
 
-    def create_svg(self, is_white: bool) -> SVGMobject:
-        """
-        Creates the SVG representation of the rook and adds it to the Mobject.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the rook is white.
-        """
-        svg_path = os.path.join(os.path.dirname(__file__), 'piece_svgs', 'wR.svg' if is_white else 'bR.svg')
-        self.add(SVGMobject(svg_path).scale(self.piece_size / 4))
-
-class Queen(Mobject):
+class Queen(ChessPiece):
     """
     A class to represent a Queen chess piece using Manim for visualization.
-
-    Attributes:
-    ----------
-    piece_size : float
-        The size of the chess piece.
-
-    Methods:
-    -------
-    create_svg(is_white):
-        Creates and adds the SVG representation of the queen to the Mobject.
     """
-    def __init__(self, is_white: bool, piece_size=1.1) -> None:
-        """
-        Initializes the Queen object with specified color and size.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the queen is white.
-        piece_size : float, optional
-            The size of the queen (default is 1.1).
-        """
-        super().__init__()
-        self.piece_size = piece_size
-        self.create_svg(is_white)
-
-    def create_svg(self, is_white: bool) -> SVGMobject:
-        """
-        Creates the SVG representation of the queen and adds it to the Mobject.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the queen is white.
-        """
-        svg_path = os.path.join(os.path.dirname(__file__), 'piece_svgs', 'wQ.svg' if is_white else 'bQ.svg')
-        self.add(SVGMobject(svg_path).scale(self.piece_size / 4))
+    piece_type = 'Q'
 
-class King(Mobject):
+class King(ChessPiece):
     """
     A class to represent a King chess piece using Manim for visualization.
-
-    Attributes:
-    ----------
-    piece_size : float
-        The size of the chess piece.
-
-    Methods:
-    -------
-    create_svg(is_white):
-        Creates and adds the SVG representation of the king to the Mobject.
     """
-    def __init__(self, is_white: bool, piece_size=1.1) -> None:
-        """
-        Initializes the King object with specified color and size.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the king is white.
-        piece_size : float, optional
-            The size of the king (default is 1.1).
-        """
-        super().__init__()
-        self.piece_size = piece_size
-        self.create_svg(is_white)
-
-    def create_svg(self, is_white: bool) -> SVGMobject:
-        """
-        Creates the SVG representation of the king and adds it to the Mobject.
-
-        Parameters:
-        ----------
-        is_white : bool
-            Indicates if the king is white.
-        """
-        svg_path = os.path.join(os.path.dirname(__file__), 'piece_svgs', 'wK.svg' if is_white else 'bK.svg')
-        self.add(SVGMobject(svg_path).scale(self.piece_size / 4))
\ No newline at end of file
+    piece_type = 'K'
+
+# The piece class of each piece type letter
+PIECE_CLASSES = {
+    'P': Pawn,
+    'N': Knight,
+    'B': Bishop,
+    'R': Rook,
+    'Q': Queen,
+    'K': King,
+}
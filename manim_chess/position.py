@@ -0,0 +1,369 @@
+from typing import Tuple
+from .bitboard import squares_of, lowest_square, piece_attacks
+from .tables import SQUARE_NAMES, SQUARE_INDICES, PAWN_ATTACKS, ZOBRIST_PIECES, ZOBRIST_BLACK_TO_MOVE, ZOBRIST_CASTLING, ZOBRIST_EN_PASSANT
+
+DEFAULT_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+# The castling right lost when a piece leaves or is captured on each corner/king square
+CASTLING_RIGHTS_LOST = {
+    SQUARE_INDICES['a1']: 'Q',
+    SQUARE_INDICES['h1']: 'K',
+    SQUARE_INDICES['e1']: 'KQ',
+    SQUARE_INDICES['a8']: 'q',
+    SQUARE_INDICES['h8']: 'k',
+    SQUARE_INDICES['e8']: 'kq',
+}
+
+# Promotion pieces stored in the top bits of an encoded move, 0 means no promotion
+PROMOTION_PIECES = ['', 'N', 'B', 'R', 'Q']
+
+def encode_move(move: Tuple[str, str, str]) -> int:
+    """
+    Encodes a move in coordinate notation as a 16 bit int: starting square in bits 0-5, ending square in
+    bits 6-11 and promotion piece in bits 12-14.
+
+    Parameters:
+    ----------
+    move : Tuple[str, str, str]
+        The starting square, ending square and promotion piece ('' if not promoting).
+
+    Returns:
+    -------
+    int
+        The encoded move.
+    """
+    starting_square, ending_square, promotion_piece = move
+    return SQUARE_INDICES[starting_square] | SQUARE_INDICES[ending_square] << 6 | PROMOTION_PIECES.index(promotion_piece.upper()) << 12
+
+def decode_move(encoded_move: int) -> Tuple[str, str, str]:
+    """
+    Decodes a move encoded with encode_move().
+
+    Parameters:
+    ----------
+    encoded_move : int
+        The encoded move.
+
+    Returns:
+    -------
+    Tuple[str, str, str]
+        The starting square, ending square and promotion piece ('' if not promoting).
+    """
+    return (SQUARE_NAMES[encoded_move & 63], SQUARE_NAMES[encoded_move >> 6 & 63], PROMOTION_PIECES[encoded_move >> 12])
+
+class Position:
+    """
+    A class to represent a chess position as a flat 64 entry array, without any Manim objects.
+
+    Moves are applied in place, the FEN string is only built when asked for with to_FEN().
+
+    Attributes:
+    ----------
+    board : list
+        64 entries in FEN order (index 0 is a8, index 63 is h1), each a FEN piece letter or '' if empty.
+    bitboards : dict
+        A dictionary mapping each FEN piece letter to the bitboard of the squares it is on.
+    occupancy : dict
+        A dictionary mapping 'w' and 'b' to the bitboard of the squares occupied by that side.
+    turn : str
+        The side to move, 'w' or 'b'.
+    castling : str
+        The remaining castling rights in FEN form (e.g., 'KQkq' or '-').
+    en_passant : str
+        The en passant target square (e.g., 'e3') or '-'.
+    halfmove_clock : int
+        The number of halfmoves since the last capture or pawn move.
+    fullmove_number : int
+        The number of the full move, incremented after black moves.
+    zobrist_hash : int
+        A 64 bit hash of the placement, side to move, castling rights and en passant square, updated incrementally.
+
+    Methods:
+    -------
+    to_FEN():
+        Returns the FEN string of the position.
+    copy():
+        Returns an independent copy of the position.
+    piece_at(coordinate):
+        Returns the piece on a square, or '' if it is empty.
+    find_piece(piece):
+        Returns all coordinates the piece was found at.
+    find_all_pieces():
+        Returns all coordinates that contain a piece.
+    occupied():
+        Returns the bitboard of every occupied square.
+    in_check():
+        Returns whether the king of the side to move is attacked.
+    apply_move(move):
+        Applies a move in coordinate notation to the position.
+    """
+
+    def __init__(self, FEN: str = DEFAULT_FEN) -> None:
+        """
+        Initializes the Position object from a FEN string. Missing fields get their default value.
+
+        Parameters:
+        ----------
+        FEN : str
+            The FEN string representing the board state.
+        """
+        fields = FEN.split()
+        fields += ['w', '-', '-', '0', '1'][len(fields) - 1:]
+
+        self.board = []
+        for char in fields[0]:
+            if char.isdigit():
+                self.board.extend([''] * int(char))
+            elif char != '/':
+                self.board.append(char)
+        if len(self.board) != 64:
+            raise ValueError(f"Invalid piece placement in FEN: {fields[0]}")
+
+        self.bitboards = {piece: 0 for piece in 'PNBRQKpnbrqk'}
+        self.occupancy = {'w': 0, 'b': 0}
+        for index, piece in enumerate(self.board):
+            if piece:
+                self.bitboards[piece] |= 1 << index
+                self.occupancy['w' if piece.isupper() else 'b'] |= 1 << index
+
+        self.turn = fields[1]
+        self.castling = fields[2]
+        self.en_passant = fields[3]
+        self.halfmove_clock = int(fields[4])
+        self.fullmove_number = int(fields[5])
+        self.zobrist_hash = self.__compute_zobrist_hash()
+
+    def __compute_zobrist_hash(self) -> int:
+        """
+        Computes the Zobrist hash of the position from scratch.
+        """
+        zobrist_hash = 0
+        for index, piece in enumerate(self.board):
+            if piece:
+                zobrist_hash ^= ZOBRIST_PIECES[piece][index]
+        return zobrist_hash ^ self.__state_hash()
+
+    def __state_hash(self) -> int:
+        """
+        Returns the part of the Zobrist hash that depends on side to move, castling rights and en passant square.
+        """
+        state_hash = ZOBRIST_BLACK_TO_MOVE if self.turn == 'b' else 0
+        for right in self.castling:
+            state_hash ^= ZOBRIST_CASTLING.get(right, 0)
+        if self.en_passant != '-':
+            # Only hashed when a pawn can actually capture en passant, so transpositions hash the same
+            enemy = 'b' if self.turn == 'w' else 'w'
+            pawns = self.bitboards['P' if self.turn == 'w' else 'p']
+            if PAWN_ATTACKS[enemy][SQUARE_INDICES[self.en_passant]] & pawns:
+                state_hash ^= ZOBRIST_EN_PASSANT[self.en_passant[0]]
+        return state_hash
+
+    def to_FEN(self) -> str:
+        """
+        Returns the FEN string of the position.
+
+        Returns:
+        -------
+        str
+            The FEN string representing the board state.
+        """
+        rows = []
+        for row_start in range(0, 64, 8):
+            row = ''
+            empty_squares = 0
+            for piece in self.board[row_start:row_start + 8]:
+                if piece:
+                    if empty_squares:
+                        row += str(empty_squares)
+                        empty_squares = 0
+                    row += piece
+                else:
+                    empty_squares += 1
+            if empty_squares:
+                row += str(empty_squares)
+            rows.append(row)
+        return f"{'/'.join(rows)} {self.turn} {self.castling} {self.en_passant} {self.halfmove_clock} {self.fullmove_number}"
+
+    def copy(self) -> 'Position':
+        """
+        Returns an independent copy of the position.
+
+        Returns:
+        -------
+        Position
+            A new Position with the same state.
+        """
+        position = Position.__new__(Position)
+        position.board = self.board.copy()
+        position.bitboards = self.bitboards.copy()
+        position.occupancy = self.occupancy.copy()
+        position.turn = self.turn
+        position.castling = self.castling
+        position.en_passant = self.en_passant
+        position.halfmove_clock = self.halfmove_clock
+        position.fullmove_number = self.fullmove_number
+        position.zobrist_hash = self.zobrist_hash
+        return position
+
+    def piece_at(self, coordinate: str) -> str:
+        """
+        Returns the piece on a square.
+
+        Parameters:
+        ----------
+        coordinate : str
+            The coordinate of the square (e.g., 'a1').
+
+        Returns:
+        -------
+        str
+            The FEN letter of the piece, or '' if the square is empty.
+        """
+        return self.board[SQUARE_INDICES[coordinate]]
+
+    def find_piece(self, piece: str) -> list[str]:
+        """
+        Returns all coordinates the piece was found at.
+
+        Parameters:
+        ----------
+        piece : str
+            The FEN letter of the piece. Case sensitive, uppercase for white and lowercase for black.
+
+        Returns:
+        -------
+        list[str]
+            The coordinates of every matching piece.
+        """
+        return [SQUARE_NAMES[index] for index in squares_of(self.bitboards[piece])]
+
+    def find_all_pieces(self) -> list[str]:
+        """
+        Returns all coordinates that contain a piece.
+
+        Returns:
+        -------
+        list[str]
+            The coordinates of every occupied square.
+        """
+        return [SQUARE_NAMES[index] for index in squares_of(self.occupied())]
+
+    def occupied(self) -> int:
+        """
+        Returns the bitboard of every occupied square.
+
+        Returns:
+        -------
+        int
+            The bitboard with a bit set for every piece of either side.
+        """
+        return self.occupancy['w'] | self.occupancy['b']
+
+    def in_check(self) -> bool:
+        """
+        Returns whether the king of the side to move is attacked.
+
+        Returns:
+        -------
+        bool
+            True if the side to move is in check, False if not or if it has no king.
+        """
+        is_white = self.turn == 'w'
+        king_bitboard = self.bitboards['K' if is_white else 'k']
+        if not king_bitboard:
+            return False
+        king_square = lowest_square(king_bitboard)
+        occupied = self.occupied()
+        # A piece attacks the king if the same piece on the king's square would attack it
+        for piece_type in 'NBRQK':
+            if piece_attacks(piece_type, king_square, occupied) & self.bitboards[piece_type.lower() if is_white else piece_type]:
+                return True
+        return bool(PAWN_ATTACKS[self.turn][king_square] & self.bitboards['p' if is_white else 'P'])
+
+    def __put_piece(self, index: int, piece: str) -> None:
+        """
+        Puts a piece on an empty square, keeping the array and bitboards in sync.
+        """
+        self.board[index] = piece
+        self.bitboards[piece] |= 1 << index
+        self.occupancy['w' if piece.isupper() else 'b'] |= 1 << index
+        self.zobrist_hash ^= ZOBRIST_PIECES[piece][index]
+
+    def __remove_piece(self, index: int) -> str:
+        """
+        Removes and returns the piece on a square, or '' if it was empty.
+        """
+        piece = self.board[index]
+        if piece:
+            self.board[index] = ''
+            self.bitboards[piece] ^= 1 << index
+            self.occupancy['w' if piece.isupper() else 'b'] ^= 1 << index
+            self.zobrist_hash ^= ZOBRIST_PIECES[piece][index]
+        return piece
+
+    def apply_move(self, move: Tuple[str, str, str]) -> None:
+        """
+        Applies a move in coordinate notation to the position, including castling, en passant and promotion.
+
+        Parameters:
+        ----------
+        move : Tuple[str, str, str]
+            The starting square, ending square and promotion piece ('' if not promoting).
+
+        Raises:
+        ------
+        ValueError
+            If the starting square is empty, or a castling king has no rook to move. The position is not changed.
+        """
+        starting_square, ending_square, promotion_piece = move
+        start = SQUARE_INDICES[starting_square]
+        end = SQUARE_INDICES[ending_square]
+        if not self.board[start]:
+            raise ValueError(f"There is no piece on {starting_square}")
+        if self.board[start] in {'K', 'k'} and abs(start - end) == 2:
+            rook = 'R' if self.board[start].isupper() else 'r'
+            if self.board[start + 3 if end > start else start - 4] != rook:
+                raise ValueError(f"There is no rook to castle with from {starting_square} to {ending_square}")
+
+        # The state part of the hash is swapped out and back in once the move is done
+        self.zobrist_hash ^= self.__state_hash()
+        piece = self.__remove_piece(start)
+        is_white = piece.isupper()
+        captured_piece = self.__remove_piece(end)
+
+        if piece in {'P', 'p'}:
+            if ending_square == self.en_passant and not captured_piece:
+                # En passant, the captured pawn is behind the ending square
+                captured_piece = self.__remove_piece(end + 8 if is_white else end - 8)
+            if promotion_piece:
+                piece = promotion_piece.upper() if is_white else promotion_piece.lower()
+        elif piece in {'K', 'k'} and abs(start - end) == 2:
+            # Castling, move the rook next to the king
+            if end > start:
+                self.__put_piece(start + 1, self.__remove_piece(start + 3))
+            else:
+                self.__put_piece(start - 1, self.__remove_piece(start - 4))
+        self.__put_piece(end, piece)
+
+        # Update castling rights if a king or rook moved or a rook was captured
+        if self.castling != '-':
+            for square in (start, end):
+                for right in CASTLING_RIGHTS_LOST.get(square, ''):
+                    self.castling = self.castling.replace(right, '')
+            if not self.castling:
+                self.castling = '-'
+
+        if piece in {'P', 'p'} and abs(start - end) == 16:
+            self.en_passant = SQUARE_NAMES[(start + end) // 2]
+        else:
+            self.en_passant = '-'
+
+        if piece in {'P', 'p'} or promotion_piece or captured_piece:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+
+        if not is_white:
+            self.fullmove_number += 1
+        self.turn = 'b' if is_white else 'w'
+        self.zobrist_hash ^= self.__state_hash()
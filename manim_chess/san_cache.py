@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from typing import Tuple
+
+class SANCache:
+    """
+    A bounded least recently used cache of resolved moves, keyed by (position Zobrist hash, move in algebraic notation).
+
+    Games share openings and reach the same positions through transpositions, so the same move is often resolved
+    in the same position many times. Once a (position, move) pair is in the cache it is not resolved again.
+
+    Attributes:
+    ----------
+    max_size : int
+        The maximum number of moves kept, the least recently used move is evicted first. 0 disables the cache.
+    hits : int
+        The number of lookups that found a move.
+    misses : int
+        The number of lookups that did not find a move.
+
+    Methods:
+    -------
+    get(zobrist_hash, algebraic_notation):
+        Returns the cached move or None.
+    put(zobrist_hash, algebraic_notation, move):
+        Stores a resolved move.
+    clear():
+        Removes every move and resets the counters.
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        """
+        Initializes the SANCache object.
+
+        Parameters:
+        ----------
+        max_size : int, optional
+            The maximum number of moves kept (default is 100000).
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__moves = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__moves)
+
+    def get(self, zobrist_hash: int, algebraic_notation: str) -> Tuple[str, str, str] | None:
+        """
+        Returns the cached move and marks it as recently used.
+
+        Parameters:
+        ----------
+        zobrist_hash : int
+            The Zobrist hash of the position the move is played in.
+        algebraic_notation : str
+            The move in algebraic notation.
+
+        Returns:
+        -------
+        Tuple[str, str, str] or None
+            The move in coordinate notation, or None if it is not cached.
+        """
+        key = (zobrist_hash, algebraic_notation)
+        move = self.__moves.get(key)
+        if move is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__moves.move_to_end(key)
+        return move
+
+    def put(self, zobrist_hash: int, algebraic_notation: str, move: Tuple[str, str, str]) -> None:
+        """
+        Stores a resolved move, evicting the least recently used moves if the cache is full.
+
+        Parameters:
+        ----------
+        zobrist_hash : int
+            The Zobrist hash of the position the move is played in.
+        algebraic_notation : str
+            The move in algebraic notation.
+        move : Tuple[str, str, str]
+            The move in coordinate notation.
+        """
+        if self.max_size <= 0:
+            return
+        self.__moves[(zobrist_hash, algebraic_notation)] = move
+        while len(self.__moves) > self.max_size:
+            self.__moves.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every move and resets the hit and miss counters.
+        """
+        self.__moves.clear()
+        self.hits = 0
+        self.misses = 0
+
+# The cache used by default when converting moves
+SAN_CACHE = SANCache()
@@ -0,0 +1,105 @@
+import random
+
+# Square and attack tables built once at import, so notation, FEN and board code only ever look values up.
+#
+# Squares use FEN order: index 0 is a8, index 7 is h8 and index 63 is h1, so moving one rank up is -8
+# and one file right is +1. A bitboard is a 64 bit int with bit i set for square index i.
+
+FILES = 'abcdefgh'
+RANKS = '12345678'
+
+SQUARE_NAMES = [f'{file}{rank}' for rank in reversed(RANKS) for file in FILES]
+SQUARE_INDICES = {name: index for index, name in enumerate(SQUARE_NAMES)}
+SQUARE_FILES = [index % 8 for index in range(64)]  # 0 for the a-file
+SQUARE_RANKS = [8 - index // 8 for index in range(64)]  # 1 for the first rank
+FILE_INDICES = {file: index for index, file in enumerate(FILES)}
+
+# a1 is dark, so a square is light when its file and rank indices have different parity
+IS_LIGHT_SQUARE = {name: (SQUARE_FILES[index] + SQUARE_RANKS[index]) % 2 == 0 for index, name in enumerate(SQUARE_NAMES)}
+
+FILE_MASKS = {file: sum(1 << (row * 8 + index) for row in range(8)) for index, file in enumerate(FILES)}
+RANK_MASKS = {rank: 0xFF << ((8 - int(rank)) * 8) for rank in RANKS}
+
+# (file_delta, rank_delta) of each direction
+ROOK_DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+BISHOP_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+KNIGHT_MOVEMENTS = [(-2, -1), (-1, -2), (2, 1), (1, 2), (-2, 1), (1, -2), (2, -1), (-1, 2)]
+KING_MOVEMENTS = QUEEN_DIRECTIONS
+
+# Directions that move towards higher square indices, the nearest blocker along them is the lowest set bit
+POSITIVE_DIRECTIONS = {direction for direction in QUEEN_DIRECTIONS if direction[1] < 0 or (direction[1] == 0 and direction[0] > 0)}
+
+def __offset_square(index: int, file_delta: int, rank_delta: int) -> int:
+    """
+    Returns the index of the square at an offset from another, or -1 if it is off the board.
+    """
+    file = SQUARE_FILES[index] + file_delta
+    rank = SQUARE_RANKS[index] + rank_delta
+    if 0 <= file < 8 and 1 <= rank <= 8:
+        return (8 - rank) * 8 + file
+    return -1
+
+def __build_jump_attacks(movements: list) -> list[int]:
+    """
+    Returns the attack bitboard of a piece that jumps by fixed offsets, for every square.
+    """
+    attacks = []
+    for index in range(64):
+        bitboard = 0
+        for file_delta, rank_delta in movements:
+            square = __offset_square(index, file_delta, rank_delta)
+            if square >= 0:
+                bitboard |= 1 << square
+        attacks.append(bitboard)
+    return attacks
+
+def __build_rays() -> tuple[dict, dict]:
+    """
+    Returns the squares reached from every square in every direction on an empty board, as bitboards and as
+    lists of square indices ordered from nearest to furthest.
+    """
+    ray_masks = {}
+    ray_squares = {}
+    for direction in QUEEN_DIRECTIONS:
+        ray_masks[direction] = []
+        ray_squares[direction] = []
+        for index in range(64):
+            squares = []
+            square = __offset_square(index, *direction)
+            while square >= 0:
+                squares.append(square)
+                square = __offset_square(square, *direction)
+            ray_masks[direction].append(sum(1 << square for square in squares))
+            ray_squares[direction].append(squares)
+    return ray_masks, ray_squares
+
+def __build_lines() -> tuple[list, list]:
+    """
+    Returns the squares strictly between two squares and the full line through them, for every pair of
+    squares on a common rank, file or diagonal (0 otherwise).
+    """
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for direction, rays in RAY_SQUARES.items():
+        for start in range(64):
+            full_line = RAYS[direction][start] | RAYS[(-direction[0], -direction[1])][start] | (1 << start)
+            between_mask = 0
+            for end in rays[start]:
+                between[start][end] = between_mask
+                line[start][end] = full_line
+                between_mask |= 1 << end
+    return between, line
+
+KNIGHT_ATTACKS = __build_jump_attacks(KNIGHT_MOVEMENTS)
+KING_ATTACKS = __build_jump_attacks(KING_MOVEMENTS)
+PAWN_ATTACKS = {'w': __build_jump_attacks([(-1, 1), (1, 1)]), 'b': __build_jump_attacks([(-1, -1), (1, -1)])}
+RAYS, RAY_SQUARES = __build_rays()
+BETWEEN, LINE = __build_lines()
+
+# Zobrist keys, a fixed seed keeps position hashes the same between runs and processes
+__zobrist_random = random.Random(0x5EED)
+ZOBRIST_PIECES = {piece: [__zobrist_random.getrandbits(64) for _ in range(64)] for piece in 'PNBRQKpnbrqk'}
+ZOBRIST_BLACK_TO_MOVE = __zobrist_random.getrandbits(64)
+ZOBRIST_CASTLING = {right: __zobrist_random.getrandbits(64) for right in 'KQkq'}
+ZOBRIST_EN_PASSANT = {file: __zobrist_random.getrandbits(64) for file in FILES}
@@ -0,0 +1,29 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.game_player import convert_from_PGN
+from benchmarks.inputs import SHORT_PGN, LONG_PGN, LONG_GAME_PLIES
+from benchmarks.compare import compare_results
+
+class TestBenchmarkInputs(unittest.TestCase):
+
+	def test_reference_games_convert_completely(self):
+		self.assertEqual(len(convert_from_PGN(SHORT_PGN, cache=None)), 87)
+		self.assertEqual(len(convert_from_PGN(LONG_PGN, cache=None)), LONG_GAME_PLIES)
+
+class TestCompareResults(unittest.TestCase):
+
+	def test_regressions_are_flagged(self):
+		baseline = {'results': {'a': {'min': 1.0}, 'b': {'min': 1.0}, 'removed': {'min': 1.0}}}
+		current = {'results': {'a': {'min': 1.05}, 'b': {'min': 1.5}, 'added': {'min': 1.0}}}
+		comparisons = {comparison['name']: comparison for comparison in compare_results(baseline, current, threshold=0.1)}
+		self.assertFalse(comparisons['a']['regressed'])
+		self.assertTrue(comparisons['b']['regressed'])
+		self.assertAlmostEqual(comparisons['b']['ratio'], 1.5)
+		self.assertIsNone(comparisons['removed']['ratio'])
+		self.assertIsNone(comparisons['added']['baseline'])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.bitboard import *
+from manim_chess.position import SQUARE_INDICES, SQUARE_NAMES
+
+def bitboard_of(*coordinates):
+	return sum(1 << SQUARE_INDICES[coordinate] for coordinate in coordinates)
+
+def coordinates_of(bitboard):
+	return sorted(SQUARE_NAMES[index] for index in squares_of(bitboard))
+
+class TestBitboard(unittest.TestCase):
+	def test_knight_attacks_corner(self):
+		self.assertEqual(['b3', 'c2'], coordinates_of(KNIGHT_ATTACKS[SQUARE_INDICES['a1']]))
+
+	def test_king_attacks_edge(self):
+		self.assertEqual(['d1', 'd2', 'e2', 'f1', 'f2'], coordinates_of(KING_ATTACKS[SQUARE_INDICES['e1']]))
+
+	def test_rook_attacks_stop_at_blockers(self):
+		occupied = bitboard_of('d6', 'f4', 'd1')
+		expected_coordinates = ['a4', 'b4', 'c4', 'd1', 'd2', 'd3', 'd5', 'd6', 'e4', 'f4']
+		self.assertEqual(expected_coordinates, coordinates_of(piece_attacks('R', SQUARE_INDICES['d4'], occupied)))
+
+	def test_bishop_attacks_stop_at_blockers(self):
+		occupied = bitboard_of('b2', 'e5')
+		expected_coordinates = ['a7', 'b2', 'b6', 'c3', 'c5', 'e3', 'e5', 'f2', 'g1']
+		self.assertEqual(expected_coordinates, coordinates_of(piece_attacks('B', SQUARE_INDICES['d4'], occupied)))
+
+	def test_between(self):
+		self.assertEqual(['b2', 'c3', 'd4'], coordinates_of(BETWEEN[SQUARE_INDICES['a1']][SQUARE_INDICES['e5']]))
+		self.assertEqual(0, BETWEEN[SQUARE_INDICES['a1']][SQUARE_INDICES['b3']])
+
+	def test_file_and_rank_masks(self):
+		self.assertEqual(['e1', 'e2', 'e3', 'e4', 'e5', 'e6', 'e7', 'e8'], coordinates_of(FILE_MASKS['e']))
+		self.assertEqual(['a3', 'b3', 'c3', 'd3', 'e3', 'f3', 'g3', 'h3'], coordinates_of(RANK_MASKS['3']))
+
+if __name__ == '__main__':
+	unittest.main()
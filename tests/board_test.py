@@ -1,9 +1,12 @@
 import unittest
 import sys
 import os
+import itertools
+import random
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from board import Board
+from manim_chess.board import *
+from manim_chess import board
 
 class TestBoard(unittest.TestCase):
 	def test_reading_fen(self):
@@ -24,5 +27,217 @@ class TestBoard(unittest.TestCase):
 		actual_coordinate = test_board.get_coordinate_from_index(36)
 		self.assertEqual(expected_coordinate, actual_coordinate)
 
+	def test_label_template_is_shared(self):
+		first_label = get_label_template('a', ManimColor('#769656'), 11.2)
+		second_label = get_label_template('a', ManimColor('#769656'), 11.2)
+		self.assertIs(first_label, second_label)
+
+	def test_boards_reuse_labels(self):
+		Board().highlight_square('a1')
+		number_of_labels = len(board._LABEL_TEMPLATES)
+		test_board = Board()
+		test_board.highlight_square('a1')
+		test_board.unmark_square('a1')
+		self.assertEqual(number_of_labels, len(board._LABEL_TEMPLATES))
+
+	def test_highlights_do_not_add_labels(self):
+		test_board = Board()
+		number_of_labels = len(test_board.label_layer.submobjects)
+		for _ in range(10):
+			test_board.highlight_square('a1')
+			test_board.mark_square('a1')
+			test_board.unmark_square('a1')
+		self.assertEqual(number_of_labels, len(test_board.label_layer.submobjects))
+		self.assertEqual([], test_board.get_square('a1').submobjects)
+
+	def test_highlight_recolors_labels(self):
+		test_board = Board()
+		test_board.highlight_square('a1')
+		for label in test_board.labels['a1']:
+			self.assertEqual(test_board.color_dark, label.fill_color)
+		test_board.unmark_square('a1')
+		for label in test_board.labels['a1']:
+			self.assertEqual(test_board.color_light, label.fill_color)
+
+	def test_background_is_two_mobjects(self):
+		test_board = Board()
+		self.assertEqual([test_board.light_squares, test_board.dark_squares, test_board.overlay_layer, test_board.label_layer], test_board.submobjects)
+		self.assertEqual(64, len(test_board.square_centers))
+		self.assertEqual({}, test_board.squares)
+
+	def test_highlights_are_drawn_over_the_background(self):
+		test_board = Board()
+		test_board.set_board_from_FEN()
+		test_board.move_piece('e2', 'e4')
+		self.assertEqual(2, len(test_board.overlay_layer.submobjects))
+		self.assertEqual(test_board.color_highlight_light, test_board.get_square_color('e2'))
+		self.assertEqual(test_board.color_highlight_light, test_board.get_square_color('e4'))
+		test_board.move_piece('e7', 'e5')
+		self.assertEqual(2, len(test_board.overlay_layer.submobjects))
+		self.assertEqual(test_board.color_light, test_board.get_square_color('e2'))
+		self.assertTrue(np.allclose(test_board.get_square_center('e4'), test_board.pieces['e4'].get_center()))
+
+	def test_get_square_stays_drawn(self):
+		test_board = Board()
+		square = test_board.get_square('h1')
+		self.assertTrue(np.allclose(test_board.get_square_center('h1'), square.get_center()))
+		self.assertEqual(test_board.color_light, square.fill_color)
+		test_board.mark_square('h1')
+		test_board.unmark_square('h1')
+		self.assertIs(square, test_board.get_square('h1'))
+		self.assertIn(square, test_board.overlay_layer.submobjects)
+		self.assertEqual(test_board.color_light, square.fill_color)
+
+	def test_minimum_cost_assignment(self):
+		generator = random.Random(3)
+		for rows, columns in [(1, 1), (3, 3), (5, 3), (2, 6), (6, 6)]:
+			costs = [[generator.randint(0, 20) for _ in range(columns)] for _ in range(rows)]
+			pairs = board._minimum_cost_assignment(costs)
+			self.assertEqual(min(rows, columns), len(pairs))
+			self.assertEqual(len(pairs), len({row for row, _ in pairs}))
+			self.assertEqual(len(pairs), len({column for _, column in pairs}))
+			if rows <= columns:
+				best = min(sum(costs[row][column] for row, column in enumerate(permutation)) for permutation in itertools.permutations(range(columns), rows))
+			else:
+				best = min(sum(costs[row][column] for column, row in enumerate(permutation)) for permutation in itertools.permutations(range(rows), columns))
+			self.assertEqual(best, sum(costs[row][column] for row, column in pairs))
+		self.assertEqual([], board._minimum_cost_assignment([]))
+
+	def test_transition_moves_existing_pieces(self):
+		test_board = Board()
+		test_board.set_board_from_FEN()
+		pieces = dict(test_board.pieces)
+		test_board.transition_to('rnbqkb1r/pppp1ppp/5n2/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3')
+		self.assertEqual('rnbqkb1r/pppp1ppp/5n2/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R', test_board.get_FEN_placement())
+		self.assertIs(pieces['g1'], test_board.pieces['f3'])
+		self.assertIs(pieces['g8'], test_board.pieces['f6'])
+		self.assertIs(pieces['e2'], test_board.pieces['e4'])
+		self.assertIs(pieces['a2'], test_board.pieces['a2'])
+		self.assertTrue(np.allclose(test_board.get_square_center('f3'), test_board.pieces['f3'].get_center()))
+
+	def test_transition_adds_and_removes_the_difference(self):
+		test_board = Board()
+		test_board.set_board_from_FEN('4k3/8/8/8/8/8/4P3/4K2R w K - 0 1')
+		rook = test_board.pieces['h1']
+		test_board.transition_to('4k3/8/8/8/8/8/8/Q3K3 w - - 0 1')
+		self.assertEqual('4k3/8/8/8/8/8/8/Q3K3', test_board.get_FEN_placement())
+		self.assertNotIn(rook, test_board.submobjects)
+		self.assertEqual(3, len([piece for piece in test_board.submobjects if piece in test_board.pieces.values()]))
+
+	def test_animated_transition(self):
+		test_board = Board()
+		test_board.set_board_from_FEN('4k3/8/8/8/8/8/4P3/4K2R w K - 0 1')
+		rook = test_board.pieces['h1']
+		animation = test_board.transition_to('4k3/8/8/8/4P3/8/8/Q3K3 w - - 0 1', animate=True)
+		self.assertEqual('4k3/8/8/8/4P3/8/8/Q3K3', test_board.get_FEN_placement())
+		self.assertEqual(3, len(animation.animations))
+		# The rook is only taken off the board once its fade out is done
+		self.assertIn(rook, test_board.submobjects)
+		# As Scene.play() runs them
+		for sub_animation in animation.animations:
+			sub_animation.begin()
+			sub_animation.finish()
+		for sub_animation in animation.animations:
+			if isinstance(sub_animation, RemovePiece):
+				sub_animation.clean_up_from_scene(None)
+		self.assertNotIn(rook, test_board.submobjects)
+
+	def test_captured_pieces_are_reused_for_promotion(self):
+		test_board = Board()
+		test_board.set_board_from_FEN('3qk3/P7/8/8/8/8/8/3QK3 b - - 0 1')
+		queen = test_board.pieces['d1']
+		test_board.move_piece('d8', 'd1')
+		self.assertEqual([queen], test_board.piece_pool[('Q', True)])
+		test_board.move_piece('a7', 'a8')
+		test_board.promote_piece('a8', 'Q')
+		self.assertIs(queen, test_board.pieces['a8'])
+		self.assertTrue(np.allclose(test_board.get_square_center('a8'), queen.get_center()))
+		self.assertEqual([], test_board.piece_pool[('Q', True)])
+		self.assertEqual(1, len(test_board.piece_pool[('P', True)]))
+
+	def test_reset_reuses_pieces(self):
+		test_board = Board()
+		test_board.set_board_from_FEN()
+		pieces = set(map(id, test_board.pieces.values()))
+		test_board.clear_board()
+		self.assertEqual(32, sum(len(idle_pieces) for idle_pieces in test_board.piece_pool.values()))
+		test_board.set_board_from_FEN()
+		self.assertEqual(pieces, set(map(id, test_board.pieces.values())))
+		self.assertEqual(0, sum(len(idle_pieces) for idle_pieces in test_board.piece_pool.values()))
+
+	def test_labels_accept_a_square(self):
+		test_board = Board()
+		test_board.add_number_label('c3', '9')
+		test_board.add_number_label(square=test_board.get_square('c3'), number='9')
+		test_board.add_letter_label(Square().move_to(test_board.get_square_center('h8')), 'z')
+		test_board.add_letter_label('h8', 'z')
+		for first_label, second_label in (test_board.labels['c3'], test_board.labels['h8']):
+			self.assertTrue(np.allclose(first_label.get_center(), second_label.get_center()))
+			self.assertEqual(first_label.fill_color, second_label.fill_color)
+
+	def test_labels_on_any_square_are_recolored(self):
+		test_board = Board()
+		test_board.add_number_label('e4', '9')
+		label = test_board.labels['e4'][0]
+		self.assertEqual(test_board.color_dark, label.fill_color)
+		test_board.highlight_square('e4')
+		self.assertEqual(test_board.color_highlight_light, test_board.get_square_color('e4'))
+		test_board.set_square_color('e4', test_board.color_dark)
+		self.assertEqual(test_board.color_light, label.fill_color)
+
+	def test_square_centers(self):
+		test_board = Board()
+		self.assertEqual((64, 3), test_board.square_centers.shape)
+		self.assertTrue(np.allclose([-5.6, 5.6, 0], test_board.get_square_center('a8') - test_board.get_square_center('h1')))
+		self.assertTrue(np.allclose([0.8, 0, 0], test_board.get_square_center('f4') - test_board.get_square_center('e4')))
+		self.assertTrue(np.allclose(test_board.get_square_center('e4'), test_board.get_square_centers()[SQUARE_INDICES['e4']]))
+
+	def test_square_centers_follow_the_board(self):
+		test_board = Board()
+		a8 = test_board.get_square_center('a8')
+		test_board.shift(np.array([1, 2, 0]))
+		self.assertTrue(np.allclose(a8 + [1, 2, 0], test_board.get_square_center('a8')))
+		test_board.add_piece('K', True, 'e1')
+		self.assertTrue(np.allclose(test_board.get_square_center('e1'), test_board.pieces['e1'].get_center()))
+		test_board.scale(0.5)
+		self.assertTrue(np.allclose([-2.8, 2.8, 0], test_board.get_square_center('a8') - test_board.get_square_center('h1')))
+
+	def test_draw_arrows_is_one_mobject(self):
+		test_board = Board()
+		arrows = test_board.draw_arrows([('e2', 'e4'), ('b8', 'c6'), ('c1', 'g5')])
+		self.assertEqual([arrows], test_board.arrows)
+		self.assertIn(arrows, test_board.submobjects)
+		# Nine straight sides of four Bezier points per arrow
+		self.assertEqual(3 * 9 * 4, arrows.get_num_points())
+
+	def test_arrow_points_at_its_square(self):
+		test_board = Board()
+		arrow = test_board.draw_arrow('e2', 'e4')
+		points = arrow.points.reshape(9, 4, 3)
+		tail = test_board.get_square_center('e2') + [0, ARROW_BUFFER, 0]
+		apex = test_board.get_square_center('e4') - [0, ARROW_BUFFER - ARROW_HEAD_LENGTH / 2, 0]
+		self.assertTrue(np.allclose(tail + [ARROW_SHAFT_WIDTH / 2, 0, 0], points[-1, -1]) or np.allclose(tail - [ARROW_SHAFT_WIDTH / 2, 0, 0], points[-1, -1]))
+		self.assertTrue(np.allclose(apex, points[4, 0]))
+
+	def test_knight_arrow_is_bent(self):
+		test_board = Board()
+		points = test_board.draw_arrow('b1', 'c3').points.reshape(9, 4, 3)
+		corners = points[:, 0, :2]
+		# Up the b file first, then right to c3
+		b_file = test_board.get_square_center('b1')[0]
+		c3 = test_board.get_square_center('c3')
+		self.assertTrue(np.allclose([b_file + ARROW_SHAFT_WIDTH / 2, c3[1] - ARROW_SHAFT_WIDTH / 2], corners[1]) or np.allclose([b_file - ARROW_SHAFT_WIDTH / 2, c3[1] + ARROW_SHAFT_WIDTH / 2], corners[1]))
+
+	def test_remove_arrows(self):
+		test_board = Board()
+		arrows = test_board.draw_arrows([('e2', 'e4')])
+		test_board.remove_arrows()
+		self.assertEqual([], test_board.arrows)
+		self.assertNotIn(arrows, test_board.submobjects)
+
+	def test_arrow_needs_two_squares(self):
+		with self.assertRaises(ValueError):
+			Board().draw_arrow('e4', 'e4')
+
 if __name__ == '__main__':
 	unittest.main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.chunked_render import *
+from manim_chess.chunked_render import _render_chunk
+from manim_chess.notation import convert_from_PGN
+
+GAME = '1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 4. Ba4 Nf6 5. O-O Be7 6. Re1 b5 7. Bb3 d6 8. c3 O-O 9. h3 Nb8 10. d4 Nbd7'
+
+class RecordingChunkScene(ChunkedGameScene):
+	def __init__(self, chunk):
+		self.chunk = chunk
+		self.waits = 0
+		self.mobjects = []
+
+	def add(self, *mobjects):
+		self.mobjects.extend(mobjects)
+
+	def play(self, *animations, **kwargs):
+		pass
+
+	def wait(self, *args, **kwargs):
+		self.waits += 1
+
+	def create_board(self):
+		self.board = Board()
+		return self.board
+
+class MediaDirScene:
+	"""
+	Stands in for a scene, its video path is in the media directory it was rendered with.
+	"""
+	def render(self):
+		self.renderer = type('Renderer', (), {})()
+		self.renderer.file_writer = type('FileWriter', (), {})()
+		self.renderer.file_writer.movie_file_path = os.path.join(config['media_dir'], 'videos', 'scene.mp4')
+
+class TestPlanChunks(unittest.TestCase):
+	def test_chunks_cover_every_ply(self):
+		moves = convert_from_PGN(GAME)
+		chunks = plan_chunks(moves, 3)
+		self.assertEqual([(0, 6), (6, 13), (13, 20)], [(chunk.start_ply, chunk.end_ply) for chunk in chunks])
+		self.assertEqual(moves, [move for chunk in chunks for move in chunk.moves])
+		self.assertIsNone(chunks[0].last_move)
+		self.assertEqual(moves[12], chunks[2].last_move)
+		self.assertIsNone(chunks[1].evals)
+		self.assertEqual(1, len(plan_chunks(moves[:1], 8)))
+
+	def test_evaluations(self):
+		moves = convert_from_PGN(GAME)
+		evals = [ply / 10 for ply in range(20)]
+		chunks = plan_chunks(Game(moves, evals=evals), 4)
+		self.assertEqual([0.0, 0.4, 0.9, 1.4], [round(chunk.evaluation, 3) for chunk in chunks])
+		self.assertEqual(evals[5:10], [round(evaluation, 3) for evaluation in chunks[1].evals])
+
+	def test_chunks_start_where_the_previous_one_ends(self):
+		chunks = plan_chunks(convert_from_PGN(GAME), 4)
+		previous_scene = None
+		for chunk in chunks:
+			scene = RecordingChunkScene(chunk)
+			if previous_scene is not None:
+				scene.board = Board()
+				scene.board.set_board_from_FEN(chunk.FEN)
+				scene.board.highlight_move(*chunk.last_move[:2])
+				self.assertEqual(previous_scene.board.get_FEN_placement(), scene.board.get_FEN_placement())
+				self.assertEqual(previous_scene.board.highlighted_squares, scene.board.highlighted_squares)
+			scene.construct()
+			self.assertEqual(len(chunk.moves), scene.waits)
+			self.assertIn(scene.board, scene.mobjects)
+			previous_scene = scene
+
+class TestRenderChunk(unittest.TestCase):
+	def test_chunks_render_in_their_own_directories(self):
+		chunks = plan_chunks(convert_from_PGN(GAME), 2)
+		paths = [_render_chunk(MediaDirScene, chunk, 'media', {}) for chunk in chunks]
+		self.assertEqual([os.path.join('media', f'chunk_0000{index}') for index in range(2)], [path.split(os.sep + 'videos')[0] for path in paths])
+
+if __name__ == '__main__':
+	unittest.main()
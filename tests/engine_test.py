@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.engine import *
+
+FAKE_ENGINE = [sys.executable, os.path.join(os.path.dirname(__file__), 'fake_uci_engine.py')]
+
+class TestEngine(unittest.TestCase):
+	def test_parse_score(self):
+		self.assertEqual(0.35, parse_score('info depth 20 seldepth 30 score cp 35 nodes 1000 pv e2e4'))
+		self.assertEqual(-MATE_EVALUATION, parse_score('info depth 1 score mate 0'))
+		self.assertEqual(MATE_EVALUATION, parse_score('info depth 9 score mate 3 pv h5f7'))
+		self.assertEqual(-MATE_EVALUATION, parse_score('info depth 9 score mate -2'))
+		self.assertIsNone(parse_score('info string hello'))
+		self.assertIsNone(parse_score('bestmove e2e4'))
+
+	def test_evaluations_are_from_whites_point_of_view(self):
+		async def evaluate():
+			async with await UCIEngine.start(FAKE_ENGINE, {'Threads': 1}) as engine:
+				return [
+					await engine.evaluate('4k3/p7/8/8/8/8/8/R3K3 w - - 0 1', depth=2),
+					await engine.evaluate('4k3/p7/8/8/8/8/8/R3K3 b - - 0 1', movetime=10),
+					await engine.evaluate('7k/8/8/8/8/8/8/QK6 w - - 0 1'),
+				]
+		self.assertEqual([4.0, 4.0, MATE_EVALUATION], asyncio.run(evaluate()))
+
+	def test_game_evaluations_are_in_ply_order(self):
+		moves = [('e2', 'e4', ''), ('d7', 'd5', ''), ('e4', 'd5', ''), ('d8', 'd5', ''), ('b1', 'c3', ''), ('d5', 'd2', '')]
+		self.assertEqual([0.0, 0.0, 1.0, 0.0, 0.0, -1.0], evaluate_game(moves, FAKE_ENGINE, workers=3))
+
+	def test_streamed_evaluations(self):
+		FENs = [f'4k3/{"p" * pawns}{8 - pawns if pawns < 8 else ""}/8/8/8/8/8/4K3 w - - 0 1' for pawns in range(1, 9)]
+		async def collect():
+			return [result async for result in analyse_positions(FENs, FAKE_ENGINE, workers=4, depth=1)]
+		self.assertEqual([(index, -float(index + 1)) for index in range(8)], asyncio.run(collect()))
+
+	def test_engine_crash(self):
+		async def collect():
+			return [result async for result in analyse_positions(['4k3/8/8/8/8/8/8/4K3 w - - 0 1', 'crash w - - 0 1'], FAKE_ENGINE, workers=2)]
+		self.assertRaises(EngineError, asyncio.run, collect())
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.evaluation_bar import *
+from manim_chess import evaluation_bar
+
+class TestEvaluationBar(unittest.TestCase):
+	def test_heights_are_clipped(self):
+		heights = evaluation_bar_heights(np.array([0.0, 1.0, -1.0, 20.0, -20.0, 0.04]))
+		self.assertTrue(np.allclose([3.2, 3.937063, 2.462937, 6.18, 0.32, 3.2], heights))
+
+	def test_labels_are_shared(self):
+		first_label = get_evaluation_label_template('1.5', ManimColor('#403D39'))
+		second_label = get_evaluation_label_template('1.5', ManimColor('#403D39'))
+		self.assertIs(first_label, second_label)
+
+	def test_series_reuses_labels_and_bars(self):
+		eval_bar = EvaluationBar()
+		eval_bar.set_evaluations([0.51, 0.49, -0.2])
+		number_of_labels = len(evaluation_bar._LABEL_TEMPLATES)
+		number_of_bars = len(evaluation_bar._BAR_TEMPLATES)
+		updates = eval_bar.set_evaluations(np.array([0.5, 0.5, -0.2, 0.54]))
+		self.assertEqual(4, len(updates))
+		self.assertEqual(number_of_labels, len(evaluation_bar._LABEL_TEMPLATES))
+		self.assertEqual(number_of_bars, len(evaluation_bar._BAR_TEMPLATES))
+		self.assertAlmostEqual(0.54, eval_bar.evaluation)
+
+	def test_set_evaluation_matches_series(self):
+		eval_bar = EvaluationBar()
+		rectangle_transform, text_transform = eval_bar.set_evaluation(-1.26)
+		self.assertIs(eval_bar.white_rectangle, rectangle_transform.mobject)
+		self.assertIs(eval_bar.bot_text, text_transform.mobject)
+		self.assertEqual(-1.26, eval_bar.evaluation)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,45 @@
+import sys
+import time
+
+# A scripted UCI engine for the engine tests. The score is the material balance from the point of view of the
+# side to move, and positions where the other side only has a king are mate in 1. Searches take a time that
+# depends on the position, so results finish out of order.
+
+PIECE_VALUES = {'p': 100, 'n': 300, 'b': 300, 'r': 500, 'q': 900, 'k': 0}
+
+def send(line):
+	sys.stdout.write(line + '\n')
+	sys.stdout.flush()
+
+def main():
+	FEN = None
+	for line in sys.stdin:
+		tokens = line.split()
+		if not tokens:
+			continue
+		if tokens[0] == 'uci':
+			send('id name Fake')
+			send('uciok')
+		elif tokens[0] == 'isready':
+			send('readyok')
+		elif tokens[0] == 'position':
+			FEN = ' '.join(tokens[2:])
+		elif tokens[0] == 'go':
+			placement, turn = FEN.split()[:2]
+			if placement == 'crash':
+				return
+			material = sum(PIECE_VALUES[char.lower()] * (1 if char.isupper() else -1) for char in placement if char.isalpha())
+			score = material if turn == 'w' else -material
+			opponent_pieces = [char for char in placement if char.isalpha() and char.isupper() != (turn == 'w')]
+			time.sleep(0.002 * (sum(map(ord, placement)) % 7))
+			send('info depth 1 score cp 0')
+			if opponent_pieces in (['k'], ['K']):
+				send('info depth 2 score mate 1 pv a1a8')
+			else:
+				send(f'info depth 2 score cp {score} nodes 10 pv 0000')
+			send('bestmove 0000')
+		elif tokens[0] == 'quit':
+			return
+
+if __name__ == '__main__':
+	main()
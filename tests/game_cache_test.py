@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.game_cache import *
+from manim_chess.notation import convert_from_PGN, NotationError
+
+GAME = '1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 4. Ba4 Nf6 5. O-O Be7 6. Re1 b5 7. Bb3 d6 8. c3 O-O 9. h3 Nb8 10. d4 Nbd7'
+ENDGAME_FEN = '4k3/8/8/8/8/8/4P3/4K3 w - - 0 1'
+
+class TestGameCache(unittest.TestCase):
+	def setUp(self):
+		directory = tempfile.TemporaryDirectory()
+		self.addCleanup(directory.cleanup)
+		self.directory = directory.name
+
+	def test_warm_convert_matches_conversion(self):
+		cache = GameCache(self.directory)
+		cold_game = cache.convert(GAME)
+		warm_game = cache.convert(GAME)
+		self.assertEqual((1, 1), (cache.hits, cache.misses))
+		self.assertEqual(convert_from_PGN(GAME), warm_game.moves)
+		for ply in range(len(warm_game) + 1):
+			self.assertEqual(cold_game.FEN_at(ply), warm_game.FEN_at(ply))
+
+	def test_key_includes_the_starting_position(self):
+		cache = GameCache(self.directory)
+		cache.convert('1. e4 Kd7', ENDGAME_FEN)
+		self.assertIsNone(cache.get('1. e4 Kd7'))
+		self.assertEqual([('e2', 'e4', ''), ('e8', 'd7', '')], cache.get('1. e4 Kd7', ENDGAME_FEN).moves)
+		self.assertNotEqual(cache_key('1. e4'), cache_key('1. e4', ENDGAME_FEN))
+
+	def test_games_with_errors_are_not_stored(self):
+		cache = GameCache(self.directory)
+		for _ in range(2):
+			with self.assertRaises(NotationError):
+				cache.convert('1. e4 e5 2. Nf6 Nc6')
+		self.assertEqual(0, len(cache))
+		self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+	def test_broken_files_are_misses(self):
+		cache = GameCache(self.directory)
+		cache.convert(GAME)
+		with open(os.path.join(self.directory, f'{cache_key(GAME)}.game'), 'r+b') as file:
+			file.truncate(20)
+		self.assertIsNone(cache.get(GAME))
+		self.assertEqual(convert_from_PGN(GAME), cache.convert(GAME).moves)
+
+	def test_least_recently_used_games_are_evicted(self):
+		cache = GameCache(self.directory)
+		games = ['1. e4 e5', '1. d4 d5', '1. c4 e5']
+		for game in games:
+			cache.convert(game)
+			time.sleep(0.01)
+		game_size = os.path.getsize(os.path.join(self.directory, f'{cache_key(games[0])}.game'))
+		cache.get(games[0])
+		cache.max_bytes = 3 * game_size
+		cache.convert('1. Nf3 d5')
+		self.assertEqual(3, len(cache))
+		self.assertIsNotNone(cache.get(games[0]))
+		self.assertIsNone(cache.get(games[1]))
+		cache.clear()
+		self.assertEqual(0, len(cache))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -206,6 +206,21 @@ class TestBoard(unittest.TestCase):
 		actual_coordinates = queen_algebraic_notation('Qf8','rnbq2r1/ppppkp2/4pn1b/6pp/1PPPPPP1/5N2/P3K2P/RNBQ1B1R b - - 4 8')
 		self.assertEqual(expected_coordinates, actual_coordinates)
 
+	def test_knight_pinned(self):
+		expected_coordinates = ('g3', 'e4', '')
+		actual_coordinates = knight_algebraic_notation('Ne4','4k3/8/8/b7/8/2N3N1/8/4K3 w - - 0 1')
+		self.assertEqual(expected_coordinates, actual_coordinates)
+
+	def test_rook_pinned(self):
+		expected_coordinates = ('h4', 'd4', '')
+		actual_coordinates = rook_algebraic_notation('Rd4','k7/8/8/8/r6r/8/8/R5K1 b - - 0 1')
+		self.assertEqual(expected_coordinates, actual_coordinates)
+
+	def test_bishop_pinned_along_line(self):
+		expected_coordinates = ('d2', 'c3', '')
+		actual_coordinates = bishop_algebraic_notation('Bdc3','4k3/8/8/b7/8/8/1B1B4/4K3 w - - 0 1')
+		self.assertEqual(expected_coordinates, actual_coordinates)
+
 	def test_convert_from_PGN(self):
 		expected_output = [('e2', 'e4', ''), ('e7', 'e5', ''), ('g1', 'f3', ''), ('d8', 'f6', '')]
 
@@ -238,6 +253,95 @@ class TestBoard(unittest.TestCase):
 1. e4 e5 2. Nf3 Qf6 3. d4 (3. Bc4 d5 4. Bxd5) 3... d5 *""")
 		self.assertEqual(expected_output, actual_output)
 
+	def test_convert_from_PGN_castling_and_en_passant(self):
+		expected_output = [('e2', 'e4', ''), ('a7', 'a6', ''), ('e4', 'e5', ''), ('d7', 'd5', ''), ('e5', 'd6', ''), ('g8', 'f6', ''), ('g1', 'f3', ''), ('e7', 'e6', ''), ('f1', 'e2', ''), ('f8', 'd6', ''), ('e1', 'g1', ''), ('e8', 'g8', '')]
+		actual_output = convert_from_PGN("""[Result "*"]
+
+1. e4 a6 2. e5 d5 3. exd6 Nf6 4. Nf3 e6 5. Be2 Bxd6 6. O-O O-O *""")
+		self.assertEqual(expected_output, actual_output)
+
+	def test_process_move(self):
+		expected_output = (('g1', 'f3', ''), 'rnbqkbnr/pppppppp/8/8/8/5N2/PPPPPPPP/RNBQKB1R b KQkq - 1 1')
+		actual_output = process_move('Nf3', DEFAULT_FEN)
+		self.assertEqual(expected_output, actual_output)
+
+class TestDryRunGame(unittest.TestCase):
+	def test_dry_run_plays_special_moves(self):
+		moves = convert_from_PGN('1. e4 Nf6 2. e5 d5 3. exd6 e6 4. Nf3 Be7 5. Bc4 O-O 6. O-O')
+		result = dry_run_game(moves)
+		self.assertIsNone(result.error)
+		self.assertEqual(len(result.states), len(moves))
+		self.assertEqual(result.states[4], 'rnbqkb1r/ppp1pppp/3P1n2/8/8/8/PPPP1PPP/RNBQKBNR')
+		self.assertEqual(result.states[-1], 'rnbq1rk1/ppp1bppp/3Ppn2/8/2B5/5N2/PPPP1PPP/RNBQ1RK1')
+
+	def test_dry_run_promotion(self):
+		result = dry_run_game([('a7', 'a8', 'Q')], '7k/P7/8/8/8/8/8/K7 w - - 0 1')
+		self.assertEqual(result.states, ['Q6k/8/8/8/8/8/8/K7'])
+
+	def test_dry_run_stops_at_first_error(self):
+		board = Board()
+		moves = [('e2', 'e4', ''), ('e7', 'e5', ''), ('e2', 'e3', ''), ('d2', 'd4', '')]
+		result = dry_run_game(moves, board=board)
+		self.assertEqual(result.error_ply, 2)
+		self.assertEqual(len(result.states), 2)
+		self.assertIn('e2', result.error)
+
+		# The board is set up again for the next game
+		result = dry_run_game([('e2', 'e4', ''), ('e2', 'e4', '')], board=board)
+		self.assertEqual(result.error_ply, 1)
+		self.assertEqual(dry_run_game([('e7', 'e5', '')]).error_ply, 0)
+		self.assertEqual(dry_run_game([('d1', 'd2', '')]).error_ply, 0)
+
+class RecordingScene:
+	def __init__(self):
+		self.played = []
+		self.waits = 0
+
+	def play(self, *animations, **kwargs):
+		self.played.append(animations)
+
+	def wait(self, *args, **kwargs):
+		self.waits += 1
+
+def start_animation(animation):
+	# Starts the board changes of a compressed timeline in order, as a scene would
+	if isinstance(animation, ApplyAtStart):
+		animation.begin()
+	for sub_animation in getattr(animation, 'animations', []):
+		start_animation(sub_animation)
+
+class TestCompressedTimeline(unittest.TestCase):
+	def test_moves_are_played_in_windows(self):
+		moves = convert_from_PGN('1. e4 d5 2. exd5 Qxd5 3. Nc3 Qa5 4. d4 Nf6 5. Nf3')
+		expected_board = Board()
+		expected_board.set_board_from_FEN()
+		play_game(RecordingScene(), expected_board, moves)
+
+		board = Board()
+		board.set_board_from_FEN()
+		scene = RecordingScene()
+		play_game(scene, board, moves, plies_per_play=4)
+		self.assertEqual(len(scene.played), 3)
+		self.assertEqual(scene.waits, 0)
+		self.assertEqual(board.get_FEN_placement(), 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR')
+
+		captured_pawn = board.get_piece_at_square('d7')
+		for animations in scene.played:
+			for animation in animations:
+				start_animation(animation)
+		self.assertEqual(board.get_FEN_placement(), expected_board.get_FEN_placement())
+		self.assertEqual(captured_pawn.family_members_with_points()[0].get_fill_opacity(), 0)
+
+	def test_evaluations_are_grouped_with_moves(self):
+		board = Board()
+		board.set_board_from_FEN()
+		scene = RecordingScene()
+		moves = [('e2', 'e4', ''), ('e7', 'e5', '')]
+		play_game(scene, board, moves, EvaluationBar(), [0.3, 0.2], plies_per_play=len(moves))
+		self.assertEqual(len(scene.played), 1)
+		plies = scene.played[0][0].animations
+		self.assertEqual(len(plies), 2)
+		self.assertEqual(plies[0].animations[0].run_time, 2)
 
 if __name__ == '__main__':
 	unittest.main()
\ No newline at end of file
@@ -0,0 +1,119 @@
+import unittest
+import sys
+import os
+import math
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.game import *
+from manim_chess.board import Board
+from manim_chess.game_player import convert_from_PGN, play_game
+
+GAME = '1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 4. Ba4 Nf6 5. O-O Be7 6. Re1 b5 7. Bb3 d6 8. c3 O-O 9. h3 Nb8 10. d4 Nbd7'
+
+class RecordingScene:
+	def __init__(self):
+		self.waits = 0
+
+	def play(self, *animations, **kwargs):
+		pass
+
+	def wait(self, *args, **kwargs):
+		self.waits += 1
+
+class RecordingEvaluationBar:
+	def __init__(self):
+		self.evaluations = []
+
+	def set_evaluations(self, evaluations):
+		self.evaluations.extend(evaluations)
+		return [None] * len(evaluations)
+
+class TestGame(unittest.TestCase):
+	def test_snapshots(self):
+		game = Game(convert_from_PGN(GAME), snapshot_interval=4)
+		self.assertEqual(20, len(game))
+		self.assertEqual(6, len(game.snapshots))
+		self.assertEqual(DEFAULT_FEN, game.snapshots[0])
+
+	def test_position_at_matches_replaying(self):
+		moves = convert_from_PGN(GAME)
+		game = Game(moves, snapshot_interval=3)
+		position = Position()
+		self.assertEqual(position.to_FEN(), game.FEN_at(0))
+		for ply, move in enumerate(moves, start=1):
+			position.apply_move(move)
+			self.assertEqual(position.to_FEN(), game.FEN_at(ply))
+		self.assertEqual(position.to_FEN(), game.FEN_at(-1))
+		self.assertRaises(IndexError, game.position_at, 21)
+
+	def test_set_board(self):
+		game = Game(convert_from_PGN(GAME))
+		board = Board()
+		board.set_board_from_FEN()
+		game.set_board(board, 9)
+		self.assertEqual('r1bqkb1r/1ppp1ppp/p1n2n2/4p3/B3P3/5N2/PPPP1PPP/RNBQ1RK1', board.get_FEN_placement())
+		self.assertEqual(['e1', 'g1'], board.highlighted_squares)
+		game.set_board(board, 0)
+		self.assertEqual([], board.highlighted_squares)
+
+	def test_play_game_window(self):
+		moves = convert_from_PGN(GAME)
+		expected_board = Board()
+		expected_board.set_board_from_FEN()
+		play_game(RecordingScene(), expected_board, moves[:12])
+
+		for game_or_moves in (moves, Game(moves)):
+			board = Board()
+			board.set_board_from_FEN()
+			scene = RecordingScene()
+			play_game(scene, board, game_or_moves, start_ply=7, end_ply=12)
+			self.assertEqual(5, scene.waits)
+			self.assertEqual(expected_board.get_FEN_placement(), board.get_FEN_placement())
+			self.assertEqual(expected_board.highlighted_squares, board.highlighted_squares)
+
+	def test_play_game_window_from_a_position(self):
+		FEN = '4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1'
+		board = Board()
+		board.set_board_from_FEN(FEN)
+		play_game(RecordingScene(), board, [('e5', 'd6', ''), ('e8', 'e7', '')], start_ply=1, FEN=FEN)
+		self.assertEqual('8/4k3/3P4/8/8/8/8/4K3', board.get_FEN_placement())
+
+	def test_moves_are_stored_as_16_bit_ints(self):
+		moves = convert_from_PGN(GAME)
+		game = Game(moves)
+		self.assertEqual('H', game.encoded_moves.typecode)
+		self.assertEqual(moves, game.moves)
+		self.assertEqual(moves[3], game[3])
+		self.assertEqual(moves[5:9], game[5:9])
+		self.assertEqual(moves, list(game))
+		self.assertEqual(moves, Game.from_encoded(game.encoded_moves.tobytes()).moves)
+		self.assertFalse(hasattr(game, '__dict__'))
+
+	def test_columns(self):
+		moves = convert_from_PGN(GAME)
+		game = Game(moves, evals=[0.25] * 19 + [None], clocks=range(20))
+		self.assertEqual(0.25, game.evals[0])
+		self.assertTrue(math.isnan(game.evals[19]))
+		self.assertEqual(19.0, game.clocks[19])
+		self.assertEqual(0, len(game.flags))
+		self.assertRaises(ValueError, Game, moves, evals=[0.0])
+
+	def test_compute_flags(self):
+		game = Game(convert_from_PGN('1. e4 d5 2. exd5 Qxd5 3. Nc3 Qe5+ 4. Be2 Bg4 5. Nf3 Bxf3 6. O-O'))
+		flags = game.compute_flags()
+		self.assertEqual([0, 0, FLAG_CAPTURE, FLAG_CAPTURE, 0, FLAG_CHECK, 0, 0, 0, FLAG_CAPTURE, FLAG_CASTLING], list(flags))
+		game.flags[0] |= 16
+		game.compute_flags()
+		self.assertEqual(16, game.flags[0])
+
+	def test_play_game_uses_game_evaluations(self):
+		moves = convert_from_PGN(GAME)
+		game = Game(moves, evals=[ply / 10 for ply in range(20)])
+		eval_bar = RecordingEvaluationBar()
+		board = Board()
+		board.set_board_from_FEN()
+		play_game(RecordingScene(), board, game, eval_bar, start_ply=15)
+		self.assertEqual([1.5, 1.6, 1.7, 1.8, 1.9], [round(evaluation, 3) for evaluation in eval_bar.evaluations])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+import sys
+import os
+import subprocess
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def run_python(code):
+	return subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+
+class TestLazyImports(unittest.TestCase):
+
+	def test_converting_does_not_import_manim(self):
+		output = run_python("import sys, manim_chess; print(len(manim_chess.convert_from_PGN('1. e4 e5 2. Nf3 Nc6'))); print('manim' in sys.modules)")
+		self.assertEqual(['4', 'False'], output)
+
+	def test_rendering_classes_are_imported_on_use(self):
+		output = run_python("import sys, manim_chess; print('manim' in sys.modules); print(manim_chess.Board.__module__); print('manim' in sys.modules)")
+		self.assertEqual(['False', 'manim_chess.board', 'True'], output)
+
+	def test_batch_modules_are_imported_on_use(self):
+		output = run_python("import sys, manim_chess; print(any(name in sys.modules for name in ('asyncio', 'concurrent.futures', 'gzip', 'bz2', 'lzma', 'manim_chess.game'))); print(manim_chess.GameCache.__module__, manim_chess.UCIEngine.__module__)")
+		self.assertEqual(['False', 'manim_chess.game_cache', 'manim_chess.engine'], output)
+
+	def test_unknown_names_raise_attribute_error(self):
+		import manim_chess
+		with self.assertRaises(AttributeError):
+			manim_chess.Bord
+		self.assertIn('Board', dir(manim_chess))
+
+if __name__ == '__main__':
+	unittest.main()
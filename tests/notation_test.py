@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+import io
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.notation import *
+from manim_chess.pgn import convert_many
+
+KASPAROV_TOPALOV = """1. e4 d6 2. d4 Nf6 3. Nc3 g6 4. Be3 Bg7 5. Qd2 c6 6. f3 b5 7. Nge2 Nbd7 8. Bh6
+Bxh6 9. Qxh6 Bb7 10. a3 e5 11. O-O-O Qe7 12. Kb1 a6 13. Nc1 O-O-O 14. Nb3
+exd4 15. Rxd4 c5 16. Rd1 Nb6 17. g3 Kb8 18. Na5 Ba8 19. Bh3 d5 20. Qf4+
+Ka7 21. Rhe1 d4 22. Nd5 Nbxd5 23. exd5 Qd6 24. Rxd4 cxd4 25. Re7+ Kb6 26.
+Qxd4+ Kxa5 27. b4+ Ka4 28. Qc3 Qxd5 29. Ra7 Bb7 30. Rxb7 Qc4 31. Qxf6 Kxa3
+32. Qxa6+ Kxb4 33. c3+ Kxc3 34. Qa1+ Kd2 35. Qb2+ Kd1 36. Bf1 Rd2 37.
+Rd7 Rxd7 38. Bxc4 bxc4 39. Qxh8 Rd3 40. Qa8 c3 41. Qa4+ Ke1 42. f4 f5 43. Kc1
+Rd2 44. Qa7 1-0"""
+
+class TestStrictMode(unittest.TestCase):
+	def assertIllegal(self, PGN, FEN, ply, reason):
+		with self.assertRaises(IllegalMoveError) as context:
+			convert_from_PGN(PGN, FEN, cache=None, strict=True)
+		self.assertEqual(ply, context.exception.ply)
+		self.assertIn(reason, context.exception.reason)
+
+	def test_legal_game(self):
+		self.assertEqual(87, len(convert_from_PGN(KASPAROV_TOPALOV, cache=None, strict=True)))
+
+	def test_pinned_piece(self):
+		self.assertIllegal('1. Nc3', '4k3/8/8/8/8/8/8/r2NK3 w - - 0 1', 0, 'pinned')
+
+	def test_ambiguous_move(self):
+		FEN = '4k3/8/8/8/8/5N2/8/1N2K3 w - - 0 1'
+		self.assertIllegal('1. Nd2', FEN, 0, 'ambiguous')
+		self.assertEqual([('b1', 'd2', '')], convert_from_PGN('1. Nbd2', FEN, cache=None, strict=True))
+
+	def test_pin_resolves_ambiguity(self):
+		# The knight on e2 is pinned, so Nc3 is not ambiguous
+		self.assertEqual([('b1', 'c3', '')], convert_from_PGN('1. Nc3', '4r1k1/8/8/8/8/8/4N3/1N2K3 w - - 0 1', cache=None, strict=True))
+
+	def test_wrong_disambiguation(self):
+		self.assertIllegal('1. Nfd2', '4k3/8/8/8/8/8/8/1N2K3 w - - 0 1', 0, 'does not match')
+
+	def test_king_moves_into_check(self):
+		self.assertIllegal('1. Kd2', '3rk3/8/8/8/8/8/8/4K3 w - - 0 1', 0, 'in check')
+		# The king can not step back along the line of the checking rook
+		self.assertIllegal('1. Ke2', '4k3/8/8/8/4r3/8/8/4K3 w - - 0 1', 0, 'check')
+
+	def test_check_must_be_answered(self):
+		self.assertIllegal('1. a3', '4k3/8/8/8/4r3/8/P7/4K3 w - - 0 1', 0, 'does not get out of check')
+		self.assertEqual([('g2', 'e4', '')], convert_from_PGN('1. Bxe4', '4k3/8/8/8/4r3/8/6B1/4K3 w - - 0 1', cache=None, strict=True))
+		self.assertEqual([('d1', 'e2', '')], convert_from_PGN('1. Qe2', '4k3/8/8/8/4r3/8/8/3QK3 w - - 0 1', cache=None, strict=True))
+
+	def test_capture_mark_must_match(self):
+		self.assertIllegal('1. e4 d5 2. exf5', DEFAULT_FEN, 2, 'not a capture')
+		self.assertIllegal('1. e4 d5 2. Nc3 e6 3. Nd5', DEFAULT_FEN, 4, 'is a capture')
+
+	def test_pawn_moves(self):
+		self.assertIllegal('1. e4 e5 2. e5', DEFAULT_FEN, 2, 'is a capture')
+		self.assertIllegal('1. a8', '4k3/P7/8/8/8/8/8/4K3 w - - 0 1', 0, 'must promote')
+		self.assertEqual([('a7', 'a8', 'Q')], convert_from_PGN('1. a8=Q+', '4k3/P7/8/8/8/8/8/4K3 w - - 0 1', cache=None, strict=True))
+
+	def test_castling(self):
+		self.assertIllegal('1. O-O', '4k3/8/8/8/8/8/8/4K2R w Q - 0 1', 0, 'no right')
+		self.assertIllegal('1. O-O', '4kr2/8/8/8/8/8/8/4K2R w K - 0 1', 0, 'attacked square f1')
+		self.assertIllegal('1. O-O-O', '4k3/8/8/8/8/8/8/RN2K3 w Q - 0 1', 0, 'between the king and the rook')
+		self.assertEqual([('e1', 'g1', '')], convert_from_PGN('1. O-O', '4k3/8/8/8/8/8/8/4K2R w K - 0 1', cache=None, strict=True))
+
+	def test_castling_with_check(self):
+		moves = [('e1', 'g1', ''), ('f8', 'e8', '')]
+		self.assertEqual(moves, convert_from_PGN('1. O-O+ Ke8', '5k2/8/8/8/8/8/8/4K2R w K - 0 1', cache=None, strict=True))
+		self.assertEqual(moves, convert_from_PGN('1. O-O+ Ke8', '5k2/8/8/8/8/8/8/4K2R w K - 0 1', cache=None))
+		self.assertEqual([('e8', 'g8', '')], convert_from_PGN('1... O-O#', '4k2r/8/8/8/8/8/8/5K2 b k - 0 1', cache=None, strict=True))
+
+	def test_en_passant_uncovering_the_king(self):
+		self.assertIllegal('1. exd6', '8/8/8/K2pP2r/8/8/8/4k3 w - d6 0 1', 0, 'en passant')
+		self.assertEqual([('e5', 'd6', '')], convert_from_PGN('1. exd6', '8/8/8/K2pP3/8/8/8/4k3 w - d6 0 1', cache=None, strict=True))
+
+	def test_en_passant_captures_the_checking_pawn(self):
+		self.assertEqual([('e5', 'd6', '')], convert_from_PGN('1. exd6', '8/8/8/3pP3/4K3/8/8/4k3 w - d6 0 1', cache=None, strict=True))
+
+	def test_masks(self):
+		checkers, check_mask, pinned = check_and_pin_masks(Position('4k3/8/8/8/4r3/8/4N3/4K3 w - - 0 1'))
+		self.assertEqual(0, checkers)
+		self.assertEqual(ALL_SQUARES, check_mask)
+		self.assertEqual(1 << SQUARE_INDICES['e2'], pinned)
+		checkers, check_mask, _ = check_and_pin_masks(Position('4k3/8/8/8/4r3/8/8/4K3 w - - 0 1'))
+		self.assertEqual(1 << SQUARE_INDICES['e4'], checkers)
+		self.assertEqual(sum(1 << SQUARE_INDICES[square] for square in ('e4', 'e3', 'e2')), check_mask)
+
+	def test_non_strict_mode_is_unchanged(self):
+		with io.StringIO() as output:
+			sys.stdout, stdout = output, sys.stdout
+			try:
+				self.assertEqual([('d1', 'c3', '')], convert_from_PGN('1. Nc3', '4k3/8/8/8/8/8/8/r2NK3 w - - 0 1', cache=None))
+			finally:
+				sys.stdout = stdout
+
+	def test_bulk_rejection(self):
+		results = convert_many(['1. e4 e5 2. Ke2', '1. e4 e5 2. d4 Bb4+ 3. Nf3', KASPAROV_TOPALOV], workers=1, strict=True)
+		self.assertEqual([None, 4, None], [result.error_ply for result in results])
+		self.assertIn('does not get out of check', results[1].error)
+		self.assertEqual(4, len(results[1].moves()))
+		self.assertIsNone(convert_many(['1. e4 e5 2. d4 Bb4+ 3. Nf3'], workers=1)[0].error)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.pgn_index import *
+from manim_chess.pgn import read_games
+
+PGN_DATABASE = """[Event "First"]
+[White "Kasparov, Garry"]
+[Black "Topalov, Veselin"]
+[WhiteElo "2812"]
+[BlackElo "2700"]
+[ECO "B07"]
+[Date "1999.01.20"]
+[Result "1-0"]
+
+1. e4 d6 2. d4 Nf6 3. Nc3 g6 {A comment with
+[brackets] on a new line} 1-0
+
+[Event "Second"]
+[White "Topalov, Veselin"]
+[Black "Kasparov, Garry"]
+[WhiteElo "2700"]
+[BlackElo "2812"]
+[ECO "B08"]
+[Date "2000.??.??"]
+[Result "1/2-1/2"]
+
+1. e4 d6 2. d4 Nf6 1/2-1/2
+
+[Event "Third"]
+[White "Amateur"]
+[Black "Kasparov, Garry"]
+[WhiteElo "1500"]
+[ECO "C20"]
+[Result "0-1"]
+
+1. e4 e5 0-1
+
+[Event "From position"]
+[SetUp "1"]
+[FEN "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"]
+
+1. e4 Kd7 *
+"""
+
+class TestPGNIndex(unittest.TestCase):
+	def setUp(self):
+		directory = tempfile.TemporaryDirectory()
+		self.addCleanup(directory.cleanup)
+		self.path = os.path.join(directory.name, 'games.pgn')
+		with open(self.path, 'w', newline='\n') as file:
+			file.write(PGN_DATABASE)
+
+	def test_offsets_match_read_games(self):
+		index = PGNIndex.build(self.path)
+		self.assertEqual(4, len(index))
+		for game, expected_game in enumerate(read_games(self.path)):
+			self.assertEqual(expected_game, index.read_game(game))
+		self.assertEqual(len(PGN_DATABASE), index.offsets[3] + index.lengths[3])
+
+	def test_tags(self):
+		index = PGNIndex.build(self.path)
+		self.assertEqual('Kasparov, Garry', index.names[index.white[0]])
+		self.assertEqual([2812, 2700, 1500, 0], list(index.white_elo))
+		self.assertEqual(['B07', 'B08', 'C20', '?'], [decode_eco(code) for code in index.eco])
+		self.assertEqual([19990120, 20000000, 0, 0], list(index.date))
+		self.assertEqual(['1-0', '1/2-1/2', '0-1', '*'], [RESULTS[result] for result in index.result])
+
+	def test_select(self):
+		index = PGNIndex.build(self.path)
+		self.assertEqual([0], index.select(eco='B07', min_elo=2600))
+		self.assertEqual([0, 1], index.select(eco='B0'))
+		self.assertEqual([2], index.select(eco='C'))
+		for eco in ('Z', 'A1x', '', 'B070'):
+			with self.assertRaises(ValueError):
+				index.select(eco=eco)
+		self.assertEqual([0, 1, 2], index.select(player='Kasparov, Garry'))
+		self.assertEqual([1, 2], index.select(black='Kasparov, Garry'))
+		self.assertEqual([], index.select(white='Nobody'))
+		self.assertEqual([2], index.select(result='0-1'))
+		self.assertEqual([1], index.select(date_from='2000', date_to='2000'))
+		self.assertEqual([0], index.select(date_to='1999.12'))
+
+	def test_saved_next_to_the_file(self):
+		index = PGNIndex.open(self.path)
+		self.assertTrue(os.path.isfile(index_path(self.path)))
+		loaded_index = PGNIndex.open(self.path)
+		for name, _ in COLUMNS:
+			self.assertEqual(getattr(index, name), getattr(loaded_index, name))
+		self.assertEqual(index.names, loaded_index.names)
+		self.assertEqual([0], loaded_index.select(white='Kasparov, Garry'))
+
+	def test_changed_file_is_indexed_again(self):
+		PGNIndex.open(self.path)
+		with open(self.path, 'a', newline='\n') as file:
+			file.write('\n[Event "Fifth"]\n\n1. d4 *\n')
+		self.assertEqual(5, len(PGNIndex.open(self.path)))
+
+	def test_empty_file(self):
+		open(self.path, 'w').close()
+		self.assertEqual(0, len(PGNIndex.open(self.path)))
+
+if __name__ == '__main__':
+	unittest.main()
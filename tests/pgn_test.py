@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.pgn import *
+
+PGN_DATABASE = """[Event "First"]
+[White "A"]
+[Black "B"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 {A comment with [brackets] and Nc3} Nc6 1-0
+
+[Event "Second"]
+[White "C"]
+[Black "D"]
+[Result "*"]
+
+1. d4 (1. c4 e5) 1... d5 2. h4 $1 *
+
+[Event "From position"]
+[SetUp "1"]
+[FEN "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"]
+
+1. e4 Kd7 *
+"""
+
+class TestPGN(unittest.TestCase):
+	def test_read_games(self):
+		games = list(read_games(io.StringIO(PGN_DATABASE)))
+		self.assertEqual(3, len(games))
+		self.assertEqual({'Event': 'First', 'White': 'A', 'Black': 'B', 'Result': '1-0'}, games[0].headers)
+		self.assertEqual([('e2', 'e4', ''), ('e7', 'e5', ''), ('g1', 'f3', ''), ('b8', 'c6', '')], games[0].moves)
+		self.assertEqual([('d2', 'd4', ''), ('d7', 'd5', ''), ('h2', 'h4', '')], games[1].moves)
+		self.assertEqual([('e2', 'e4', ''), ('e8', 'd7', '')], games[2].moves)
+
+	def test_read_games_without_converting(self):
+		games = list(read_games(io.StringIO(PGN_DATABASE), convert=False))
+		self.assertEqual([], games[1].moves)
+		self.assertIn('1. d4', games[1].movetext)
+
+	def test_read_compressed_files(self):
+		with tempfile.TemporaryDirectory() as directory:
+			for extension, module in (('gz', gzip), ('bz2', bz2), ('xz', lzma)):
+				path = os.path.join(directory, f'games.pgn.{extension}')
+				with module.open(path, 'wt') as file:
+					file.write(PGN_DATABASE)
+				events = [game.headers['Event'] for game in read_games(path)]
+				self.assertEqual(['First', 'Second', 'From position'], events)
+
+	def test_read_binary_file_object(self):
+		file = io.BytesIO(gzip.compress(PGN_DATABASE.encode()))
+		self.assertEqual(3, len(list(read_games(file))))
+		self.assertFalse(file.closed)
+
+	def test_convert_many(self):
+		bad_game = '[Event "Bad"]\n\n1. e4 e5 2. Nf6 Nc6 *'
+		results = convert_many([PGN_DATABASE, bad_game, '1. d4 d5 *'], workers=2, chunksize=2)
+		self.assertEqual(5, len(results))
+		self.assertEqual([('e2', 'e4', ''), ('e7', 'e5', ''), ('g1', 'f3', ''), ('b8', 'c6', '')], results[0].moves())
+		self.assertEqual([('e2', 'e4', ''), ('e8', 'd7', '')], results[2].moves())
+		self.assertEqual(2, results[3].error_ply)
+		self.assertEqual([('e2', 'e4', ''), ('e7', 'e5', '')], results[3].moves())
+		self.assertIsNone(results[4].error)
+		self.assertEqual([('d2', 'd4', ''), ('d7', 'd5', '')], results[4].moves())
+
+	def test_convert_many_in_process(self):
+		results = convert_many([PGN_DATABASE], workers=1)
+		self.assertEqual([game.moves for game in read_games(io.StringIO(PGN_DATABASE))], [result.moves() for result in results])
+
+	def test_encoded_promotion(self):
+		result = convert_many(['[FEN "8/P7/8/8/8/8/8/k6K w - - 0 1"]\n\n1. a8=N *'], workers=1)[0]
+		self.assertEqual([('a7', 'a8', 'N')], result.moves())
+
+	def test_move_from_an_empty_square(self):
+		result = convert_many(['1. e4 e5 2. d5 *'], workers=1)[0]
+		self.assertEqual(2, result.error_ply)
+		self.assertNotIn('KeyError', result.error)
+		self.assertEqual([('e2', 'e4', ''), ('e7', 'e5', '')], result.moves())
+
+	def test_bad_game_does_not_stop_the_reader(self):
+		bad_games = [
+			'[Event "Empty square"]\n\n1. e4 e5 2. d5 *\n',
+			'[Event "Broken FEN"]\n[FEN "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w KQkq - 0 1"]\n\n1. e4 *\n',
+		]
+		for bad_game in bad_games:
+			database = f'[Event "Before"]\n\n1. d4 *\n\n{bad_game}\n[Event "After"]\n\n1. c4 *\n'
+			with contextlib.redirect_stdout(io.StringIO()):
+				games = list(read_games(io.StringIO(database)))
+			self.assertEqual(3, len(games))
+			self.assertEqual([[('d2', 'd4', '')], [('c2', 'c4', '')]], [games[0].moves, games[2].moves])
+		with contextlib.redirect_stdout(io.StringIO()):
+			self.assertEqual([('e2', 'e4', ''), ('e7', 'e5', '')], list(read_games(io.StringIO(bad_games[0])))[0].moves)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.pieces import *
+from manim_chess import pieces
+
+class TestPieces(unittest.TestCase):
+	def test_template_is_shared(self):
+		first_template = get_piece_template('N', True)
+		second_template = get_piece_template('N', True)
+		self.assertIs(first_template, second_template)
+
+	def test_template_keyed_by_color(self):
+		white_template = get_piece_template('Q', True)
+		black_template = get_piece_template('Q', False)
+		self.assertIsNot(white_template, black_template)
+
+	def test_pieces_do_not_reparse(self):
+		Rook(is_white=False)
+		number_of_templates = len(pieces._PIECE_TEMPLATES)
+		Rook(is_white=False)
+		Rook(is_white=False)
+		self.assertEqual(number_of_templates, len(pieces._PIECE_TEMPLATES))
+
+	def test_piece_does_not_share_template_geometry(self):
+		piece = King(is_white=True)
+		self.assertIsNot(piece.submobjects[0], get_piece_template('K', True))
+		self.assertTrue(piece.is_white)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.position import *
+
+class TestPosition(unittest.TestCase):
+	def test_round_trip_FEN(self):
+		FEN = 'rnbqkbnr/ppp1pppp/8/8/2PpP3/5P2/PP1P2PP/RNBQKBNR b KQkq c3 0 3'
+		self.assertEqual(FEN, Position(FEN).to_FEN())
+
+	def test_missing_fields(self):
+		self.assertEqual('8/8/8/8/8/8/8/8 w - - 0 1', Position('8/8/8/8/8/8/8/8').to_FEN())
+
+	def test_piece_at(self):
+		position = Position()
+		self.assertEqual('K', position.piece_at('e1'))
+		self.assertEqual('', position.piece_at('e4'))
+
+	def test_pawn_double_push(self):
+		position = Position()
+		position.apply_move(('e2', 'e4', ''))
+		self.assertEqual('rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1', position.to_FEN())
+
+	def test_castling(self):
+		position = Position('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 3 10')
+		position.apply_move(('e1', 'g1', ''))
+		position.apply_move(('e8', 'c8', ''))
+		self.assertEqual('2kr3r/8/8/8/8/8/8/R4RK1 w - - 5 11', position.to_FEN())
+
+	def test_rook_capture_removes_castling_right(self):
+		position = Position('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1')
+		position.apply_move(('a1', 'a8', ''))
+		self.assertEqual('R3k2r/8/8/8/8/8/8/4K2R b Kk - 0 1', position.to_FEN())
+
+	def test_en_passant(self):
+		position = Position('rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3')
+		position.apply_move(('e5', 'f6', ''))
+		self.assertEqual('rnbqkbnr/ppp1p1pp/5P2/3p4/8/8/PPPP1PPP/RNBQKBNR b KQkq - 0 3', position.to_FEN())
+
+	def test_promotion(self):
+		position = Position('8/3P4/8/8/8/8/4p3/K6k w - - 0 1')
+		position.apply_move(('d7', 'd8', 'Q'))
+		position.apply_move(('e2', 'e1', 'N'))
+		self.assertEqual('3Q4/8/8/8/8/8/8/K3n2k w - - 0 2', position.to_FEN())
+
+	def test_copy_is_independent(self):
+		position = Position()
+		copied_position = position.copy()
+		copied_position.apply_move(('g1', 'f3', ''))
+		self.assertEqual(DEFAULT_FEN, position.to_FEN())
+
+	def test_in_check(self):
+		self.assertFalse(Position().in_check())
+		self.assertTrue(Position('4k3/8/8/8/8/8/8/4K2r w - - 0 1').in_check())
+		self.assertFalse(Position('4k3/8/8/8/8/8/8/4KB1r w - - 0 1').in_check())
+		self.assertTrue(Position('4k3/8/8/8/8/8/3p4/4K3 w - - 0 1').in_check())
+		self.assertFalse(Position('4k3/8/8/8/8/8/4p3/4K3 w - - 0 1').in_check())
+		self.assertTrue(Position('4k3/8/5N2/8/8/8/8/4K3 b - - 0 1').in_check())
+
+	def test_impossible_moves_raise(self):
+		position = Position('4k3/8/8/8/8/8/8/4K2R w K - 0 1')
+		FEN = position.to_FEN()
+		zobrist_hash = position.zobrist_hash
+		for move in (('e4', 'e5', ''), ('e1', 'c1', '')):
+			with self.assertRaises(ValueError):
+				position.apply_move(move)
+		self.assertEqual(FEN, position.to_FEN())
+		self.assertEqual(zobrist_hash, position.zobrist_hash)
+
+if __name__ == '__main__':
+	unittest.main()
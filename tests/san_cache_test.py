@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.san_cache import *
+from manim_chess.game_player import convert_from_PGN, convert_from_algebraic_notation
+from manim_chess.position import Position
+
+class TestSANCache(unittest.TestCase):
+	def test_eviction(self):
+		cache = SANCache(max_size=2)
+		cache.put(1, 'e4', ('e2', 'e4', ''))
+		cache.put(2, 'e5', ('e7', 'e5', ''))
+		cache.get(1, 'e4')
+		cache.put(3, 'Nf3', ('g1', 'f3', ''))
+		self.assertEqual(2, len(cache))
+		self.assertIsNone(cache.get(2, 'e5'))
+		self.assertEqual(('e2', 'e4', ''), cache.get(1, 'e4'))
+
+	def test_counters(self):
+		cache = SANCache()
+		convert_from_PGN('1. e4 e5 2. Nf3 Nc6 *', cache=cache)
+		self.assertEqual((0, 4), (cache.hits, cache.misses))
+		convert_from_PGN('1. e4 e5 2. Nf3 Nf6 *', cache=cache)
+		self.assertEqual((3, 5), (cache.hits, cache.misses))
+
+	def test_transposition_hits(self):
+		cache = SANCache()
+		convert_from_PGN('1. e4 e5 2. Nf3 Nc6 3. Bb5 *', cache=cache)
+		hits = cache.hits
+		convert_from_PGN('1. Nf3 Nc6 2. e4 e5 3. Bb5 *', cache=cache)
+		self.assertEqual(hits + 1, cache.hits)
+
+	def test_zobrist_hash_is_incremental(self):
+		position = Position()
+		for move in [('g1', 'f3', ''), ('g8', 'f6', ''), ('f3', 'g1', ''), ('f6', 'g8', '')]:
+			position.apply_move(move)
+		self.assertEqual(Position(position.to_FEN()).zobrist_hash, position.zobrist_hash)
+		self.assertEqual(Position().zobrist_hash, position.zobrist_hash)
+
+	def test_disabled_cache(self):
+		cache = SANCache(max_size=0)
+		self.assertEqual(('e2', 'e4', ''), convert_from_algebraic_notation('e4', Position(), cache))
+		self.assertEqual(0, len(cache))
+
+if __name__ == '__main__':
+	unittest.main()
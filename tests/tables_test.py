@@ -0,0 +1,35 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from manim_chess.tables import *
+
+class TestTables(unittest.TestCase):
+	def test_square_names(self):
+		self.assertEqual('a8', SQUARE_NAMES[0])
+		self.assertEqual('e4', SQUARE_NAMES[36])
+		self.assertEqual('h1', SQUARE_NAMES[63])
+		self.assertEqual(36, SQUARE_INDICES['e4'])
+
+	def test_files_and_ranks(self):
+		self.assertEqual(4, SQUARE_FILES[SQUARE_INDICES['e4']])
+		self.assertEqual(4, SQUARE_RANKS[SQUARE_INDICES['e4']])
+
+	def test_light_squares(self):
+		self.assertFalse(IS_LIGHT_SQUARE['a1'])
+		self.assertTrue(IS_LIGHT_SQUARE['h1'])
+		self.assertTrue(IS_LIGHT_SQUARE['d5'])
+		self.assertFalse(IS_LIGHT_SQUARE['e5'])
+		self.assertEqual(32, sum(IS_LIGHT_SQUARE.values()))
+
+	def test_ray_squares_are_ordered(self):
+		self.assertEqual([SQUARE_INDICES['d2'], SQUARE_INDICES['d3']], RAY_SQUARES[(0, 1)][SQUARE_INDICES['d1']][:2])
+
+	def test_line(self):
+		line = LINE[SQUARE_INDICES['a1']][SQUARE_INDICES['c3']]
+		self.assertEqual(8, bin(line).count('1'))
+		self.assertTrue(line & (1 << SQUARE_INDICES['h8']))
+
+if __name__ == '__main__':
+	unittest.main()